@@ -0,0 +1,170 @@
+''' Benchmarks for datastructures.array.Array.
+
+    Run from the repository root:
+        python -m benchmarks.bench_array
+'''
+import time
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import Array, ResizePolicy
+from datastructures.arraystack import ArrayStack
+
+
+def _ops_per_second(operation: Callable[[], None], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return repeat / (time.perf_counter() - start)
+
+
+class _ShiftingFrontBuffer:
+    ''' The append_front algorithm Array used before the head offset layout:
+        every insert shifts the whole buffer one slot to the right in Python. '''
+
+    def __init__(self, items: NDArray) -> None:
+        self._items = items
+        self._item_count = len(items)
+
+    def append_front(self, data: int) -> None:
+        if self._item_count == len(self._items):
+            new_items = np.empty(len(self._items) * 2, dtype=self._items.dtype)
+            new_items[:self._item_count] = self._items[:self._item_count]
+            self._items = new_items
+        for i in range(self._item_count, 0, -1):
+            self._items[i] = self._items[i - 1]
+        self._items[0] = data
+        self._item_count += 1
+
+
+def bench_append_front(sizes: tuple[int, ...] = (10**5, 10**6)) -> None:
+    ''' Front-insert throughput into an Array that already holds n items. The shifting
+        algorithm is O(n) per insert, so it is sampled with fewer inserts. '''
+    print('append_front throughput (inserts/sec)')
+    print(f'{"n":>10} {"shifting":>14} {"head offset":>14}')
+    for n in sizes:
+        legacy = _ShiftingFrontBuffer(np.arange(n))
+        legacy_rate = _ops_per_second(lambda: legacy.append_front(-1), repeat=max(1, 10**6 // n))
+
+        array = Array.from_buffer(np.arange(n))
+        current_rate = _ops_per_second(lambda: array.append_front(-1), repeat=n)
+        print(f'{n:>10} {legacy_rate:>14,.0f} {current_rate:>14,.0f}')
+
+
+def _shifting_delete(array: Array, index: int) -> None:
+    ''' The __delitem__ algorithm Array used before block moves: shift the tail left one item at a time. '''
+    items = array._items
+    for i in range(array._head + index, array._head + len(array) - 1):
+        items[i] = items[i + 1]
+    array._item_count -= 1
+
+
+def bench_delete(sizes: tuple[int, ...] = (10**4, 10**5, 10**6)) -> None:
+    ''' Deletions/sec from the middle of an Array of n items, with the old per-item shifting
+        loop and with the block move; plus a whole-range delete_range versus deleting one by one. '''
+    print('del array[n // 2] throughput (deletes/sec)')
+    print(f'{"n":>10} {"shifting":>14} {"block move":>14}')
+    for n in sizes:
+        legacy = Array.from_buffer(np.arange(2 * n))
+        legacy_rate = _ops_per_second(lambda: _shifting_delete(legacy, len(legacy) // 2), repeat=max(1, 10**6 // n))
+        array = Array(list(range(2 * n)), int, policy=ResizePolicy(shrink_threshold=0))
+        current_rate = _ops_per_second(lambda: array.__delitem__(len(array) // 2), repeat=min(n, 10_000))
+        print(f'{n:>10} {legacy_rate:>14,.0f} {current_rate:>14,.0f}')
+
+    n, removed = 10**6, 1_000
+    print(f'removing {removed:,} items from the middle of {n:,}')
+    one_by_one = Array.from_buffer(np.arange(n))
+    start = time.perf_counter()
+    for _ in range(removed):
+        del one_by_one[n // 2]
+    print(f'{"del one by one":>16} {time.perf_counter() - start:>10.4f}s')
+    ranged = Array.from_buffer(np.arange(n))
+    start = time.perf_counter()
+    ranged.delete_range(n // 2, n // 2 + removed)
+    print(f'{"delete_range":>16} {time.perf_counter() - start:>10.4f}s')
+
+
+def _copying_slice(array: Array, index: slice) -> Array:
+    ''' How Array.__getitem__ sliced before ArrayView: tolist() plus a type-checked Array. '''
+    return Array(array._live()[index].tolist(), array._data_type)
+
+
+def bench_slicing(sizes: tuple[int, ...] = (10**3, 10**5)) -> None:
+    ''' Slices/sec of half of an n-item Array, copied the old way and as an ArrayView, and
+        ArrayStack comparisons/sec (which slice both stacks on every call). '''
+    print('array[n // 4 : 3 * n // 4] throughput (slices/sec)')
+    print(f'{"n":>10} {"copying":>14} {"view":>14}')
+    for n in sizes:
+        array = Array.from_buffer(np.arange(n))
+        index = slice(n // 4, 3 * n // 4)
+        repeat = max(10, 10**6 // n)
+        copying = _ops_per_second(lambda: _copying_slice(array, index), repeat)
+        viewing = _ops_per_second(lambda: array[index], repeat)
+        print(f'{n:>10} {copying:>14,.0f} {viewing:>14,.0f}')
+
+    print('sliding window sums over 10,000 ints, window 100 (windows/sec)')
+    array = Array.from_buffer(np.arange(10_000))
+    start = time.perf_counter()
+    for i in range(len(array) - 100):
+        np.asarray(_copying_slice(array, slice(i, i + 100))[:]).sum()
+    copying = (len(array) - 100) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for i in range(len(array) - 100):
+        np.asarray(array[i:i + 100].copy()[:]).sum()
+    viewing_then_copying = (len(array) - 100) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for i in range(len(array) - 100):
+        np.asarray(array[i:i + 100]).sum()
+    viewing = (len(array) - 100) / (time.perf_counter() - start)
+    print(f'{"copying":>14} {copying:>14,.0f}')
+    print(f'{"view + copy()":>14} {viewing_then_copying:>14,.0f}')
+    print(f'{"view":>14} {viewing:>14,.0f}')
+
+    stack_size = 10_000
+    print(f'ArrayStack == and in on {stack_size:,} ints (calls/sec)')
+    first, second = ArrayStack(stack_size, int), ArrayStack(stack_size, int)
+    for i in range(stack_size):
+        first.push(i)
+        second.push(i)
+    print(f'{"==":>14} {_ops_per_second(lambda: first == second, 20):>14,.0f}')
+    print(f'{"in":>14} {_ops_per_second(lambda: -1 in first, 20):>14,.0f}')
+
+
+def _elementwise_contains(array: Array, item: int) -> bool:
+    ''' How Array.__contains__ searched before the NumPy fast path. '''
+    return any(array[i] == item for i in range(len(array)))
+
+
+def _elementwise_equal(array: Array, other: Array) -> bool:
+    ''' How Array.__eq__ compared before the NumPy fast path. '''
+    return len(array) == len(other) and all(array[i] == other[i] for i in range(len(array)))
+
+
+def bench_search(sizes: tuple[int, ...] = (10**3, 10**5, 10**6)) -> None:
+    ''' Calls/sec of a missing-item search and of comparing two equal Arrays, element by element
+        (before) and with one NumPy operation (after), plus count and find_all. '''
+    print('search and comparison over n ints (calls/sec)')
+    print(f'{"n":>10} {"in before":>12} {"in after":>12} {"== before":>12} {"== after":>12} {"count":>12} {"find_all":>12}')
+    for n in sizes:
+        array, other = Array.from_buffer(np.arange(n)), Array.from_buffer(np.arange(n))
+        repeat = max(1, 10**5 // n)
+        print(f'{n:>10}'
+              f' {_ops_per_second(lambda: _elementwise_contains(array, -1), repeat):>12,.0f}'
+              f' {_ops_per_second(lambda: -1 in array, repeat * 100):>12,.0f}'
+              f' {_ops_per_second(lambda: _elementwise_equal(array, other), repeat):>12,.0f}'
+              f' {_ops_per_second(lambda: array == other, repeat * 100):>12,.0f}'
+              f' {_ops_per_second(lambda: array.count(7), repeat * 100):>12,.0f}'
+              f' {_ops_per_second(lambda: array.find_all(7), repeat * 100):>12,.0f}')
+
+
+def main() -> None:
+    bench_append_front()
+    bench_delete()
+    bench_slicing()
+    bench_search()
+
+
+if __name__ == '__main__':
+    main()
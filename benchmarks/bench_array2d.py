@@ -0,0 +1,118 @@
+''' Benchmarks for datastructures.array2d.Array2D.
+
+    Run from the repository root:
+        python -m benchmarks.bench_array2d
+'''
+import time
+from typing import Callable
+
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.array2d import Array2D
+
+
+class _PerAccessRow:
+    ''' The Row Array2D used to allocate on every grid[r] access: each item goes through
+        map_index and the bounds and type checks of Array.__getitem__. '''
+
+    def __init__(self, row_index: int, array: Array, num_columns: int) -> None:
+        self.row_index = row_index
+        self.array = array
+        self.num_columns = num_columns
+
+    def __getitem__(self, column_index: int) -> int:
+        if column_index >= self.num_columns:
+            raise IndexError("Index too big.")
+        return self.array[self.row_index * self.num_columns + column_index]
+
+
+def _cells_per_second(scan: Callable[[int], None], lines: int, size: int) -> float:
+    start = time.perf_counter()
+    scan(lines)
+    return lines * size / (time.perf_counter() - start)
+
+
+def bench_scans(sizes: tuple[int, ...] = (1_000, 5_000), sampled_lines: int = 200) -> None:
+    ''' Cells/sec for row-major and column-major scans of an n x n int grid. Item-by-item scans
+        read the first sampled_lines rows (or columns); the NumPy view scans read the whole grid. '''
+    for n in sizes:
+        grid = Array2D.from_numpy(np.arange(n * n).reshape(n, n))
+        lines = min(n, sampled_lines)
+
+        def legacy_row_major(lines: int) -> None:
+            for r in range(lines):
+                for c in range(n):
+                    _PerAccessRow(r, grid.array2D, n)[c]
+
+        def legacy_column_major(lines: int) -> None:
+            for c in range(lines):
+                for r in range(n):
+                    _PerAccessRow(r, grid.array2D, n)[c]
+
+        def row_proxy_row_major(lines: int) -> None:
+            for r in range(lines):
+                row = grid[r]
+                for c in range(n):
+                    row[c]
+
+        def row_proxy_column_major(lines: int) -> None:
+            for c in range(lines):
+                for r in range(n):
+                    grid[r][c]
+
+        def tuple_row_major(lines: int) -> None:
+            for r in range(lines):
+                for c in range(n):
+                    grid[r, c]
+
+        def tuple_column_major(lines: int) -> None:
+            for c in range(lines):
+                for r in range(n):
+                    grid[r, c]
+
+        def view_row_major(lines: int) -> None:
+            for r in range(lines):
+                grid.row(r).sum()
+
+        def view_column_major(lines: int) -> None:
+            for c in range(lines):
+                grid.column(c).sum()
+
+        print(f'{n} x {n} ints (cells/sec)')
+        print(f'{"access":>28} {"row-major":>14} {"column-major":>14}')
+        for name, row_major, column_major, scanned in (
+                ('per-access Row (before)', legacy_row_major, legacy_column_major, lines),
+                ('cached Row grid[r][c]', row_proxy_row_major, row_proxy_column_major, lines),
+                ('tuple grid[r, c]', tuple_row_major, tuple_column_major, lines),
+                ('row()/column() views', view_row_major, view_column_major, n)):
+            print(f'{name:>28} {_cells_per_second(row_major, scanned, n):>14,.0f} {_cells_per_second(column_major, scanned, n):>14,.0f}')
+
+
+def _seconds(operation: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def bench_construction(sizes: tuple[int, ...] = (1_000, 5_000)) -> None:
+    ''' Seconds to build an n x n grid with each constructor. '''
+    print(f'{"n":>6} {"Array2D(lists)":>15} {"empty(int)":>11} {"empty(obj)":>11} {"zeros":>9} {"full":>9} {"from_numpy":>11}')
+    for n in sizes:
+        nested = [[0] * n for _ in range(n)]
+        items = np.arange(n * n).reshape(n, n)
+        print(f'{n:>6} {_seconds(lambda: Array2D(nested, data_type=int)):>15.4f}'
+              f' {_seconds(lambda: Array2D.empty(n, n, data_type=int)):>11.4f}'
+              f' {_seconds(lambda: Array2D.empty(n, n, data_type=object)):>11.4f}'
+              f' {_seconds(lambda: Array2D.zeros(n, n, data_type=int)):>9.4f}'
+              f' {_seconds(lambda: Array2D.full(n, n, 7)):>9.4f}'
+              f' {_seconds(lambda: Array2D.from_numpy(items)):>11.4f}')
+
+
+def main() -> None:
+    bench_construction()
+    bench_scans()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+''' Multi-producer/multi-consumer benchmarks for datastructures.blockingcircularqueue.BlockingCircularQueue
+    and datastructures.asynccircularqueue.AsyncCircularQueue, against queue.Queue and asyncio.Queue.
+
+    Run from the repository root:
+        python -m benchmarks.bench_blockingqueues
+'''
+import asyncio
+import queue
+import threading
+import time
+
+from datastructures.asynccircularqueue import AsyncCircularQueue
+from datastructures.blockingcircularqueue import BlockingCircularQueue
+
+
+def _threaded_items_per_second(put, get, workers: int, items_per_worker: int) -> float:
+    def produce() -> None:
+        for i in range(items_per_worker):
+            put(i)
+
+    def consume() -> None:
+        for _ in range(items_per_worker):
+            get()
+
+    threads = [threading.Thread(target=produce) for _ in range(workers)]
+    threads += [threading.Thread(target=consume) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return workers * items_per_worker / (time.perf_counter() - start)
+
+
+async def _async_items_per_second(put, get, workers: int, items_per_worker: int) -> float:
+    async def produce() -> None:
+        for i in range(items_per_worker):
+            await put(i)
+
+    async def consume() -> None:
+        for _ in range(items_per_worker):
+            await get()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(produce() for _ in range(workers)), *(consume() for _ in range(workers)))
+    return workers * items_per_worker / (time.perf_counter() - start)
+
+
+def bench_mpmc(items_per_worker: int = 20_000, maxsize: int = 64) -> None:
+    ''' Items/sec through a bounded queue shared by N producers and N consumers. '''
+    print(f'MPMC hand-off, {items_per_worker:,} items per producer, maxsize {maxsize} (items/sec)')
+    print(f'{"workers":>8} {"Blocking":>12} {"queue.Queue":>12} {"Async":>12} {"asyncio.Queue":>14}')
+    for workers in (1, 2, 4, 8):
+        blocking = BlockingCircularQueue(maxsize=maxsize, data_type=int)
+        stdlib = queue.Queue(maxsize=maxsize)
+
+        async def run_async() -> tuple[float, float]:
+            ring = AsyncCircularQueue(maxsize=maxsize, data_type=int)
+            stdlib_async: asyncio.Queue[int] = asyncio.Queue(maxsize=maxsize)
+            return (await _async_items_per_second(ring.put, ring.get, workers, items_per_worker),
+                    await _async_items_per_second(stdlib_async.put, stdlib_async.get, workers, items_per_worker))
+
+        ring_async, stdlib_async = asyncio.run(run_async())
+        print(f'{workers:>8} {_threaded_items_per_second(blocking.put, blocking.get, workers, items_per_worker):>12,.0f}'
+              f' {_threaded_items_per_second(stdlib.put, stdlib.get, workers, items_per_worker):>12,.0f}'
+              f' {ring_async:>12,.0f} {stdlib_async:>14,.0f}')
+
+
+def main() -> None:
+    bench_mpmc()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+''' Benchmarks for datastructures.circularqueue.CircularQueue.
+
+    Run from the repository root:
+        python -m benchmarks.bench_circularqueue
+'''
+import time
+from typing import Callable
+
+from datastructures.circularqueue import CircularQueue
+
+
+def _seconds(operation: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def bench_single_vs_batched(size: int = 200_000, batch_size: int = 1_000) -> None:
+    ''' Items/sec moved through a fixed and a growable queue one item at a time and in batches. '''
+    print(f'CircularQueue with {size:,} ints, batches of {batch_size:,} (items/sec)')
+    print(f'{"queue":>10} {"single":>14} {"batched":>14}')
+    for growable in (False, True):
+        queue = CircularQueue(maxsize=batch_size * 2, data_type=int, growable=growable)
+        batch = list(range(batch_size))
+
+        def single() -> None:
+            for _ in range(size // batch_size):
+                for item in batch:
+                    queue.enqueue(item)
+                for _ in range(batch_size):
+                    queue.dequeue()
+
+        def batched() -> None:
+            for _ in range(size // batch_size):
+                queue.enqueue_many(batch)
+                queue.dequeue_many(batch_size)
+
+        name = 'growable' if growable else 'fixed'
+        print(f'{name:>10} {size / _seconds(single):>14,.0f} {size / _seconds(batched):>14,.0f}')
+
+
+def main() -> None:
+    bench_single_vs_batched()
+
+
+if __name__ == '__main__':
+    main()
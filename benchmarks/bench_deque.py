@@ -0,0 +1,57 @@
+''' Benchmarks for datastructures.deque.Deque and datastructures.arraydeque.ArrayDeque.
+
+    Run from the repository root:
+        python -m benchmarks.bench_deque
+'''
+import time
+from typing import Callable
+
+from datastructures.arraydeque import ArrayDeque
+from datastructures.deque import Deque
+
+
+def _seconds(operation: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def bench_throughput(size: int = 200_000) -> None:
+    ''' Items/sec for filling and draining each deque from both ends, plus membership tests. '''
+    print(f'Deque vs ArrayDeque with {size:,} ints (operations/sec)')
+    print(f'{"operation":>22} {"Deque":>12} {"ArrayDeque":>12}')
+    results: dict[str, list[float]] = {}
+    for deque_type in (Deque, ArrayDeque):
+        deque = deque_type(data_type=int)
+
+        def fifo() -> None:
+            for i in range(size):
+                deque.enqueue(i)
+            for _ in range(size):
+                deque.dequeue()
+
+        def front_in_back_out() -> None:
+            for i in range(size):
+                deque.enqueue_front(i)
+            for _ in range(size):
+                deque.dequeue_back()
+
+        def contains() -> None:
+            for i in range(size // 1_000):
+                (size - i) in deque
+
+        results.setdefault('enqueue + dequeue', []).append(2 * size / _seconds(fifo))
+        results.setdefault('enqueue_front + back', []).append(2 * size / _seconds(front_in_back_out))
+        for i in range(size):
+            deque.enqueue(i)
+        results.setdefault('contains (full scan)', []).append(size // 1_000 / _seconds(contains))
+    for name, (linked, ring) in results.items():
+        print(f'{name:>22} {linked:>12,.0f} {ring:>12,.0f}')
+
+
+def main() -> None:
+    bench_throughput()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+''' Benchmarks for datastructures.hashmap.HashMap.
+
+    Run from the repository root:
+        python -m benchmarks.bench_hashmap
+'''
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from datastructures.hashengine import HashStrategy
+from datastructures.hashmap import HashMap
+from datastructures.openhashmap import OpenHashMap
+from tests.car import Car, Color, Make, Model
+
+
+def _ops_per_second(operation: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return repeat / (time.perf_counter() - start)
+
+
+def _sample_keys(count: int) -> dict[str, list[Any]]:
+    return {
+        'int': list(range(count)),
+        'str': [f'key-{i}' for i in range(count)],
+        'tuple': [(i, f'key-{i}', float(i)) for i in range(count)],
+        'Car': [Car(f'VIN{i:08d}', Color.RED, Make.TOYOTA, Model.CAMRY) for i in range(count)],
+    }
+
+
+def bench_hash_strategies(key_count: int = 64, lookups: int = 20_000) -> None:
+    ''' Lookup throughput per key type and hash strategy. The map is kept small so the
+        cost of hashing, not the chain scan, dominates each operation. '''
+    strategies = list(HashStrategy)
+    print('HashMap lookups/sec by key type and hash strategy')
+    print(f'{"key":>6} ' + ' '.join(f'{strategy.value:>12}' for strategy in strategies))
+    for name, keys in _sample_keys(key_count).items():
+        rates = []
+        for strategy in strategies:
+            hashmap = HashMap(hash_strategy=strategy)
+            for i, key in enumerate(keys):
+                hashmap[key] = i
+            position = iter(range(lookups))
+            rates.append(_ops_per_second(lambda: hashmap[keys[next(position) % key_count]], lookups))
+        print(f'{name:>6} ' + ' '.join(f'{rate:>12,.0f}' for rate in rates))
+
+
+def bench_chained_vs_open_addressing(sizes: tuple[int, ...] = (10**4, 10**5)) -> None:
+    ''' Memory held by the map structure (tracemalloc, keys and values excluded) and
+        insert/lookup throughput of the chained HashMap against OpenHashMap. '''
+    print('chained HashMap vs OpenHashMap')
+    print(f'{"n":>8} {"map":>12} {"bytes/entry":>12} {"inserts/sec":>12} {"lookups/sec":>12}')
+    for n in sizes:
+        keys = list(range(n))
+        values = [str(i) for i in keys]
+        for map_type in (HashMap, OpenHashMap):
+            tracemalloc.start()
+            start = time.perf_counter()
+            hashmap = map_type()
+            for key, value in zip(keys, values):
+                hashmap[key] = value
+            insert_rate = n / (time.perf_counter() - start)
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for key in keys:
+                hashmap[key]
+            lookup_rate = n / (time.perf_counter() - start)
+            print(f'{n:>8} {map_type.__name__:>12} {memory / n:>12,.1f} {insert_rate:>12,.0f} {lookup_rate:>12,.0f}')
+
+
+def bench_batched_operations(size: int = 50_000, batch_size: int = 1_000,
+                             custom_hash_function: Optional[Callable[[int], int]] = None) -> None:
+    ''' Per-key cost of get/set/delete one key at a time against the batched APIs. Batching pays
+        off when chains are long (for example with a poorly distributed hash function); with short
+        chains the grouping overhead outweighs the saved traversals. '''
+    hashmap = HashMap[int, int](custom_hash_function=custom_hash_function)
+    hashmap.set_many((i, i) for i in range(size))
+    hashmap._finish_rehash()
+    batch = list(range(0, size, size // batch_size))
+
+    def single_get() -> None:
+        for key in batch:
+            hashmap[key]
+
+    def single_set() -> None:
+        for key in batch:
+            hashmap[key] = key
+
+    def single_delete() -> None:
+        for key in batch:
+            del hashmap[key]
+
+    def best_cost(operation: Callable[[], Any], restore: Callable[[], Any], repeat: int = 5) -> float:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            operation()
+            best = min(best, time.perf_counter() - start)
+            restore()
+        return 1e6 * best / len(batch)
+
+    def restore_batch() -> None:
+        hashmap.set_many((key, key) for key in batch)
+
+    timings: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        ('get', single_get, lambda: hashmap.get_many(batch)),
+        ('set', single_set, lambda: hashmap.set_many((key, key) for key in batch)),
+        ('delete', single_delete, lambda: hashmap.delete_many(batch)),
+    ]
+    hash_name = 'default hash' if custom_hash_function is None else 'colliding hash'
+    print(f'HashMap per-key cost with {size:,} items, {hash_name}, batches of {len(batch):,} keys (best of 5, microseconds)')
+    print(f'{"op":>8} {"single":>10} {"batched":>10}')
+    for name, single, batched in timings:
+        print(f'{name:>8} {best_cost(single, restore_batch):>10.2f} {best_cost(batched, restore_batch):>10.2f}')
+
+
+def main() -> None:
+    bench_hash_strategies()
+    print()
+    bench_chained_vs_open_addressing()
+    print()
+    bench_batched_operations()
+    print()
+    bench_batched_operations(size=5_000, batch_size=500, custom_hash_function=lambda key: key % 16)
+
+
+if __name__ == '__main__':
+    main()
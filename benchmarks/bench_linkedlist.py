@@ -0,0 +1,79 @@
+''' Benchmarks for datastructures.linkedlist.LinkedList.
+
+    Run from the repository root:
+        python -m benchmarks.bench_linkedlist
+'''
+import time
+import tracemalloc
+from typing import Any, Optional
+
+from datastructures.linkedlist import LinkedList
+
+
+class _DictNode:
+    ''' The Node layout LinkedList used before __slots__: one __dict__ per node. '''
+
+    def __init__(self, value: Any, prev: Optional['_DictNode'] = None, next: Optional['_DictNode'] = None):
+        self.value = value
+        self.prev = prev
+        self.next = next
+
+
+def _traced_bytes_per_item(build: Any, size: int) -> float:
+    tracemalloc.start()
+    kept = build(size)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return memory / size
+
+
+def _build_dict_node_chain(size: int) -> _DictNode:
+    head = tail = _DictNode(0)
+    for i in range(1, size):
+        tail.next = _DictNode(i, tail)
+        tail = tail.next
+    return head
+
+
+def _build_linked_list(size: int) -> LinkedList[int]:
+    linked_list = LinkedList[int](data_type=int)
+    for i in range(size):
+        linked_list.append(i)
+    return linked_list
+
+
+def bench_memory(size: int = 10**6) -> None:
+    ''' Traced bytes per element, including the int stored in each node (the same for both layouts). '''
+    print(f'LinkedList memory for {size:,} elements (bytes/element)')
+    print(f'{"dict nodes":>12} {"slot nodes":>12}')
+    dict_nodes = _traced_bytes_per_item(_build_dict_node_chain, size)
+    slot_nodes = _traced_bytes_per_item(_build_linked_list, size)
+    print(f'{dict_nodes:>12,.1f} {slot_nodes:>12,.1f}')
+
+
+def bench_node_pool(size: int = 1_000, rounds: int = 200) -> None:
+    ''' Queue-style churn (append at the back, pop at the front) with and without a node pool. '''
+    print(f'LinkedList churn, {size:,} items x {rounds} rounds (operations/sec)')
+    print(f'{"no pool":>12} {"pooled":>12}')
+    rates = []
+    for pool_size in (0, size):
+        linked_list = LinkedList[int](data_type=int, node_pool_size=pool_size)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(size):
+                linked_list.append(i)
+            while not linked_list.empty:
+                linked_list.pop_front()
+        rates.append(2 * size * rounds / (time.perf_counter() - start))
+    print(f'{rates[0]:>12,.0f} {rates[1]:>12,.0f}')
+
+
+def main() -> None:
+    bench_memory()
+    print()
+    bench_node_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+''' Benchmarks for memory-mapped Arrays (datastructures.mappedarray.MappedArray).
+
+    Run from the repository root:
+        python -m benchmarks.bench_mappedarray
+'''
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from datastructures.array import Array
+
+
+def bench_startup(sizes: tuple[int, ...] = (10**5, 10**6, 10**7)) -> None:
+    ''' Seconds to get a usable Array of n floats at process start: rebuilding it item by item,
+        loading a saved copy into memory, or mapping the saved file. '''
+    print('time to a usable Array of n float64 (seconds)')
+    print(f'{"n":>10} {"rebuild":>10} {"np.fromfile":>12} {"open_mmap":>10} {"append/sec (mapped)":>20}')
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            path = os.path.join(directory, f'{n}.bin')
+            Array.from_buffer(np.arange(n, dtype=np.float64)).save(path)
+
+            start = time.perf_counter()
+            rebuilt = Array.from_buffer(np.empty(0))
+            for i in range(min(n, 10**6)):
+                rebuilt.append(float(i))
+            rebuild = (time.perf_counter() - start) * n / min(n, 10**6)
+
+            start = time.perf_counter()
+            Array.from_buffer(np.fromfile(path, dtype=np.float64, offset=256), copy=False)
+            loaded = time.perf_counter() - start
+
+            start = time.perf_counter()
+            mapped = Array.open_mmap(path)
+            mapped_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(10**5):
+                mapped.append(float(i))
+            appends = 10**5 / (time.perf_counter() - start)
+            mapped.close()
+            print(f'{n:>10} {rebuild:>10.4f} {loaded:>12.4f} {mapped_seconds:>10.4f} {appends:>20,.0f}')
+    print('(rebuild times above 10**6 items are extrapolated)')
+
+
+def main() -> None:
+    bench_startup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+''' Benchmarks for datastructures.sharedcircularqueue.SharedCircularQueue against multiprocessing.Queue.
+
+    Run from the repository root:
+        python -m benchmarks.bench_sharedcircularqueue
+'''
+import multiprocessing
+import time
+
+import numpy as np
+
+from datastructures.sharedcircularqueue import SharedCircularQueue
+
+
+def _produce_shared(queue: SharedCircularQueue, count: int) -> None:
+    for i in range(count):
+        while queue.full:
+            pass
+        queue.enqueue(i)
+
+
+def _produce_shared_batches(queue: SharedCircularQueue, count: int, batch_size: int) -> None:
+    items = np.arange(count, dtype=np.float64)
+    sent = 0
+    while sent < count:
+        sent += queue.enqueue_many(items[sent:sent + batch_size])
+
+
+def _produce_mp(queue: multiprocessing.Queue, count: int) -> None:
+    for i in range(count):
+        queue.put(float(i))
+
+
+def _messages_per_second(target, args: tuple, consume, count: int) -> float:
+    producer = multiprocessing.Process(target=target, args=args)
+    start = time.perf_counter()
+    producer.start()
+    consume()
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return count / elapsed
+
+
+def bench_two_processes(count: int = 200_000, maxsize: int = 4_096, batch_size: int = 256) -> None:
+    ''' Messages/sec (one float64 each) from a producer process to this process. '''
+    print(f'{count:,} float64 messages between two processes (messages/sec)')
+    with SharedCircularQueue(maxsize=maxsize, dtype=np.float64) as shared:
+        def consume_shared() -> None:
+            received = 0
+            while received < count:
+                if not shared.empty:
+                    shared.dequeue()
+                    received += 1
+
+        def consume_shared_batches() -> None:
+            received = 0
+            while received < count:
+                received += len(shared.dequeue_many(batch_size))
+
+        single = _messages_per_second(_produce_shared, (shared, count), consume_shared, count)
+        batched = _messages_per_second(_produce_shared_batches, (shared, count, batch_size), consume_shared_batches, count)
+
+    mp_queue: multiprocessing.Queue = multiprocessing.Queue(maxsize=maxsize)
+
+    def consume_mp() -> None:
+        for _ in range(count):
+            mp_queue.get()
+
+    pickled = _messages_per_second(_produce_mp, (mp_queue, count), consume_mp, count)
+    print(f'{"multiprocessing.Queue":>34} {pickled:>14,.0f}')
+    print(f'{"SharedCircularQueue":>34} {single:>14,.0f}')
+    print(f'{f"SharedCircularQueue, batches of {batch_size}":>34} {batched:>14,.0f}')
+
+
+def main() -> None:
+    bench_two_processes()
+
+
+if __name__ == '__main__':
+    main()
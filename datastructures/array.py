@@ -1,13 +1,93 @@
 from __future__ import annotations
 from collections.abc import Sequence
-from typing import Any, Iterator, Optional, MutableSequence, overload
+from dataclasses import dataclass
+from itertools import islice
+import math
+import os
+from typing import Any, Iterable, Iterator, Optional, MutableSequence, overload
+from weakref import WeakValueDictionary
 import numpy as np
 from numpy.typing import NDArray
 
 from datastructures.iarray import IArray, T
 
+
+def _is_numeric(data_type: type | np.dtype) -> bool:
+    ''' Returns True if data_type maps to a NumPy bool, integer, float or complex dtype. '''
+    return np.dtype(data_type).kind in 'biufc'
+
+
+def _matches(items: NDArray, item: Any) -> Optional[NDArray]:
+    ''' Returns a boolean mask of the items equal to item, or None when NumPy cannot compare
+        them in one operation and the caller has to fall back to comparing item by item. '''
+    if _is_numeric(items.dtype) and isinstance(item, (bool, int, float, complex, np.number, np.bool_)):
+        return items == item
+    return None
+
+
+def _first_match(items: NDArray, item: Any) -> int:
+    mask = _matches(items, item)
+    if mask is None:
+        for i, element in enumerate(items):
+            if element == item:
+                return i
+    elif mask.any():
+        return int(mask.argmax())
+    raise ValueError(f'{item} is not in the array.')
+
+
+def _count_matches(items: NDArray, item: Any) -> int:
+    mask = _matches(items, item)
+    if mask is None:
+        return sum(1 for element in items if element == item)
+    return int(np.count_nonzero(mask))
+
+
+def _find_matches(items: NDArray, item: Any) -> Array[int]:
+    mask = _matches(items, item)
+    if mask is None:
+        mask = np.fromiter((element == item for element in items), dtype=bool, count=len(items))
+    return Array.from_buffer(np.flatnonzero(mask), int, copy=False)
+
+
+def _items_equal(mine: NDArray, theirs: NDArray) -> bool:
+    if len(mine) != len(theirs):
+        return False
+    if _is_numeric(mine.dtype) and _is_numeric(theirs.dtype):
+        return bool(np.array_equal(mine, theirs))
+    return all(a == b for a, b in zip(mine, theirs))
+
+
+@dataclass(frozen=True)
+class ResizePolicy:
+    ''' Controls how an Array's buffer grows and shrinks.
+
+        Arguments:
+            growth_factor: the buffer is multiplied by this when it runs out of room
+            shrink_threshold: after a deletion the buffer is shrunk (to growth_factor times the item count)
+                once at most this fraction of it is in use; 0 disables shrinking
+            min_capacity: the buffer never gets smaller than this
+    '''
+    growth_factor: float = 2.0
+    shrink_threshold: float = 0.25
+    min_capacity: int = 1
+
+    def __post_init__(self) -> None:
+        if self.growth_factor <= 1:
+            raise ValueError('growth_factor must be greater than 1.')
+        # a buffer shrunk to growth_factor * count must not qualify for shrinking again right away
+        if not 0 <= self.shrink_threshold * self.growth_factor < 1:
+            raise ValueError('shrink_threshold must be between 0 and 1 / growth_factor.')
+        if self.min_capacity < 1:
+            raise ValueError('min_capacity must be at least 1.')
+
+
+DEFAULT_RESIZE_POLICY = ResizePolicy()
+
+
 class Array(IArray[T]):  
-    def __init__(self, starting_sequence: MutableSequence[T], data_type: Optional[type]=None) -> None:
+    def __init__(self, starting_sequence: MutableSequence[T], data_type: Optional[type]=None,
+                 policy: ResizePolicy=DEFAULT_RESIZE_POLICY) -> None:
         if not isinstance(starting_sequence, Sequence): 
             raise ValueError('Sequence must be a valid sequence type.')
         
@@ -16,10 +96,102 @@ class Array(IArray[T]):
         
         self._item_count: int = len(starting_sequence)
         self._data_type: type = data_type or (type(starting_sequence[0]) if starting_sequence else object)
-        self._items: NDArray[T] = np.empty(self._item_count or 1, dtype=self._data_type)
+        self._policy: ResizePolicy = policy
+        self._items: NDArray[T] = np.empty(max(self._item_count, policy.min_capacity), dtype=self._data_type)
+        # index of the first item in _items; spare slots before it make append_front O(1) amortized
+        self._head: int = 0
+        # slices handed out as ArrayViews that still share _items; created on the first slice
+        self._views: Optional[WeakValueDictionary[int, ArrayView[T]]] = None
+
+        if _is_numeric(self._items.dtype):
+            self._items[:self._item_count] = starting_sequence
+        else:
+            # object items may themselves be sequences, which NumPy would try to broadcast
+            for i in range(self._item_count):
+                self._items[i] = starting_sequence[i]
+
+    @classmethod
+    def _wrap(cls, items: NDArray, item_count: int, data_type: type,
+              policy: ResizePolicy=DEFAULT_RESIZE_POLICY) -> Array[T]:
+        ''' Builds an Array around an existing NumPy buffer without copying or type checking it. '''
+        array = cls.__new__(cls)
+        array._set_buffer(items, item_count, data_type, policy)
+        return array
+
+    def _set_buffer(self, items: NDArray, item_count: int, data_type: type, policy: ResizePolicy) -> None:
+        self._items = items if len(items) else np.empty(1, dtype=items.dtype)
+        self._item_count = item_count
+        self._data_type = data_type
+        self._head = 0
+        self._policy = policy
+        self._views = None
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, data_type: Optional[type]=None, copy: bool=True) -> Array[T]:
+        ''' Creates an Array from a NumPy array or any object supporting the buffer protocol
+            with a single block copy (or no copy at all when copy is False).
 
-        for i in range(self._item_count):
-            self._items[i] = starting_sequence[i]
+            Arguments:
+                buffer: a one-dimensional ndarray, bytes-like object or array-like
+                data_type: the type of the items; inferred from the buffer's dtype when omitted
+                copy: if False the Array shares memory with buffer whenever possible
+        '''
+        if not isinstance(buffer, np.ndarray):
+            # read bytes-like objects through their buffer (np.array(b'abc') would be a single string)
+            try:
+                buffer = memoryview(buffer)
+            except TypeError:
+                pass
+        items = np.array(buffer, dtype=data_type, copy=True) if copy else np.asarray(buffer, dtype=data_type)
+        if items.ndim != 1:
+            raise ValueError('Buffer must be one-dimensional.')
+        if data_type is None:
+            data_type = object if items.dtype.kind == 'O' else type(items.dtype.type(0).item())
+        elif not _is_numeric(items.dtype) and not all(isinstance(item, data_type) for item in items):
+            raise TypeError(f'All items in the buffer must be of the same type: {data_type}')
+        return cls._wrap(items, len(items), data_type)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], data_type: type=object, count: int=-1) -> Array[T]:
+        ''' Creates an Array from any iterable without building an intermediate list.
+            Numeric types are filled by NumPy directly (items are converted to data_type).
+
+            Arguments:
+                iterable: the items to store
+                data_type: the type of the items
+                count: the number of items to read, or -1 to read the whole iterable.
+                    Passing the length up front lets the buffer be allocated once.
+        '''
+        if _is_numeric(data_type):
+            items = np.fromiter(iterable, dtype=data_type, count=count)
+            return cls._wrap(items, len(items), data_type)
+
+        array = cls._wrap(np.empty(max(count, 1), dtype=data_type), 0, data_type)
+        for item in iterable if count < 0 else islice(iterable, count):
+            if not isinstance(item, data_type):
+                raise TypeError(f'Item must be of type {data_type.__name__}')
+            array.append(item)
+        if count >= 0 and len(array) < count:
+            raise ValueError(f'Iterable is too short: expected {count} items, got {len(array)}.')
+        return array
+
+    @classmethod
+    def open_mmap(cls, path: str | os.PathLike, data_type: Optional[type]=None, mode: str='r+') -> Array[T]:
+        ''' Opens an Array whose buffer is a memory-mapped file (see MappedArray.open).
+
+            Arguments:
+                path: the array file, as written by save() or created with mode 'w+'
+                data_type: the item type; required for 'w+', checked against the file otherwise
+                mode: 'r' (read-only), 'r+' (read-write) or 'w+' (create an empty array file)
+        '''
+        # imported here because mappedarray builds on this module
+        from datastructures.mappedarray import MappedArray
+        return MappedArray.open(path, data_type, mode)
+
+    def save(self, path: str | os.PathLike) -> None:
+        ''' Writes the items to path with a header, so Array.open_mmap(path) can map them later. '''
+        from datastructures.mappedarray import save
+        save(self, path)
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -29,75 +201,156 @@ class Array(IArray[T]):
         if isinstance(index, int):
             if index >= self._item_count or index < -self._item_count:
                 raise IndexError(f'{index} is out of bounds.')
-            return self._items[index]
+            if index < 0:
+                index += self._item_count
+            return self._items[self._head + index]
         elif isinstance(index, slice):
-            return Array(self._items[index].tolist(), self._data_type)
+            return ArrayView(self, self._live()[index])
         else:
             raise TypeError('Index must be int or slice.')
 
     def __setitem__(self, index: int, item: T) -> None:
         if not isinstance(index, int):
             raise TypeError('Index must be an int.')
-        if not isinstance(item, self._data_type):
+        if not self._accepts(item):
             raise TypeError(f'Item must be of type {self._data_type.__name__}')
         if index >= self._item_count or index < -self._item_count:
             raise IndexError(f'{index} is out of bounds.')
-        self._items[index] = item
+        if index < 0:
+            index += self._item_count
+        if self._views:
+            self._detach_views()
+        self._items[self._head + index] = item
+
+    def _accepts(self, item: Any) -> bool:
+        return isinstance(item, self._data_type)
 
     def append(self, data: T) -> None:
-        if self._item_count == len(self._items):
-            self._resize(max(1, len(self._items) * 2))
-        self._items[self._item_count] = data
+        if self._views:
+            self._detach_views()
+        if self._head + self._item_count == len(self._items):
+            self._make_room_at_back()
+        self._items[self._head + self._item_count] = data
         self._item_count += 1
 
     def append_front(self, data: T) -> None:
-        if self._item_count == len(self._items):
-            self._resize(max(1, len(self._items) * 2))
-        for i in range(self._item_count, 0, -1):
-            self._items[i] = self._items[i - 1]
-        self._items[0] = data
+        if self._views:
+            self._detach_views()
+        if self._head == 0:
+            self._make_room_at_front()
+        self._head -= 1
+        self._items[self._head] = data
         self._item_count += 1
 
     def pop(self) -> None:
         if self._item_count == 0:
             raise IndexError("Pop from empty array")
         self._item_count -= 1
+        if self._item_count == 0:
+            self._head = 0
 
     def pop_front(self) -> None:
         if self._item_count == 0:
             raise IndexError("Pop from empty array")
-        for i in range(1, self._item_count):
-            self._items[i - 1] = self._items[i]
+        self._head += 1
         self._item_count -= 1
+        if self._item_count == 0:
+            self._head = 0
 
     def __len__(self) -> int:
         return self._item_count
 
-    def _resize(self, new_size: int) -> None:
-        new_items: NDArray = np.empty(new_size, dtype=self._data_type)
-        for i in range(self._item_count):
-            new_items[i] = self._items[i]
+    @property
+    def policy(self) -> ResizePolicy:
+        return self._policy
+
+    def _live(self) -> NDArray:
+        ''' Returns a NumPy view of the items currently stored in the Array. '''
+        return self._items[self._head:self._head + self._item_count]
+
+    def _detach_views(self) -> None:
+        ''' Gives every ArrayView still sharing the buffer its own copy, before the buffer is written to. '''
+        for view in list(self._views.values()):
+            view._detach()
+        self._views = None
+
+    def copy(self) -> Array[T]:
+        ''' Returns an independent Array holding the same items, made with one block copy. '''
+        return type(self)._wrap(self._live().copy(), self._item_count, self._data_type, self._policy)
+
+    def __array__(self, dtype: Any=None, copy: Optional[bool]=None) -> NDArray:
+        ''' Lets np.asarray(array) read the live items without copying them; the result is read-only. '''
+        if copy:
+            return np.array(self._live(), dtype=dtype, copy=True)
+        items = self._live().view()
+        items.flags.writeable = False
+        return items if dtype is None else items.astype(dtype, copy=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # views are tied to this particular buffer, copies and unpickled Arrays start without any
+        return {**self.__dict__, '_views': None}
+
+    def _resize(self, new_size: int, head: int = 0) -> None:
+        new_items: NDArray = np.empty(new_size, dtype=self._items.dtype)
+        new_items[head:head + self._item_count] = self._live()
         self._items = new_items
+        self._head = head
+
+    def _move_to(self, head: int) -> None:
+        ''' Slides the items to start at head within the current buffer (one block move). '''
+        if self._views:
+            self._detach_views()
+        self._items[head:head + self._item_count] = self._live()
+        self._head = head
+
+    def _grown_size(self) -> int:
+        physical_size = len(self._items)
+        return max(physical_size + 1, math.ceil(physical_size * self._policy.growth_factor), self._policy.min_capacity)
+
+    def _make_room_at_back(self) -> None:
+        ''' Frees at least one slot after the last item. The items are recentered when at least half
+            of the buffer is spare, otherwise the buffer grows and keeps its spare slots at the front.
+            Either way the cost is paid at most once every len(self._items) // 4 operations.
+        '''
+        physical_size = len(self._items)
+        if self._item_count * 2 <= physical_size:
+            self._move_to((physical_size - self._item_count) // 2)
+        else:
+            self._resize(self._grown_size(), self._head)
+
+    def _make_room_at_front(self) -> None:
+        ''' Frees at least one slot before the first item. Mirror image of _make_room_at_back. '''
+        physical_size = len(self._items)
+        if self._item_count * 2 <= physical_size:
+            self._move_to((physical_size - self._item_count + 1) // 2)
+        else:
+            back_spare = physical_size - self._head - self._item_count
+            new_size = self._grown_size()
+            self._resize(new_size, new_size - self._item_count - back_spare)
+
+    def _shrink_if_sparse(self) -> None:
+        ''' Shrinks the buffer to growth_factor times the item count once the policy's shrink threshold is reached. '''
+        policy = self._policy
+        if policy.shrink_threshold == 0:
+            return
+        physical_size = len(self._items)
+        if self._item_count <= physical_size * policy.shrink_threshold and physical_size > policy.min_capacity:
+            self._resize(max(policy.min_capacity, math.ceil(self._item_count * policy.growth_factor)))
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Array):
-            return False
-        if len(self) != len(other):
+        if not isinstance(other, (Array, ArrayView)):
             return False
-        for i in range(len(self)):
-            if self[i] != other[i]:
-                return False
-        return True
+        return _items_equal(self._live(), other._live())
 
     def __ne__(self, other: object) -> bool:
         return not self == other
 
     def __iter__(self) -> Iterator[T]:
-        for i in range(self._item_count):
+        for i in range(self._head, self._head + self._item_count):
             yield self._items[i]
 
     def __reversed__(self) -> Iterator[T]:
-        for i in range(self._item_count - 1, -1, -1):
+        for i in range(self._head + self._item_count - 1, self._head - 1, -1):
             yield self._items[i]
 
     def __delitem__(self, index: int) -> None:
@@ -105,20 +358,171 @@ class Array(IArray[T]):
             raise TypeError("Index must be int")
         if index >= self._item_count or index < -self._item_count:
             raise IndexError(f'{index} is out of bounds.')
-        for i in range(index, self._item_count - 1):
-            self._items[i] = self._items[i + 1]
-        self._item_count -= 1
-        if self._item_count <= len(self._items) // 4:
-            self._resize(max(1, len(self._items) // 2))
+        if index < 0:
+            index += self._item_count
+        self._delete_block(index, index + 1)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        ''' Deletes the items from start up to (not including) stop with a single block move.
+            Indices are interpreted like slice bounds, so negative and out-of-range values are allowed.
+        '''
+        start, stop, _ = slice(start, stop).indices(self._item_count)
+        if start < stop:
+            self._delete_block(start, stop)
+
+    def _delete_block(self, start: int, stop: int) -> None:
+        ''' Closes the gap left by items start:stop by moving whichever side of it is shorter. '''
+        if self._views:
+            self._detach_views()
+        head = self._head
+        if start < self._item_count - stop:
+            self._items[head + stop - start:head + stop] = self._items[head:head + start]
+            self._head += stop - start
+        else:
+            self._items[head + start:head + self._item_count - (stop - start)] = self._items[head + stop:head + self._item_count]
+        self._item_count -= stop - start
+        if self._item_count == 0:
+            self._head = 0
+        self._shrink_if_sparse()
+
+    def compact(self) -> None:
+        ''' Releases the spare capacity, copying the items into a buffer of exactly their size
+            (or the policy's minimum capacity) with one block copy. '''
+        self._resize(max(self._item_count, self._policy.min_capacity))
 
     def __contains__(self, item: Any) -> bool:
-        return any(self[i] == item for i in range(self._item_count))
+        mask = _matches(self._live(), item)
+        if mask is None:
+            return any(element == item for element in self._live())
+        return bool(mask.any())
+
+    def index(self, item: Any, start: int=0, stop: Optional[int]=None) -> int:
+        ''' Returns the index of the first occurrence of item between start and stop.
+            Raises ValueError if item is not there. '''
+        start, stop, _ = slice(start, stop).indices(self._item_count)
+        return start + _first_match(self._live()[start:stop], item)
+
+    def count(self, item: Any) -> int:
+        ''' Returns the number of occurrences of item. '''
+        return _count_matches(self._live(), item)
+
+    def find_all(self, item: Any) -> Array[int]:
+        ''' Returns the indices of every occurrence of item, in order. '''
+        return _find_matches(self._live(), item)
 
     def clear(self) -> None:
         self._item_count = 0
+        self._head = 0
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f'Array(logical size: {self._item_count}, physical size: {len(self._items)}, items: {self})'
+
+class ArrayView(Sequence[T]):
+    """ A read-only slice of an Array that shares the Array's NumPy buffer instead of copying it.
+        The view keeps the items the Array held when it was sliced: before the Array writes to or
+        moves its buffer, it gives each live view a private copy (copy-on-write). Use copy() to
+        get an independent, mutable Array.
+    """
+
+    def __init__(self, parent: Array[T], view: NDArray) -> None:
+        self._view: NDArray = view
+        self._data_type: type = parent._data_type
+        self._policy: ResizePolicy = parent._policy
+        self._parent: Optional[Array[T]] = parent
+        if parent._views is None:
+            parent._views = WeakValueDictionary()
+        parent._views[id(self)] = self
+
+    def _detach(self) -> None:
+        self._view = self._view.copy()
+        self._parent = None
+
+    @property
+    def shares_memory(self) -> bool:
+        return self._parent is not None
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> ArrayView[T]: ...
+    def __getitem__(self, index: int | slice) -> T | ArrayView[T]:
+        if isinstance(index, int):
+            if index >= len(self._view) or index < -len(self._view):
+                raise IndexError(f'{index} is out of bounds.')
+            return self._view[index]
+        elif isinstance(index, slice):
+            if self._parent is None:
+                return ArrayView._of_detached(self._view[index], self._data_type, self._policy)
+            return ArrayView(self._parent, self._view[index])
+        else:
+            raise TypeError('Index must be int or slice.')
+
+    @classmethod
+    def _of_detached(cls, view: NDArray, data_type: type, policy: ResizePolicy) -> ArrayView[T]:
+        array_view = cls.__new__(cls)
+        array_view._view = view
+        array_view._data_type = data_type
+        array_view._policy = policy
+        array_view._parent = None
+        return array_view
+
+    def copy(self) -> Array[T]:
+        ''' Returns the items of the view as a new Array, made with one block copy. '''
+        return Array._wrap(self._view.copy(), len(self._view), self._data_type, self._policy)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __array__(self, dtype: Any=None, copy: Optional[bool]=None) -> NDArray:
+        ''' Lets np.asarray(view) use the shared items directly; the result is read-only. '''
+        if copy:
+            return np.array(self._view, dtype=dtype, copy=True)
+        items = self._view.view()
+        items.flags.writeable = False
+        return items if dtype is None else items.astype(dtype, copy=False)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._view)
+
+    def __reversed__(self) -> Iterator[T]:
+        return iter(self._view[::-1])
+
+    def _live(self) -> NDArray:
+        return self._view
+
+    def __contains__(self, item: Any) -> bool:
+        mask = _matches(self._view, item)
+        if mask is None:
+            return any(element == item for element in self._view)
+        return bool(mask.any())
+
+    def index(self, item: Any, start: int=0, stop: Optional[int]=None) -> int:
+        start, stop, _ = slice(start, stop).indices(len(self._view))
+        return start + _first_match(self._view[start:stop], item)
+
+    def count(self, item: Any) -> int:
+        return _count_matches(self._view, item)
+
+    def find_all(self, item: Any) -> Array[int]:
+        return _find_matches(self._view, item)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Array, ArrayView)):
+            return False
+        return _items_equal(self._view, other._live())
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __getstate__(self) -> dict[str, Any]:
+        # a pickled or copied view owns its items
+        return {**self.__dict__, '_view': self._view.copy(), '_parent': None}
 
     def __str__(self) -> str:
-        return str([self._items[i] for i in range(self._item_count)])
+        return str(list(self))
 
     def __repr__(self) -> str:
-        return f'Array(logical size: {self._item_count}, physical size: {len(self._items)}, items: {self})'
\ No newline at end of file
+        return f'ArrayView(logical size: {len(self)}, shares memory: {self.shares_memory}, items: {self})'
@@ -1,9 +1,12 @@
 from __future__ import annotations
+from itertools import chain
 import os
-from typing import Iterator, Sequence
+from typing import Any, Iterator, Optional, Sequence
+import numpy as np
+from numpy.typing import NDArray
 
 from datastructures.iarray import IArray
-from datastructures.array import Array
+from datastructures.array import Array, _is_numeric
 from datastructures.iarray2d import IArray2D, T
 
 
@@ -15,38 +18,30 @@ class Array2D(IArray2D[T]):
             self.array = array
             self.num_columns = num_columns
             self.data_type = data_type
-            #raise NotImplementedError('Row.__init__ not implemented.')
+            # the row's slice of the flat buffer; reads and writes skip Array's per-item checks
+            start = self.map_index(row_index, 0)
+            self.items: NDArray = array._live()[start:start + num_columns]
 
         def __getitem__(self, column_index: int) -> T:
-            if column_index >= self.num_columns:
+            if column_index >= self.num_columns or column_index < -self.num_columns:
                 raise IndexError("Index too big.")
-            index = self.map_index(self.row_index, column_index)
-
-            return self.array[index]
-        
-            #raise NotImplementedError('Row.__getitem__ not implemented.')
+            return self.items[column_index]
         
         def map_index(self, row_index, column_index):
             return row_index * self.num_columns + column_index
         
         def __setitem__(self, column_index: int, value: T) -> None:
-            index = self.map_index(self.row_index, column_index= column_index)
-
-            self.array[index] = value
-            
-            #raise NotImplementedError('Row.__setitem__ not implemented.')
+            if column_index >= self.num_columns or column_index < -self.num_columns:
+                raise IndexError("Index too big.")
+            if not isinstance(value, self.data_type):
+                raise TypeError(f'Item must be of type {self.data_type.__name__}')
+            self.items[column_index] = value
         
         def __iter__(self) -> Iterator[T]:
-            
-            for column_index in range(self.num_columns):
-                yield self[column_index]
-                
-            #raise NotImplementedError('Row.__iter__ not implemented.')
+            return iter(self.items)
         
         def __reversed__(self) -> Iterator[T]:
-            for col_num in reversed(range(self.num_columns)):
-                yield self[col_num]
-            raise NotImplementedError('Row.__reversed__ not implemented.')
+            return iter(self.items[::-1])
 
         def __len__(self) -> int:
             return self.num_columns
@@ -79,37 +74,108 @@ class Array2D(IArray2D[T]):
             if self.column_len != len(element):
                 raise ValueError("Your sequences are not all equally long.")
         
-        self.array2D = Array([data_type() for item in range(self.row_len * self.column_len)], data_type= data_type)
-
-        index = 0
-        for row_index in range(self.row_len):
-            for column_index in range(self.column_len):
-                
-                self.array2D[index] = starting_sequence[row_index][column_index]
-                index += 1
-
+        # the items were type checked above, so they are copied into the flat buffer in one pass
+        items = chain.from_iterable(starting_sequence)
+        self.array2D = Array.from_iterable(items, data_type=data_type, count=self.row_len * self.column_len)
 
+        self._init_grid()
 
         #raise NotImplementedError('Array2D.__init__ not implemented.')
 
+    def _init_grid(self) -> None:
+        ''' Sets up the 2-D view of the flat buffer and the cache of Row proxies. '''
+        self._grid: NDArray = self.array2D._live().reshape(self.row_len, self.column_len)
+        self._rows: list[Optional[Array2D.Row[T]]] = [None] * self.row_len
+
+    @classmethod
+    def _from_flat(cls, array: Array, rows: int, cols: int, data_type: type) -> Array2D[T]:
+        ''' Builds an Array2D around a flat Array of rows * cols items without copying it. '''
+        array2d = cls.__new__(cls)
+        array2d.data_type = data_type
+        array2d.row_len = rows
+        array2d.column_len = cols
+        array2d.array2D = array
+        array2d._init_grid()
+        return array2d
+
     @staticmethod
     def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
-        starting_sequence = []
-        
-        for row in range(rows):
-            starting_sequence.append([])
-            for col in range(cols):
-                starting_sequence[row].append(data_type())
+        ''' Returns a rows x cols grid where every cell is data_type(). Numeric and string grids
+            are allocated with a single NumPy call; other types get a new data_type() per cell. '''
+        count = rows * cols
+        dtype = np.dtype(data_type)
+        if dtype.kind in 'biufcUS':
+            items = np.full(count, data_type(), dtype=dtype)
+        else:
+            items = np.fromiter((data_type() for _ in range(count)), dtype=dtype, count=count)
+        return Array2D._from_flat(Array._wrap(items, count, data_type), rows, cols, data_type)
 
-        return Array2D(starting_sequence= starting_sequence, data_type= data_type)
+    @staticmethod
+    def zeros(rows: int=0, cols: int=0, data_type: type=float) -> Array2D:
+        ''' Returns a rows x cols grid of a numeric data_type filled with zeros. '''
+        if not _is_numeric(data_type):
+            raise TypeError(f'zeros needs a numeric data type, not {data_type.__name__}.')
+        items = np.zeros(rows * cols, dtype=data_type)
+        return Array2D._from_flat(Array._wrap(items, rows * cols, data_type), rows, cols, data_type)
 
-        #raise NotImplementedError('Array2D.empty not implemented.')
+    @staticmethod
+    def full(rows: int, cols: int, value: T, data_type: Optional[type]=None) -> Array2D:
+        ''' Returns a rows x cols grid with value in every cell. For object types every cell
+            refers to the same value, as with [value] * n. '''
+        data_type = data_type or type(value)
+        if not isinstance(value, data_type):
+            raise TypeError(f'Item must be of type {data_type.__name__}')
+        items = np.full(rows * cols, value, dtype=np.dtype(data_type))
+        return Array2D._from_flat(Array._wrap(items, rows * cols, data_type), rows, cols, data_type)
 
-    def __getitem__(self, row_index: int) -> Array2D.IRow[T]:
-        if row_index >= self.row_len:
+    @staticmethod
+    def from_numpy(items: Any, data_type: Optional[type]=None, copy: bool=True) -> Array2D:
+        ''' Returns a grid holding a two-dimensional ndarray (or nested array-like).
+
+            Arguments:
+                items: the rows x cols items
+                data_type: the type of the items; inferred from the dtype when omitted
+                copy: if False the grid shares memory with items whenever it is C-contiguous
+        '''
+        grid = np.array(items, dtype=data_type, copy=True) if copy else np.asarray(items, dtype=data_type)
+        if grid.ndim != 2:
+            raise ValueError('items must be two-dimensional.')
+        rows, cols = grid.shape
+        array = Array.from_buffer(np.ascontiguousarray(grid).reshape(-1), data_type, copy=False)
+        return Array2D._from_flat(array, rows, cols, array._data_type)
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Array2D.IRow[T] | T:
+        ''' grid[row] returns the (cached) Row proxy, grid[row, column] the item itself. '''
+        if isinstance(index, tuple):
+            return self._grid[index]
+        if index >= self.row_len or index < -self.row_len:
             raise IndexError("Index too big.")
-        return Array2D.Row(row_index, self.array2D, self.column_len, self.data_type) 
-        #raise NotImplementedError('Array2D.__getitem__ not implemented.')
+        if index < 0:
+            index += self.row_len
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = Array2D.Row(index, self.array2D, self.column_len, self.data_type)
+        return row
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        ''' grid[row, column] = value '''
+        if not isinstance(index, tuple):
+            raise TypeError('Index must be a (row, column) tuple.')
+        if not isinstance(value, self.data_type):
+            raise TypeError(f'Item must be of type {self.data_type.__name__}')
+        self._grid[index] = value
+
+    def row(self, row_index: int) -> NDArray:
+        ''' Returns a NumPy view of a whole row; writing to it writes to the grid. '''
+        return self._grid[row_index]
+
+    def column(self, column_index: int) -> NDArray:
+        ''' Returns a NumPy view of a whole column; writing to it writes to the grid. '''
+        return self._grid[:, column_index]
+
+    def to_numpy(self) -> NDArray:
+        ''' Returns the grid as a rows x columns NumPy view of its buffer. '''
+        return self._grid
     
     def __iter__(self) -> Iterator[Sequence[T]]:
         for num_row in range(self.row_len):
@@ -0,0 +1,134 @@
+from typing import Iterator, TypeVar
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import _is_numeric
+from datastructures.iqueue import IQueue
+
+T = TypeVar('T')
+
+class ArrayDeque(IQueue[T]):
+    ''' Deque backed by a growable circular NumPy buffer instead of a LinkedList. Adding or
+        removing at either end is amortized O(1) without allocating a node, and items can be
+        read by position in O(1). The capacity is kept at a power of two so indices wrap with
+        a bit mask.
+    '''
+
+    def __init__(self, data_type: type = object, capacity: int = 8) -> None:
+        ''' Arguments:
+                data_type: The type of the elements in the deque
+                capacity: The initial number of slots (rounded up to a power of two)
+        '''
+        physical_size = 1
+        while physical_size < capacity:
+            physical_size *= 2
+        self._data_type = data_type
+        self._items: NDArray = np.empty(physical_size, dtype=data_type if _is_numeric(data_type) else object)
+        self._front = 0
+        self._count = 0
+        self._mask = physical_size - 1
+
+    def _check_type(self, item: T) -> None:
+        if not isinstance(item, self._data_type):
+            raise TypeError(f"Item must be of type {self._data_type.__name__}.")
+
+    def _grow(self) -> None:
+        ''' Doubles the buffer, unwrapping the items to start at slot 0 with two block copies. '''
+        capacity = len(self._items)
+        new_items: NDArray = np.empty(capacity * 2, dtype=self._items.dtype)
+        first_run = min(self._count, capacity - self._front)
+        new_items[:first_run] = self._items[self._front:self._front + first_run]
+        new_items[first_run:self._count] = self._items[:self._count - first_run]
+        self._items = new_items
+        self._front = 0
+        self._mask = capacity * 2 - 1
+
+    def enqueue(self, item: T) -> None:
+        self._check_type(item)
+        if self._count == len(self._items):
+            self._grow()
+        self._items[(self._front + self._count) & self._mask] = item
+        self._count += 1
+
+    def dequeue(self) -> T:
+        if self._count == 0:
+            raise IndexError("Dequeue from empty deque.")
+        item = self._items[self._front]
+        if self._items.dtype == object:
+            self._items[self._front] = None
+        self._front = (self._front + 1) & self._mask
+        self._count -= 1
+        return item
+
+    def enqueue_front(self, item: T) -> None:
+        self._check_type(item)
+        if self._count == len(self._items):
+            self._grow()
+        self._front = (self._front - 1) & self._mask
+        self._items[self._front] = item
+        self._count += 1
+
+    def dequeue_back(self) -> T:
+        if self._count == 0:
+            raise IndexError("Dequeue from empty deque.")
+        self._count -= 1
+        index = (self._front + self._count) & self._mask
+        item = self._items[index]
+        if self._items.dtype == object:
+            self._items[index] = None
+        return item
+
+    def front(self) -> T:
+        if self._count == 0:
+            raise IndexError("Deque is empty.")
+        return self._items[self._front]
+
+    def back(self) -> T:
+        if self._count == 0:
+            raise IndexError("Deque is empty.")
+        return self._items[(self._front + self._count - 1) & self._mask]
+
+    def empty(self) -> bool:
+        return self._count == 0
+
+    def __getitem__(self, index: int) -> T:
+        ''' Returns the item at position index counted from the front (negative counts from the back). '''
+        if index >= self._count or index < -self._count:
+            raise IndexError(f'{index} is out of bounds.')
+        if index < 0:
+            index += self._count
+        return self._items[(self._front + index) & self._mask]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _runs(self) -> tuple[NDArray, NDArray]:
+        ''' The items as at most two contiguous NumPy views, in order. '''
+        first_run = min(self._count, len(self._items) - self._front)
+        return self._items[self._front:self._front + first_run], self._items[:self._count - first_run]
+
+    def __iter__(self) -> Iterator[T]:
+        for run in self._runs():
+            yield from run
+
+    def __contains__(self, item: T) -> bool:
+        if _is_numeric(self._items.dtype) and isinstance(item, (int, float, complex, np.number)):
+            return any(bool(np.any(run == item)) for run in self._runs())
+        return any(stored == item for stored in self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayDeque) or len(self) != len(other):
+            return False
+        return all(mine == theirs for mine, theirs in zip(self, other))
+
+    def clear(self) -> None:
+        if self._items.dtype == object:
+            self._items[:] = None
+        self._front = 0
+        self._count = 0
+
+    def __str__(self) -> str:
+        return f"({' <-> '.join(str(item) for item in self)})"
+
+    def __repr__(self) -> str:
+        return f"ArrayDeque{str(self)} Count: {self._count} Capacity: {len(self._items)}"
@@ -0,0 +1,65 @@
+import asyncio
+from typing import TypeVar
+
+from datastructures.circularqueue import CircularQueue
+
+T = TypeVar('T')
+
+class AsyncCircularQueue(CircularQueue[T]):
+    """ A fixed-size CircularQueue for asyncio producers and consumers. await put() suspends
+        while the queue is full, which gives producers backpressure, and await get() suspends
+        while it is empty. The inherited enqueue, dequeue, enqueue_many and dequeue_many do not
+        wake suspended tasks, so use put and get whenever another task may be waiting on the queue.
+    """
+
+    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+        ''' Initializes the AsyncCircularQueue object with a maxsize and data_type.
+
+            Arguments:
+                maxsize: The maximum size of the queue
+                data_type: The type of the elements in the queue
+        '''
+        super().__init__(maxsize=maxsize, data_type=data_type)
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    async def put(self, item: T, timeout: float | None = None) -> None:
+        ''' Adds an item to the rear of the queue, waiting for room if the queue is full.
+
+            Arguments:
+                item: The item to add
+                timeout: The most seconds to wait for room, or None to wait forever
+
+            Raises IndexError if the queue is still full when the timeout runs out.
+        '''
+        async with self._not_full:
+            if self.full:
+                try:
+                    await asyncio.wait_for(self._not_full.wait_for(lambda: not self.full), timeout)
+                except TimeoutError:
+                    raise IndexError("Queue is full") from None
+            super().enqueue(item)
+            self._not_empty.notify()
+
+    async def get(self, timeout: float | None = None) -> T:
+        ''' Removes and returns the item at the front of the queue, waiting for one if the queue is empty.
+
+            Arguments:
+                timeout: The most seconds to wait for an item, or None to wait forever
+
+            Raises IndexError if the queue is still empty when the timeout runs out.
+        '''
+        async with self._not_empty:
+            if self.empty:
+                try:
+                    await asyncio.wait_for(self._not_empty.wait_for(lambda: not self.empty), timeout)
+                except TimeoutError:
+                    raise IndexError("Queue is empty") from None
+            item = super().dequeue()
+            self._not_full.notify()
+            return item
+
+    def __repr__(self) -> str:
+        ''' Returns a developer string representation of the AsyncCircularQueue object '''
+        return f"AsyncCircularQueue(maxsize={self.maxsize}, data_type={self._data_type})"
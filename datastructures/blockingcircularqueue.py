@@ -0,0 +1,87 @@
+import threading
+from collections.abc import Iterable
+from typing import TypeVar
+
+from datastructures.array import Array
+from datastructures.circularqueue import CircularQueue
+
+T = TypeVar('T')
+
+class BlockingCircularQueue(CircularQueue[T]):
+    """ A fixed-size CircularQueue that can be shared between threads. put blocks while the
+        queue is full and get blocks while it is empty, both for at most timeout seconds.
+        enqueue and dequeue are the non-blocking forms and raise IndexError right away.
+    """
+
+    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+        ''' Initializes the BlockingCircularQueue object with a maxsize and data_type.
+
+            Arguments:
+                maxsize: The maximum size of the queue
+                data_type: The type of the elements in the queue
+        '''
+        super().__init__(maxsize=maxsize, data_type=data_type)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item: T, timeout: float | None = None) -> None:
+        ''' Adds an item to the rear of the queue, waiting for room if the queue is full.
+
+            Arguments:
+                item: The item to add
+                timeout: The most seconds to wait for room, or None to wait forever
+
+            Raises IndexError if the queue is still full when the timeout runs out.
+        '''
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: not self.full, timeout):
+                raise IndexError("Queue is full")
+            super().enqueue(item)
+            self._not_empty.notify()
+
+    def get(self, timeout: float | None = None) -> T:
+        ''' Removes and returns the item at the front of the queue, waiting for one if the queue is empty.
+
+            Arguments:
+                timeout: The most seconds to wait for an item, or None to wait forever
+
+            Raises IndexError if the queue is still empty when the timeout runs out.
+        '''
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self.empty, timeout):
+                raise IndexError("Queue is empty")
+            item = super().dequeue()
+            self._not_full.notify()
+            return item
+
+    def enqueue(self, item: T) -> None:
+        ''' Adds an item to the rear of the queue, raising IndexError if it is full '''
+        self.put(item, timeout=0)
+
+    def dequeue(self) -> T:
+        ''' Removes and returns the item at the front of the queue, raising IndexError if it is empty '''
+        return self.get(timeout=0)
+
+    def enqueue_many(self, items: Iterable[T]) -> None:
+        ''' Adds all items to the rear of the queue, raising IndexError right away if they do not all fit '''
+        with self._lock:
+            super().enqueue_many(items)
+            self._not_empty.notify_all()
+
+    def dequeue_many(self, count: int) -> Array[T]:
+        ''' Removes and returns up to count items from the front of the queue without waiting '''
+        with self._lock:
+            block = super().dequeue_many(count)
+            self._not_full.notify_all()
+            return block
+
+    def clear(self) -> None:
+        ''' Removes all items from the queue, waking any producers waiting for room '''
+        with self._lock:
+            super().clear()
+            self._not_full.notify_all()
+
+    def __repr__(self) -> str:
+        ''' Returns a developer string representation of the BlockingCircularQueue object '''
+        return f"BlockingCircularQueue(maxsize={self.maxsize}, data_type={self._data_type})"
@@ -1,7 +1,9 @@
+from collections.abc import Iterable, Sequence
 from typing import Any, TypeVar
 import numpy as np
+from numpy.typing import NDArray
 
-from datastructures.array import Array
+from datastructures.array import Array, _is_numeric
 from datastructures.iqueue import IQueue
 
 T = TypeVar('T')
@@ -11,39 +13,120 @@ class CircularQueue(IQueue[T]):
         is circular in the sense that the front and rear pointers wrap around the
         array when they reach the end. The queue is full when the rear pointer is
         one position behind the front pointer. The queue is empty when the front
-        and rear pointers are equal. This implementation uses a fixed-size array.
+        and rear pointers are equal. This implementation uses a fixed-size array,
+        unless the queue is created growable, in which case the array doubles
+        instead of the queue reporting itself as full.
     """
 
-    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+    def __init__(self, maxsize: int = 0, data_type=object, growable: bool = False) -> None:
         ''' Initializes the CircularQueue object with a maxsize and data_type.
         
             Arguments:
-                maxsize: The maximum size of the queue
+                maxsize: The maximum size of the queue (the initial size if growable)
                 data_type: The type of the elements in the queue
+                growable: If True, enqueueing into a full queue doubles its capacity instead of
+                    raising IndexError. The capacity is kept at a power of two.
         '''
-        starting_sequence = [data_type() for _ in range(maxsize + 1)]
+        capacity = maxsize + 1
+        if growable:
+            capacity = 2
+            while capacity < maxsize + 1:
+                capacity *= 2
+        starting_sequence = [data_type() for _ in range(capacity)]
         self.circularqueue = Array(starting_sequence=starting_sequence, data_type=data_type)
+        self._data_type = data_type
+        self._growable = growable
         self._front = 0
         self._rear = 0
+        self._set_capacity(capacity)
+
+    def _set_capacity(self, capacity: int) -> None:
+        # the ring is read and written through the Array's NumPy buffer directly: every index is
+        # already in range, so the per-access bounds checks of Array.__getitem__ are not needed
+        self._buffer: NDArray = self.circularqueue._items
+        self._capacity = capacity
+        # power-of-two capacities wrap with a bit mask instead of a modulo
+        self._mask = capacity - 1 if capacity & (capacity - 1) == 0 else 0
+
+    def _wrap(self, index: int) -> int:
+        return index & self._mask if self._mask else index % self._capacity
+
+    def _grow(self, min_capacity: int) -> None:
+        ''' Doubles the capacity until min_capacity slots fit, moving the items to the start
+            of the new buffer with at most two slice copies. '''
+        capacity = self._capacity
+        while capacity < min_capacity:
+            capacity *= 2
+        count = len(self)
+        new_items: NDArray = np.empty(capacity, dtype=self._buffer.dtype)
+        first_run = min(count, self._capacity - self._front)
+        new_items[:first_run] = self._buffer[self._front:self._front + first_run]
+        new_items[first_run:count] = self._buffer[:count - first_run]
+        self.circularqueue = Array._wrap(new_items, capacity, self._data_type)
+        self._front = 0
+        self._rear = count
+        self._set_capacity(capacity)
 
     def enqueue(self, item: T) -> None:
         ''' Adds an item to the rear of the queue '''
+        if not isinstance(item, self._data_type):
+            raise TypeError(f'Item must be of type {self._data_type.__name__}')
         if self.full:
-            raise IndexError("Queue is full")
-        self.circularqueue[self._rear] = item
-        self._rear = (self._rear + 1) % len(self.circularqueue)
+            if not self._growable:
+                raise IndexError("Queue is full")
+            self._grow(self._capacity * 2)
+        self._buffer[self._rear] = item
+        self._rear = self._wrap(self._rear + 1)
 
     def dequeue(self) -> T:
         ''' Removes and returns the item at the front of the queue '''
         if self.empty:
             raise IndexError("Queue is empty")
-        item = self.circularqueue[self._front]
-        self._front = (self._front + 1) % len(self.circularqueue)
+        item = self._buffer[self._front]
+        self._front = self._wrap(self._front + 1)
         return item
 
+    def _as_block(self, items: Iterable[T]) -> NDArray:
+        dtype = self._buffer.dtype
+        if _is_numeric(dtype):
+            block = np.asarray(items if isinstance(items, (Sequence, np.ndarray)) else list(items))
+            # like enqueue, refuse items of another kind (floats into an int queue, strings into
+            # a float queue) rather than letting the conversion truncate or fail with ValueError
+            if block.size and not np.can_cast(block.dtype, dtype, 'same_kind'):
+                raise TypeError(f'All items must be of type {self._data_type.__name__}')
+            return block.astype(dtype, copy=False)
+        items = list(items)
+        if not all(isinstance(item, self._data_type) for item in items):
+            raise TypeError(f'All items must be of type {self._data_type.__name__}')
+        return np.fromiter(items, dtype=dtype, count=len(items))
+
+    def enqueue_many(self, items: Iterable[T]) -> None:
+        ''' Adds all items to the rear of the queue with at most two slice copies into the buffer.
+            Nothing is enqueued if a fixed-size queue does not have room for every item. '''
+        block = self._as_block(items)
+        count = len(block)
+        if len(self) + count > self.maxsize:
+            if not self._growable:
+                raise IndexError("Queue is full")
+            self._grow(len(self) + count + 1)
+        first_run = min(count, self._capacity - self._rear)
+        self._buffer[self._rear:self._rear + first_run] = block[:first_run]
+        self._buffer[:count - first_run] = block[first_run:]
+        self._rear = self._wrap(self._rear + count)
+
+    def dequeue_many(self, count: int) -> Array[T]:
+        ''' Removes and returns up to count items from the front of the queue as an Array,
+            copied out of the buffer with at most two slices. '''
+        if count < 0:
+            raise ValueError("count must not be negative")
+        count = min(count, len(self))
+        first_run = min(count, self._capacity - self._front)
+        block = np.concatenate((self._buffer[self._front:self._front + first_run], self._buffer[:count - first_run]))
+        self._front = self._wrap(self._front + count)
+        return Array._wrap(block, count, self._data_type)
+
     def clear(self) -> None:
         ''' Removes all items from the queue '''
-        self.circularqueue = Array([None] * len(self.circularqueue))
         self._front = 0
         self._rear = 0
 
@@ -52,12 +135,12 @@ class CircularQueue(IQueue[T]):
         ''' Returns the item at the front of the queue without removing it '''
         if self.empty:
             raise IndexError("Queue is empty")
-        return self.circularqueue[self._front]
+        return self._buffer[self._front]
 
     @property
     def full(self) -> bool:
         ''' Returns True if the queue is full, False otherwise '''
-        return (self._rear + 1) % len(self.circularqueue) == self._front
+        return self._wrap(self._rear + 1) == self._front
 
     @property
     def empty(self) -> bool:
@@ -66,8 +149,11 @@ class CircularQueue(IQueue[T]):
     
     @property
     def maxsize(self) -> int:
-        ''' Returns the maximum size of the queue '''
-        return len(self.circularqueue) - 1
+        ''' Returns the maximum size of the queue (the current capacity if growable) '''
+        return self._capacity - 1
+
+    def _items_in_order(self) -> list[Any]:
+        return [self._buffer[self._wrap(self._front + i)] for i in range(len(self))]
 
     def __eq__(self, other: object) -> bool:
         ''' Returns True if this CircularQueue is equal to another object, False otherwise '''
@@ -78,23 +164,19 @@ class CircularQueue(IQueue[T]):
             return False
         
         for i in range(len(self)):
-            self_idx = (self._front + i) % len(self.circularqueue)
-            other_idx = (other._front + i) % len(other.circularqueue)
-            if self.circularqueue[self_idx] != other.circularqueue[other_idx]:
+            if self._buffer[self._wrap(self._front + i)] != other._buffer[other._wrap(other._front + i)]:
                 return False
         
         return True
 
     def __len__(self) -> int:
         ''' Returns the number of items in the queue '''
-        return (self._rear - self._front + len(self.circularqueue)) % len(self.circularqueue)
+        return self._wrap(self._rear - self._front + self._capacity)
 
     def __str__(self) -> str:
         ''' Returns a string representation of the CircularQueue showing just the values '''
         elements = []
-        for i in range(len(self)):
-            idx = (self._front + i) % len(self.circularqueue)
-            element = self.circularqueue[idx]
+        for element in self._items_in_order():
             if hasattr(element, 'item'):  # Handle numpy types
                 elements.append(str(element.item()))
             else:
@@ -103,4 +185,4 @@ class CircularQueue(IQueue[T]):
 
     def __repr__(self) -> str:
         ''' Returns a developer string representation of the CircularQueue object '''
-        return f"CircularQueue(maxsize={self.maxsize}, data_type={self.circularqueue.data_type})"
\ No newline at end of file
+        return f"CircularQueue(maxsize={self.maxsize}, data_type={self._data_type})"
@@ -0,0 +1,89 @@
+from enum import Enum
+import hashlib
+import pickle
+from typing import Any, Callable
+import weakref
+
+
+class HashStrategy(Enum):
+    ''' Selects how a HashMap turns keys into integers.
+
+        AUTO: builtin hash() for hashable keys, DIGEST as a fallback for unhashable ones.
+        BUILTIN: builtin hash() only; unhashable keys raise TypeError.
+        CACHED: builtin hash() remembered per key object in a side table owned by the map.
+            Only use it for keys that never change once they are in the map (frozen
+            dataclasses, value objects).
+        DIGEST: MD5 over the pickled key. Slow, but works for any picklable key.
+    '''
+    AUTO = 'auto'
+    BUILTIN = 'builtin'
+    CACHED = 'cached'
+    DIGEST = 'digest'
+
+
+def builtin_hash(key: Any) -> int:
+    return hash(key)
+
+
+def digest_hash(key: Any) -> int:
+    ''' Uses pickle to serialize the key (to capture the full object structure) and hashes the bytes
+        with MD5. Falls back to repr() if the object is not picklable (e.g. open file handles).
+    '''
+    try:
+        key_bytes = pickle.dumps(key)
+    except Exception:
+        key_bytes = repr(key).encode()
+    return int.from_bytes(hashlib.md5(key_bytes).digest(), 'big')
+
+
+def auto_hash(key: Any) -> int:
+    try:
+        return hash(key)
+    except TypeError:
+        return digest_hash(key)
+
+
+def make_cached_hash() -> Callable[[Any], int]:
+    ''' Returns a hash function that remembers each key's hash in its own table, keyed by id(key).
+        A weakref finalizer drops the entry when the key is collected, before its id can be reused.
+        The key itself is never modified, so its pickle (and so its DIGEST hash) stays the same.
+        Keys that cannot be weakly referenced (ints, strings, tuples) are hashed every time.
+    '''
+    hashes: dict[int, int] = {}
+
+    def cached_hash(key: Any) -> int:
+        key_id = id(key)
+        try:
+            return hashes[key_id]
+        except KeyError:
+            pass
+        value = auto_hash(key)
+        try:
+            weakref.finalize(key, hashes.pop, key_id, None)
+        except TypeError:
+            return value
+        hashes[key_id] = value
+        return value
+
+    return cached_hash
+
+
+cached_hash = make_cached_hash()
+
+
+_HASH_FUNCTIONS: dict[HashStrategy, Callable[[Any], int]] = {
+    HashStrategy.AUTO: auto_hash,
+    HashStrategy.BUILTIN: builtin_hash,
+    HashStrategy.CACHED: cached_hash,
+    HashStrategy.DIGEST: digest_hash,
+}
+
+
+def hash_function_for(strategy: HashStrategy | str) -> Callable[[Any], int]:
+    ''' Returns the hash function for a HashStrategy or its string value ('auto', 'digest', ...).
+        CACHED gets a new function, with its own table, on every call.
+    '''
+    strategy = HashStrategy(strategy)
+    if strategy is HashStrategy.CACHED:
+        return make_cached_hash()
+    return _HASH_FUNCTIONS[strategy]
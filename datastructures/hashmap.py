@@ -1,117 +1,304 @@
 import copy
-from typing import Callable, Iterator, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple
 from datastructures.ihashmap import KT, VT, IHashMap
 from datastructures.array import Array
-import pickle
-import hashlib
+from datastructures.hashengine import HashStrategy, hash_function_for
 
-from datastructures.linkedlist import LinkedList
+from datastructures.linkedlist import LinkedList, Node
+
+_MISSING: Any = object()
 
 class HashMap(IHashMap[KT, VT]):
 
-    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
-        self._buckets: Array[LinkedList[Tuple[KT,VT]]] = \
-        Array(starting_sequence = [LinkedList(data_type= tuple) for _ in range(number_of_buckets)], data_type= LinkedList)
+    # old buckets migrated by every keyed operation while an incremental rehash is in progress
+    _REHASH_STEP = 4
+
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None,
+                 hash_strategy: HashStrategy | str=HashStrategy.AUTO, shrink: bool=False) -> None:
+        self._buckets: Array[LinkedList[Tuple[KT,VT]]] = self._new_buckets(number_of_buckets)
         self.count: int = 0
         self._load_factor_threshold: float = load_factor
-        self._hash_function = custom_hash_function or self._default_hash_function
+        self._hash_function = custom_hash_function or hash_function_for(hash_strategy)
+        self._initial_number_of_buckets: int = number_of_buckets
+        self._shrink: bool = shrink
+        # while rehashing, chains not yet moved into _buckets; old buckets before _rehash_index are empty
+        self._old_buckets: Optional[Array[LinkedList[Tuple[KT,VT]]]] = None
+        self._rehash_index: int = 0
+        self._rehash_count: int = 0
+
+    @staticmethod
+    def _new_buckets(number_of_buckets: int) -> Array[LinkedList[Tuple[KT,VT]]]:
+        return Array(starting_sequence = [LinkedList(data_type= tuple) for _ in range(number_of_buckets)], data_type= LinkedList)
+
+    @property
+    def capacity(self) -> int:
+        ''' Number of buckets in the current table (the target table while rehashing). '''
+        return len(self._buckets)
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / len(self._buckets)
+
+    @property
+    def rehash_count(self) -> int:
+        ''' Number of times the bucket array has been resized. '''
+        return self._rehash_count
 
     def _get_bucket_number(self,key: KT) -> int:
-        return self._default_hash_function(key) %  len(self._buckets)
+        return self._hash_function(key) %  len(self._buckets)
+
+    def _get_bucket(self, key: KT) -> LinkedList[Tuple[KT,VT]]:
+        ''' Returns the chain that holds key. While rehashing, the old chain the key hashes to is
+            migrated first so the key only ever has to be looked for in the current table. '''
+        key_hash: int = self._hash_function(key)
+        if self._old_buckets is not None:
+            self._migrate_bucket(key_hash % len(self._old_buckets))
+            self._rehash_step()
+        return self._buckets[key_hash % len(self._buckets)]
+
+    def _migrate_bucket(self, bucket_index: int) -> None:
+        old_chain: LinkedList[tuple] = self._old_buckets[bucket_index]
+        while not old_chain.empty:
+            key, value = old_chain.pop_front()
+            self._buckets[self._get_bucket_number(key)].append((key, value))
+
+    def _rehash_step(self) -> None:
+        for _ in range(self._REHASH_STEP):
+            self._migrate_bucket(self._rehash_index)
+            self._rehash_index += 1
+            if self._rehash_index == len(self._old_buckets):
+                self._old_buckets = None
+                return
+
+    def _finish_rehash(self) -> None:
+        while self._old_buckets is not None:
+            self._rehash_step()
+
+    def _start_rehash(self, number_of_buckets: int) -> None:
+        ''' Swaps in an empty table; the entries move over a few chains at a time on later operations. '''
+        self._finish_rehash()
+        self._old_buckets = self._buckets
+        self._buckets = self._new_buckets(number_of_buckets)
+        self._rehash_index = 0
+        self._rehash_count += 1
+
+    def _resize_if_needed(self) -> None:
+        number_of_buckets = len(self._buckets)
+        if self.count > self._load_factor_threshold * number_of_buckets:
+            # a batch insert can overshoot the threshold by more than one doubling
+            while self.count > self._load_factor_threshold * number_of_buckets:
+                number_of_buckets = number_of_buckets * 2 + 1
+            self._start_rehash(number_of_buckets)
+        elif self._shrink and number_of_buckets > self._initial_number_of_buckets \
+                and self.count < self._load_factor_threshold / 4 * number_of_buckets:
+            self._start_rehash(max(self._initial_number_of_buckets, number_of_buckets // 2))
+
+    def _group_by_bucket(self, keys: Iterable[KT]) -> dict[int, list[Tuple[int, KT]]]:
+        ''' Hashes every key once and groups (position, key) pairs by the bucket they land in,
+            migrating old chains exactly as _get_bucket does for single-key operations. '''
+        groups: dict[int, list[Tuple[int, KT]]] = {}
+        for position, key in enumerate(keys):
+            key_hash: int = self._hash_function(key)
+            if self._old_buckets is not None:
+                self._migrate_bucket(key_hash % len(self._old_buckets))
+                self._rehash_step()
+            groups.setdefault(key_hash % len(self._buckets), []).append((position, key))
+        return groups
+
+    @staticmethod
+    def _scan_chain(bucket_chains: LinkedList[tuple], pending: list[Tuple[int, KT]]) -> list[Tuple[Node[tuple], list[int]]]:
+        ''' Walks a chain once and returns (node, positions) for every node whose key matches some of
+            the pending (position, key) pairs, stopping as soon as every pending key has been matched.
+            Hashable keys are matched through a dictionary; unhashable ones are compared one by one. '''
+        matches: list[Tuple[Node[tuple], list[int]]] = []
+        try:
+            wanted: dict[Any, list[int]] = {}
+            for position, key in pending:
+                wanted.setdefault(key, []).append(position)
+        except TypeError:
+            for node in bucket_chains.nodes():
+                positions = [position for position, key in pending if node.value[0] == key]
+                if positions:
+                    matches.append((node, positions))
+                    pending = [(position, key) for position, key in pending if not node.value[0] == key]
+                    if not pending:
+                        break
+            return matches
+
+        for node in bucket_chains.nodes():
+            try:
+                positions = wanted.pop(node.value[0], None)
+            except TypeError:
+                positions = next((wanted.pop(key) for key in list(wanted) if node.value[0] == key), None)
+            if positions is not None:
+                matches.append((node, positions))
+                if not wanted:
+                    break
+        return matches
+
+    def get_many(self, keys: Iterable[KT], default: Any=_MISSING) -> list[VT]:
+        ''' Returns the values for keys in order, traversing each chain once per batch.
+
+            Raises:
+                KeyError: if a key is missing and no default is given.
+        '''
+        keys = list(keys)
+        values: list[Any] = [_MISSING] * len(keys)
+        for bucket_index, pending in self._group_by_bucket(keys).items():
+            for node, positions in self._scan_chain(self._buckets[bucket_index], pending):
+                for position in positions:
+                    values[position] = node.value[1]
+        for position, value in enumerate(values):
+            if value is _MISSING:
+                if default is _MISSING:
+                    raise KeyError(f'Key {keys[position]} does not exist in HashMap')
+                values[position] = default
+        return values
+
+    def set_many(self, items: Iterable[Tuple[KT, VT]]) -> None:
+        ''' Sets every (key, value) pair, traversing each chain once per batch.
+            When a key appears more than once in items the last value wins. '''
+        items = list(items)
+        groups = self._group_by_bucket(key for key, _ in items)
+        for bucket_index, pending in groups.items():
+            bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
+            updated: set[int] = set()
+            for node, positions in self._scan_chain(bucket_chains, pending):
+                bucket_chains.replace_node_value(node, items[positions[-1]])
+                updated.update(positions)
+            new_items: list[Tuple[KT, VT]] = []
+            for position, key in pending:
+                if position in updated:
+                    continue
+                for i, (k, _) in enumerate(new_items):
+                    if k == key:
+                        new_items[i] = items[position]
+                        break
+                else:
+                    new_items.append(items[position])
+            for item in new_items:
+                bucket_chains.append(item)
+            self.count += len(new_items)
+        self._resize_if_needed()
+
+    def update(self, other: Mapping[KT, VT] | Iterable[Tuple[KT, VT]]) -> None:
+        ''' Sets every item of a mapping (or iterable of (key, value) pairs) in one batch. '''
+        self.set_many(other.items() if isinstance(other, Mapping) else other)
+
+    def delete_many(self, keys: Iterable[KT]) -> int:
+        ''' Deletes every key present in the map, traversing each chain once per batch.
+            Keys that are not present are ignored.
+
+            Returns:
+                the number of items removed.
+        '''
+        removed = 0
+        for bucket_index, pending in self._group_by_bucket(keys).items():
+            bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
+            for node, _ in self._scan_chain(bucket_chains, pending):
+                bucket_chains.remove_node(node)
+                removed += 1
+        self.count -= removed
+        self._resize_if_needed()
+        return removed
+
+    def _chains(self) -> Iterator[LinkedList[Tuple[KT,VT]]]:
+        # lookups migrate old chains into the new table, so a lookup made while iterating both
+        # tables would move entries ahead of the iterator; finish the rehash before iterating
+        self._finish_rehash()
+        yield from self._buckets
+
+    @staticmethod
+    def _find_node(bucket_chains: LinkedList[Tuple[KT,VT]], key: KT) -> Optional[Node[Tuple[KT,VT]]]:
+        for node in bucket_chains.nodes():
+            if node.value[0] == key:
+                return node
+        return None
 
     def __getitem__(self, key: KT) -> VT:
-        bucket_index: int = self._get_bucket_number(key)
-        bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
-        for (k,v) in bucket_chains:
-            if k == key:
-                return v
-        raise KeyError('Key does not exist in HashMap')
+        node = self._find_node(self._get_bucket(key), key)
+        if node is None:
+            raise KeyError('Key does not exist in HashMap')
+        return node.value[1]
 
     def __setitem__(self, key: KT, value: VT) -> None:        
-        bucket_index: int = self._get_bucket_number(key)
-        bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
-        for node in bucket_chains: # in the linkedlist
-            k, v = node
-            if k == key:
-                bucket_chains.remove(node) # remove current node (no item assignment)
-                bucket_chains.append((key, value)) # reset
-                self.count += 1
-                return
+        bucket_chains: LinkedList[tuple] = self._get_bucket(key)
+        node = self._find_node(bucket_chains, key)
+        if node is not None:
+            bucket_chains.replace_node_value(node, (key, value))
+            return
         bucket_chains.append((key, value)) # otherwise add to the end
         self.count += 1
+        self._resize_if_needed()
+
+    def get(self, key: KT, default: Optional[VT]=None) -> Optional[VT]:
+        node = self._find_node(self._get_bucket(key), key)
+        return default if node is None else node.value[1]
+
+    def setdefault(self, key: KT, default: Optional[VT]=None) -> Optional[VT]:
+        ''' Returns the value for key, first inserting default if the key is missing. '''
+        bucket_chains: LinkedList[tuple] = self._get_bucket(key)
+        node = self._find_node(bucket_chains, key)
+        if node is not None:
+            return node.value[1]
+        bucket_chains.append((key, default))
+        self.count += 1
+        self._resize_if_needed()
+        return default
+
+    def pop(self, key: KT, default: Any=_MISSING) -> VT:
+        ''' Removes key and returns its value, or returns default if the key is missing.
+
+            Raises:
+                KeyError: if the key is missing and no default is given.
+        '''
+        bucket_chains: LinkedList[tuple] = self._get_bucket(key)
+        node = self._find_node(bucket_chains, key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError('Key is not in HashMap')
+            return default
+        value: VT = node.value[1]
+        bucket_chains.remove_node(node)
+        self.count -= 1
+        self._resize_if_needed()
+        return value
 
     def keys(self) -> Iterator[KT]:
-        for bucket in self._buckets:
+        for bucket in self._chains():
             for (k,v) in bucket:
                 yield k
     
     def values(self) -> Iterator[VT]:
-       for bucket in self._buckets:
+       for bucket in self._chains():
             for (k,v) in bucket:
                 yield v
 
     def items(self) -> Iterator[Tuple[KT, VT]]:
-        for bucket in self._buckets:
+        for bucket in self._chains():
             for (k,v) in bucket:
                 yield (k,v)
             
     def __delitem__(self, key: KT) -> None:
-        bucket_index: int = self._get_bucket_number(key)
-        bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
-        for node in bucket_chains: # in the linkedlist
-            k, v = node
-            if k == key:
-                bucket_chains.remove(node)
-                self.count -=1
-                return
-        raise KeyError('Key is not in HashMap')
+        self.pop(key)
 
-    
     def __contains__(self, key: KT) -> bool:
-        bucket_index: int = self._get_bucket_number(key)
-        bucket_chains: LinkedList[tuple] = self._buckets[bucket_index]
-        for (k, _) in bucket_chains:
-            if k == key:
-                return True
-        return False
+        return self._find_node(self._get_bucket(key), key) is not None
     
     def __len__(self) -> int:
         return self.count
     
     def __iter__(self) -> Iterator[KT]:
-        for bucket in self._buckets:
-            for (k,v) in bucket:
-                yield k
+        return self.keys()
     
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, HashMap):
+        # bucket layouts depend on insertion and resize history, so compare entries instead
+        if not isinstance(other, HashMap) or len(self) != len(other):
             return False
-        return self._buckets == other._buckets
+        return all(other.get(key, _MISSING) == value for key, value in self.items())
 
     def __str__(self) -> str:
         return "{" + ", ".join(f"{key}: {value}" for key, value in self) + "}"
     
     def __repr__(self) -> str:
         return f"HashMap({str(self)})"
-
-    @staticmethod
-    def _default_hash_function(key: KT) -> int:
-        """
-        Default hash function for the HashMap.
-        Uses Pickle to serialize the key and then hashes it using SHA-256. 
-        Uses pickle for serialization (to capture full object structure).
-        Falls back to repr() if the object is not pickleable (e.g., open file handles, certain C extensions).
-        Returns a consistent integer hash.
-        Warning: This method is not suitable
-        for keys that are not hashable or have mutable state.
-
-        Args:
-            key (KT): The key to hash.
-        Returns:
-            int: The hash value of the key.
-        """
-        try:
-            key_bytes = pickle.dumps(key)
-        except Exception:
-            key_bytes = repr(key).encode()
-        return int(hashlib.md5(key_bytes).hexdigest(), 16)
\ No newline at end of file
@@ -2,7 +2,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import abc
 import os
-from typing import Sequence, TypeVar
+from typing import Iterator, Sequence, TypeVar
 
 T = TypeVar('T')
 
@@ -479,22 +479,25 @@ class ILinkedList[T](abc.ABC):
         ...
 
     @abstractmethod
-    def __reversed__(self) -> ILinkedList[T]:
+    def __reversed__(self) -> Iterator[T]:
 
-        ''' Returns a reversed version of the list
+        ''' Returns an iterator over the items of the list from the tail to the head.
+            The list itself is not changed or copied.
         
             Examples:
                 >>> linked_list = LinkedList(data_type=str)
                 >>> linked_list.append('dog')
                 >>> linked_list.append('cat')
                 >>> linked_list.append('mouse')
-                >>> reversed_list = reversed(linked_list)
-                >>> print(reversed_list)
-                (mouse <-> cat <-> dog)
+                >>> for item in reversed(linked_list):
+                ...     print(item)
+                mouse
+                cat
+                dog
                 
 
             Returns:
-                A reversed version of the list
+                An iterator over the items in reverse order
         '''
         ...
         
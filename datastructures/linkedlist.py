@@ -1,21 +1,34 @@
-from typing import TypeVar, Generic, Optional, Sequence
+from typing import Iterator, TypeVar, Generic, Optional, Sequence
 from datastructures.ilinkedlist import ILinkedList
 
 T = TypeVar('T')
 
 class Node(Generic[T]):
+    # no per-instance __dict__: every HashMap bucket, Deque and ListStack entry is a Node
+    __slots__ = ('value', 'prev', 'next')
+
     def __init__(self, value: T, prev: Optional['Node[T]'] = None, next: Optional['Node[T]'] = None):
         self.value = value
         self.prev = prev
         self.next = next
 
 class LinkedList(ILinkedList[T]):
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, node_pool_size: int = 0) -> None:
+        ''' Arguments:
+                data_type: The type of the elements in the list
+                node_pool_size: How many removed nodes to keep for reuse by later inserts (0 disables
+                    pooling). Nodes handed out by nodes() must not be used after they are removed.
+        '''
         self._data_type = data_type
         self._head: Optional[Node[T]] = None
         self._tail: Optional[Node[T]] = None
         self._size = 0
-        self._iter_node = None
+        # cursor used only when next() is called on the list itself; iter() gets its own traversal
+        self._cursor: Optional[Iterator[T]] = None
+        # free list of removed nodes, chained through their next pointers
+        self._free_nodes: Optional[Node[T]] = None
+        self._free_node_count = 0
+        self._node_pool_size = node_pool_size
 
     @staticmethod
     def from_sequence(sequence: Sequence[T], data_type: type = object) -> 'LinkedList[T]':
@@ -28,7 +41,7 @@ class LinkedList(ILinkedList[T]):
 
     def append(self, item: T) -> None:
         self._check_type(item)
-        new_node = Node(item, self._tail)
+        new_node = self._new_node(item, self._tail, None)
         if self._tail:
             self._tail.next = new_node
         else:
@@ -38,7 +51,7 @@ class LinkedList(ILinkedList[T]):
 
     def prepend(self, item: T) -> None:
         self._check_type(item)
-        new_node = Node(item, None, self._head)
+        new_node = self._new_node(item, None, self._head)
         if self._head:
             self._head.prev = new_node
         else:
@@ -52,7 +65,7 @@ class LinkedList(ILinkedList[T]):
         node = self._find(target)
         if node is None:
             raise ValueError("Target not found.")
-        new_node = Node(item, node.prev, node)
+        new_node = self._new_node(item, node.prev, node)
         if node.prev:
             node.prev.next = new_node
         else:
@@ -66,7 +79,7 @@ class LinkedList(ILinkedList[T]):
         node = self._find(target)
         if node is None:
             raise ValueError("Target not found.")
-        new_node = Node(item, node, node.next)
+        new_node = self._new_node(item, node, node.next)
         if node.next:
             node.next.prev = new_node
         else:
@@ -90,6 +103,24 @@ class LinkedList(ILinkedList[T]):
                 self._remove_node(node)
             node = next_node
 
+    def nodes(self) -> Iterator[Node[T]]:
+        ''' Yields the nodes from head to tail, so a caller can update or unlink the node it
+            was looking for without searching the list a second time. The yielded node may be
+            removed before the next one is requested. '''
+        node = self._head
+        while node:
+            next_node = node.next
+            yield node
+            node = next_node
+
+    def replace_node_value(self, node: Node[T], item: T) -> None:
+        self._check_type(item)
+        node.value = item
+
+    def remove_node(self, node: Node[T]) -> None:
+        ''' Unlinks a node obtained from nodes() in O(1). '''
+        self._remove_node(node)
+
     def pop(self) -> T:
         if self.empty:
             raise IndexError("Pop from empty list.")
@@ -136,29 +167,34 @@ class LinkedList(ILinkedList[T]):
     def __contains__(self, item: T) -> bool:
         return self._find(item) is not None
 
-    def __iter__(self) -> 'LinkedList[T]':
-        self._iter_node = self._head
-        return self
+    def __iter__(self) -> Iterator[T]:
+        # every traversal owns its cursor, so nested and concurrent iterations don't interfere
+        node = self._head
+        while node:
+            next_node = node.next
+            yield node.value
+            node = next_node
 
     def __next__(self) -> T:
-        if self._iter_node is None:
-            raise StopIteration
-        value = self._iter_node.value
-        self._iter_node = self._iter_node.next
-        return value
+        if self._cursor is None:
+            self._cursor = iter(self)
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            self._cursor = None
+            raise
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, LinkedList):
+        if not isinstance(other, LinkedList) or len(self) != len(other):
             return False
-        return list(self) == list(other)
+        return all(mine == theirs for mine, theirs in zip(self, other))
 
-    def __reversed__(self) -> 'LinkedList[T]':
-        new_list = LinkedList(self._data_type)
+    def __reversed__(self) -> Iterator[T]:
         node = self._tail
         while node:
-            new_list.append(node.value)
-            node = node.prev
-        return new_list
+            prev_node = node.prev
+            yield node.value
+            node = prev_node
 
     def _find(self, item: T) -> Optional[Node[T]]:
         node = self._head
@@ -168,6 +204,17 @@ class LinkedList(ILinkedList[T]):
             node = node.next
         return None
 
+    def _new_node(self, value: T, prev: Optional[Node[T]], next: Optional[Node[T]]) -> Node[T]:
+        node = self._free_nodes
+        if node is None:
+            return Node(value, prev, next)
+        self._free_nodes = node.next
+        self._free_node_count -= 1
+        node.value = value
+        node.prev = prev
+        node.next = next
+        return node
+
     def _remove_node(self, node: Node[T]) -> None:
         if node.prev:
             node.prev.next = node.next
@@ -178,6 +225,12 @@ class LinkedList(ILinkedList[T]):
         else:
             self._tail = node.prev
         self._size -= 1
+        if self._free_node_count < self._node_pool_size:
+            node.value = None
+            node.prev = None
+            node.next = self._free_nodes
+            self._free_nodes = node
+            self._free_node_count += 1
 
     def _check_type(self, item: T):
         if not isinstance(item, self._data_type):
@@ -0,0 +1,170 @@
+from __future__ import annotations
+import ast
+import math
+import os
+import struct
+from typing import Any, Optional
+
+import numpy as np
+
+from datastructures.array import Array, ResizePolicy
+
+# file layout: a fixed-size header, then the buffer (capacity items of the dtype); the live
+# items are _item_count items starting at _head, exactly as in memory
+_MAGIC = b'DSARRAY1'
+_HEADER = struct.Struct('<8sqqqH')
+_HEADER_SIZE = 256
+# the file grows by whole chunks, so appends remap it once per chunk rather than per doubling of tiny arrays
+_CHUNK_BYTES = 1 << 20
+# shrinking a mapped file is left to compact(): other mappings of the old size may still be in use
+MAPPED_RESIZE_POLICY = ResizePolicy(shrink_threshold=0)
+
+
+def _data_type_for(dtype: np.dtype) -> type:
+    # the Python type of the items, as Array uses it for type checks (float rather than np.float64)
+    return type(dtype.type(0).item()) if dtype.kind in 'biufc' else object
+
+
+def write_header(file: Any, item_count: int, head: int, capacity: int, dtype: np.dtype) -> None:
+    ''' Writes the header at the start of an open binary file. '''
+    descr = repr(np.lib.format.dtype_to_descr(dtype)).encode('ascii')
+    if _HEADER.size + len(descr) > _HEADER_SIZE:
+        raise ValueError('dtype description is too long for the array header.')
+    file.seek(0)
+    file.write(_HEADER.pack(_MAGIC, item_count, head, capacity, len(descr)) + descr)
+
+
+def read_header(path: str | os.PathLike) -> tuple[int, int, int, np.dtype]:
+    ''' Returns (item_count, head, capacity, dtype) from the header of an array file. '''
+    with open(path, 'rb') as file:
+        header = file.read(_HEADER_SIZE)
+    if len(header) < _HEADER.size:
+        raise ValueError(f'{path} is not an array file.')
+    magic, item_count, head, capacity, descr_length = _HEADER.unpack_from(header)
+    if magic != _MAGIC:
+        raise ValueError(f'{path} is not an array file.')
+    descr = header[_HEADER.size:_HEADER.size + descr_length].decode('ascii')
+    return item_count, head, capacity, np.lib.format.descr_to_dtype(ast.literal_eval(descr))
+
+
+def save(array: Array, path: str | os.PathLike) -> None:
+    ''' Writes the live items of array to path in the format MappedArray.open maps. '''
+    items = array._live()
+    if items.dtype.hasobject:
+        raise TypeError('Only arrays of fixed-size NumPy types can be saved.')
+    with open(path, 'wb') as file:
+        write_header(file, len(items), 0, len(items), items.dtype)
+        file.seek(_HEADER_SIZE)
+        items.tofile(file)
+
+
+class MappedArray(Array):
+    """ An Array whose buffer is a np.memmap of a file, so it can be larger than memory, is paged
+        in on demand, and is reopened after a restart by mapping the file instead of reloading it.
+        The header records the item count, head offset, capacity and dtype; flush() (or close())
+        writes it back. Growing the buffer extends the file in chunks and remaps it.
+    """
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, data_type: Optional[type]=None, mode: str='r+',
+             policy: ResizePolicy=MAPPED_RESIZE_POLICY) -> MappedArray:
+        ''' Maps an array file.
+
+            Arguments:
+                path: the file to map
+                data_type: the item type; required when creating, checked against the file otherwise
+                mode: 'r' to map read-only, 'r+' to map an existing file for writing, 'w+' to create
+                    (or overwrite) an empty array file
+                policy: how the buffer grows; files are only shrunk by compact() by default
+        '''
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("mode must be 'r', 'r+' or 'w+'.")
+        if mode == 'w+':
+            if data_type is None:
+                raise ValueError('data_type is required to create an array file.')
+            dtype = np.dtype(data_type)
+            if dtype.hasobject:
+                raise TypeError('Only fixed-size NumPy types can be memory-mapped.')
+            item_count, head, capacity = 0, 0, cls._chunk_items(dtype)
+            with open(path, 'wb') as file:
+                write_header(file, item_count, head, capacity, dtype)
+                file.truncate(_HEADER_SIZE + capacity * dtype.itemsize)
+        else:
+            item_count, head, capacity, dtype = read_header(path)
+            if data_type is not None and np.dtype(data_type) != dtype:
+                raise TypeError(f'{path} holds {dtype} items, not {np.dtype(data_type)}.')
+            if os.path.getsize(path) < _HEADER_SIZE + capacity * dtype.itemsize:
+                raise ValueError(f'{path} is shorter than its header says.')
+        array = cls.__new__(cls)
+        array._path = os.fspath(path)
+        array._mode = mode
+        items = np.memmap(path, dtype=dtype, mode=mode if mode == 'r' else 'r+', offset=_HEADER_SIZE, shape=(capacity,))
+        array._set_buffer(items, item_count, _data_type_for(dtype), policy)
+        array._head = head
+        return array
+
+    @staticmethod
+    def _chunk_items(dtype: np.dtype) -> int:
+        return max(1, _CHUNK_BYTES // dtype.itemsize)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _resize(self, new_size: int, head: int = 0) -> None:
+        ''' Resizes the file to new_size items (rounded up to whole chunks when growing) and remaps it. '''
+        if self._mode == 'r':
+            raise ValueError('Cannot resize an array mapped read-only.')
+        dtype = self._items.dtype
+        capacity = len(self._items)
+        if new_size > capacity:
+            chunk = self._chunk_items(dtype)
+            # the rounding adds spare slots at the back; the file grows at its end, so the items
+            # stay where they are unless the caller asked for a new head
+            new_size = math.ceil(new_size / chunk) * chunk
+        else:
+            # shrinking cuts off the end of the file; move the items to head first and drop the
+            # views, which would otherwise point past the end of the new file
+            if self._views:
+                self._detach_views()
+            self._move_to(head)
+        self._items.flush()
+        self._items = None
+        with open(self._path, 'r+b') as file:
+            file.truncate(_HEADER_SIZE + new_size * dtype.itemsize)
+        self._items = np.memmap(self._path, dtype=dtype, mode='r+', offset=_HEADER_SIZE, shape=(new_size,))
+        if head != self._head:
+            self._move_to(head)
+        self.flush()
+
+    def flush(self) -> None:
+        ''' Writes the header and any changed items to the file. '''
+        if self._mode == 'r':
+            return
+        self._items.flush()
+        with open(self._path, 'r+b') as file:
+            write_header(file, self._item_count, self._head, len(self._items), self._items.dtype)
+
+    def close(self) -> None:
+        ''' Flushes the array and releases its mapping. The array cannot be used afterwards. '''
+        self.flush()
+        if self._views:
+            self._detach_views()
+        self._items = None
+
+    def __enter__(self) -> MappedArray:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def copy(self) -> Array:
+        ''' Returns the items as an ordinary in-memory Array. '''
+        return Array._wrap(np.array(self._live()), self._item_count, self._data_type, self._policy)
+
+    def __reduce__(self) -> tuple:
+        # copies and pickles of a mapped array are ordinary in-memory Arrays
+        return Array._wrap, (np.array(self._live()), self._item_count, self._data_type, self._policy)
+
+    def __repr__(self) -> str:
+        return f'MappedArray(path: {self._path!r}, logical size: {self._item_count}, physical size: {len(self._items)}, items: {self})'
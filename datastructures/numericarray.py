@@ -0,0 +1,188 @@
+from __future__ import annotations
+from collections.abc import Sequence
+import numbers
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import Array, ArrayView, DEFAULT_RESIZE_POLICY, ResizePolicy, _is_numeric
+
+
+def _binary(operation: Callable[[Any, Any], NDArray]) -> Callable[[NumericArray, Any], Any]:
+    def operator(self: NumericArray, other: Any) -> Any:
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        return self._result(operation(self._live(), operand))
+    return operator
+
+
+def _reflected(operation: Callable[[Any, Any], NDArray]) -> Callable[[NumericArray, Any], Any]:
+    def operator(self: NumericArray, other: Any) -> Any:
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        return self._result(operation(operand, self._live()))
+    return operator
+
+
+class NumericArray(Array):
+    """ An Array of numbers (bool, int, float or complex) that works on its live items with NumPy:
+        reductions, sorting, cumulative sums, elementwise arithmetic, comparisons that return boolean
+        masks, and indexing with a mask (or an array of indices). Elementwise results are new
+        NumericArrays; IntArray and FloatArray are the int and float specializations.
+    """
+
+    def __init__(self, starting_sequence: Sequence[Any] | NDArray=(), data_type: type=float,
+                 policy: ResizePolicy=DEFAULT_RESIZE_POLICY) -> None:
+        if not _is_numeric(data_type):
+            raise TypeError(f'{type(self).__name__} needs a numeric data type, not {data_type.__name__}.')
+        if isinstance(starting_sequence, np.ndarray):
+            if not np.can_cast(starting_sequence.dtype, data_type, 'same_kind'):
+                raise TypeError(f'Cannot store {starting_sequence.dtype} items as {data_type.__name__}.')
+        elif not isinstance(starting_sequence, Sequence):
+            raise ValueError('Sequence must be a valid sequence type.')
+        self._data_type = data_type
+        if not isinstance(starting_sequence, np.ndarray) and not all(self._accepts(item) for item in starting_sequence):
+            raise TypeError(f'All items in {starting_sequence} must be of the same type: {data_type}')
+        items = np.array(starting_sequence, dtype=data_type)
+        if items.ndim != 1:
+            raise ValueError('Sequence must be one-dimensional.')
+        self._set_buffer(items, len(items), data_type, policy)
+
+    def _accepts(self, item: Any) -> bool:
+        # any number NumPy can store without changing its kind, including NumPy scalars
+        kind = np.dtype(self._data_type).kind
+        if kind == 'b':
+            return isinstance(item, (bool, np.bool_))
+        if kind in 'iu':
+            return isinstance(item, numbers.Integral)
+        if kind == 'f':
+            return isinstance(item, numbers.Real)
+        return isinstance(item, numbers.Number)
+
+    def _operand(self, other: Any) -> Any:
+        if isinstance(other, (Array, ArrayView)):
+            other = other._live()
+        elif isinstance(other, numbers.Number):
+            return other
+        elif not isinstance(other, np.ndarray):
+            return NotImplemented
+        if not _is_numeric(other.dtype):
+            return NotImplemented
+        if other.shape != (self._item_count,):
+            raise ValueError(f'Operands have different lengths: {self._item_count} and {len(other)}.')
+        return other
+
+    def _result(self, items: NDArray) -> NumericArray:
+        kind = items.dtype.kind
+        cls = IntArray if kind in 'iu' else FloatArray if kind == 'f' else NumericArray
+        return cls._wrap(items, len(items), type(items.dtype.type(0).item()), self._policy)
+
+    def __getitem__(self, index: Any) -> Any:
+        ''' Besides ints and slices, accepts a boolean mask of the same length (selecting the items
+            where it is True) or an array of indices, and returns the selected items as a new array. '''
+        if isinstance(index, (Array, ArrayView, np.ndarray)):
+            selector = np.asarray(index)
+            if selector.dtype.kind not in 'biu':
+                raise TypeError('Index arrays must hold bools or ints.')
+            return self._result(self._live()[selector])
+        return super().__getitem__(index)
+
+    def sum(self) -> Any:
+        return self._live().sum().item()
+
+    def min(self) -> Any:
+        if self._item_count == 0:
+            raise ValueError('min() of an empty array.')
+        return self._live().min().item()
+
+    def max(self) -> Any:
+        if self._item_count == 0:
+            raise ValueError('max() of an empty array.')
+        return self._live().max().item()
+
+    def mean(self) -> float:
+        if self._item_count == 0:
+            raise ValueError('mean() of an empty array.')
+        return self._live().mean().item()
+
+    def argsort(self) -> IntArray:
+        ''' Returns the indices that would sort the items (stable). '''
+        indices = self._live().argsort(kind='stable')
+        return IntArray._wrap(indices, len(indices), int, self._policy)
+
+    def sort(self, reverse: bool=False) -> None:
+        ''' Sorts the items in place. '''
+        if self._views:
+            self._detach_views()
+        items = self._live()
+        items.sort(kind='stable')
+        if reverse:
+            items[:] = items[::-1]
+
+    def cumsum(self) -> NumericArray:
+        return self._result(self._live().cumsum())
+
+    def equal(self, other: Any) -> NumericArray:
+        ''' Returns the mask of items equal to other (== itself compares whole arrays). '''
+        return _binary(np.equal)(self, other)
+
+    def not_equal(self, other: Any) -> NumericArray:
+        ''' Returns the mask of items not equal to other. '''
+        return _binary(np.not_equal)(self, other)
+
+    __add__ = _binary(np.add)
+    __radd__ = _reflected(np.add)
+    __sub__ = _binary(np.subtract)
+    __rsub__ = _reflected(np.subtract)
+    __mul__ = _binary(np.multiply)
+    __rmul__ = _reflected(np.multiply)
+    __truediv__ = _binary(np.true_divide)
+    __rtruediv__ = _reflected(np.true_divide)
+    __floordiv__ = _binary(np.floor_divide)
+    __rfloordiv__ = _reflected(np.floor_divide)
+    __mod__ = _binary(np.mod)
+    __rmod__ = _reflected(np.mod)
+    __pow__ = _binary(np.power)
+    __rpow__ = _reflected(np.power)
+    __lt__ = _binary(np.less)
+    __le__ = _binary(np.less_equal)
+    __gt__ = _binary(np.greater)
+    __ge__ = _binary(np.greater_equal)
+    __and__ = _binary(np.bitwise_and)
+    __or__ = _binary(np.bitwise_or)
+    __xor__ = _binary(np.bitwise_xor)
+
+    def __neg__(self) -> NumericArray:
+        return self._result(-self._live())
+
+    def __abs__(self) -> NumericArray:
+        return self._result(np.abs(self._live()))
+
+    def __invert__(self) -> NumericArray:
+        return self._result(~self._live())
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(logical size: {self._item_count}, physical size: {len(self._items)}, items: {self})'
+
+
+class IntArray(NumericArray):
+    """ A NumericArray of ints (stored as the platform's default NumPy integer). """
+
+    def __init__(self, starting_sequence: Sequence[int] | NDArray=(), data_type: type=int,
+                 policy: ResizePolicy=DEFAULT_RESIZE_POLICY) -> None:
+        if np.dtype(data_type).kind not in 'iu':
+            raise TypeError(f'IntArray needs an integer data type, not {data_type.__name__}.')
+        super().__init__(starting_sequence, data_type, policy)
+
+
+class FloatArray(NumericArray):
+    """ A NumericArray of floats (stored as float64 unless data_type says otherwise). """
+
+    def __init__(self, starting_sequence: Sequence[float] | NDArray=(), data_type: type=float,
+                 policy: ResizePolicy=DEFAULT_RESIZE_POLICY) -> None:
+        if np.dtype(data_type).kind != 'f':
+            raise TypeError(f'FloatArray needs a floating point data type, not {data_type.__name__}.')
+        super().__init__(starting_sequence, data_type, policy)
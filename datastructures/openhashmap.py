@@ -0,0 +1,169 @@
+from typing import Callable, Iterator, Optional, Tuple
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.hashengine import HashStrategy, hash_function_for
+from datastructures.ihashmap import KT, VT, IHashMap
+
+# slot states
+_EMPTY = 0
+_OCCUPIED = 1
+_DELETED = 2
+
+# cached hashes are stored as non-negative int64 values
+_HASH_MASK = (1 << 63) - 1
+
+
+class OpenHashMap(IHashMap[KT, VT]):
+    ''' HashMap using open addressing with linear probing. Keys, values and cached hashes live in
+        flat NumPy arrays instead of a LinkedList of tuples per bucket, so an entry costs a few
+        array slots rather than a Node and a tuple. Deleted entries leave a tombstone that lookups
+        probe past and inserts reuse; tombstones are cleared whenever the table is rebuilt.
+    '''
+
+    def __init__(self, initial_capacity=8, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None,
+                 hash_strategy: HashStrategy | str=HashStrategy.AUTO) -> None:
+        if not 0 < load_factor < 1:
+            raise ValueError('The load factor must be between 0 and 1 for open addressing.')
+        self.count: int = 0
+        self._tombstones: int = 0
+        self._load_factor_threshold: float = load_factor
+        self._hash_function = custom_hash_function or hash_function_for(hash_strategy)
+        self._rehash_count: int = 0
+        capacity = 1
+        while capacity < initial_capacity:
+            capacity *= 2
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        ''' Allocates empty slot arrays. capacity must be a power of two so probes can wrap with a mask. '''
+        self._hashes: NDArray[np.int64] = np.zeros(capacity, dtype=np.int64)
+        self._keys: NDArray = np.empty(capacity, dtype=object)
+        self._values: NDArray = np.empty(capacity, dtype=object)
+        self._states: NDArray[np.int8] = np.zeros(capacity, dtype=np.int8)
+        self._mask: int = capacity - 1
+
+    @property
+    def capacity(self) -> int:
+        return len(self._states)
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / len(self._states)
+
+    @property
+    def rehash_count(self) -> int:
+        return self._rehash_count
+
+    def _hash(self, key: KT) -> int:
+        return self._hash_function(key) & _HASH_MASK
+
+    def _probe(self, key: KT, key_hash: int) -> Tuple[int, bool]:
+        ''' Returns (slot, True) for the slot holding key, or (slot, False) for the slot key should be
+            inserted into: the first tombstone on the probe path, otherwise the empty slot that ended it. '''
+        states, hashes, keys, mask = self._states, self._hashes, self._keys, self._mask
+        index = key_hash & mask
+        first_tombstone = -1
+        while True:
+            state = states[index]
+            if state == _EMPTY:
+                return (index if first_tombstone < 0 else first_tombstone), False
+            if state == _DELETED:
+                if first_tombstone < 0:
+                    first_tombstone = index
+            elif hashes[index] == key_hash:
+                stored_key = keys[index]
+                if stored_key is key or stored_key == key:
+                    return index, True
+            index = (index + 1) & mask
+
+    def _rebuild(self, capacity: int) -> None:
+        ''' Reinserts every live entry into fresh arrays using the cached hashes, dropping tombstones. '''
+        live = np.flatnonzero(self._states == _OCCUPIED)
+        hashes, keys, values = self._hashes[live], self._keys[live], self._values[live]
+        self._allocate(capacity)
+        self._tombstones = 0
+        self._rehash_count += 1
+        states, mask = self._states, self._mask
+        for key_hash, key, value in zip(hashes.tolist(), keys, values):
+            index = key_hash & mask
+            while states[index] != _EMPTY:
+                index = (index + 1) & mask
+            states[index] = _OCCUPIED
+            self._hashes[index] = key_hash
+            self._keys[index] = key
+            self._values[index] = value
+
+    def __getitem__(self, key: KT) -> VT:
+        slot, found = self._probe(key, self._hash(key))
+        if not found:
+            raise KeyError('Key does not exist in HashMap')
+        return self._values[slot]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        key_hash = self._hash(key)
+        slot, found = self._probe(key, key_hash)
+        if found:
+            self._values[slot] = value
+            return
+        if self._states[slot] == _DELETED:
+            self._tombstones -= 1
+        self._states[slot] = _OCCUPIED
+        self._hashes[slot] = key_hash
+        self._keys[slot] = key
+        self._values[slot] = value
+        self.count += 1
+        capacity = len(self._states)
+        if self.count + self._tombstones > self._load_factor_threshold * capacity:
+            # only grow when live entries need the room; otherwise just sweep out the tombstones
+            grow = self.count > self._load_factor_threshold * capacity / 2
+            self._rebuild(capacity * 2 if grow else capacity)
+
+    def __delitem__(self, key: KT) -> None:
+        slot, found = self._probe(key, self._hash(key))
+        if not found:
+            raise KeyError('Key is not in HashMap')
+        self._states[slot] = _DELETED
+        self._keys[slot] = None
+        self._values[slot] = None
+        self.count -= 1
+        self._tombstones += 1
+
+    def __contains__(self, key: KT) -> bool:
+        return self._probe(key, self._hash(key))[1]
+
+    def _occupied_slots(self) -> list[int]:
+        return np.flatnonzero(self._states == _OCCUPIED).tolist()
+
+    def keys(self) -> Iterator[KT]:
+        for slot in self._occupied_slots():
+            yield self._keys[slot]
+
+    def values(self) -> Iterator[VT]:
+        for slot in self._occupied_slots():
+            yield self._values[slot]
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        for slot in self._occupied_slots():
+            yield (self._keys[slot], self._values[slot])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[KT]:
+        return self.keys()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OpenHashMap) or len(self) != len(other):
+            return False
+        for key, value in self.items():
+            slot, found = other._probe(key, other._hash(key))
+            if not found or other._values[slot] != value:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"OpenHashMap({str(self)})"
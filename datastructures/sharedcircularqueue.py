@@ -0,0 +1,205 @@
+import ast
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+# header layout, in int64 slots: front and rear sit on separate 64-byte cache lines so the
+# producer and the consumer never write to the same line; the dtype description follows
+_FRONT = 0
+_CAPACITY = 1
+_DESCR_LENGTH = 2
+_REAR = 8
+_DESCR_OFFSET = 128
+_HEADER_SIZE = 256
+
+
+def _check_count(count: int) -> None:
+    if count < 0:
+        raise ValueError('count must not be negative')
+
+
+class SharedCircularQueue:
+    """ A fixed-size circular queue of fixed-dtype items that lives in multiprocessing.shared_memory,
+        for handing items from one producer process to one consumer process without pickling.
+        Like CircularQueue it keeps front and rear indices into a ring of maxsize + 1 slots; the
+        producer only ever writes rear and the consumer only ever writes front, so no lock is needed
+        as long as there is exactly one of each.
+    """
+
+    def __init__(self, maxsize: int = 0, dtype: DTypeLike = np.float64, name: str | None = None) -> None:
+        ''' Creates a new shared ring. Other processes open it with SharedCircularQueue.attach(queue.name),
+            or receive it pickled, which attaches to the same memory.
+
+            Arguments:
+                maxsize: The maximum number of items in the queue
+                dtype: The NumPy dtype of every item, which may be a structured dtype
+                name: The name of the shared memory block, or None for a generated one
+        '''
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            raise TypeError('Shared queues cannot hold Python objects.')
+        descr = repr(np.lib.format.dtype_to_descr(dtype)).encode('ascii')
+        if len(descr) > _HEADER_SIZE - _DESCR_OFFSET:
+            raise ValueError('dtype description is too long for the queue header.')
+        capacity = maxsize + 1
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_SIZE + capacity * dtype.itemsize)
+        header = np.ndarray(_DESCR_OFFSET // 8, dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_CAPACITY] = capacity
+        header[_DESCR_LENGTH] = len(descr)
+        shm.buf[_DESCR_OFFSET:_DESCR_OFFSET + len(descr)] = descr
+        del header
+        self._open(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedCircularQueue':
+        ''' Opens a queue created by another process. The creator stays responsible for unlink. '''
+        # the creator owns the block and unlinks it. An attaching process must not track it too,
+        # or its resource tracker could unlink the block when this process exits (bpo-39959).
+        # Python 3.13 can skip tracking; older versions register on open, so the registration is
+        # dropped again straight away. A child that shares the creator's tracker drops the
+        # creator's entry with it, so that tracker reports a harmless KeyError at unlink
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        queue = cls.__new__(cls)
+        queue._open(shm, owner=False)
+        return queue
+
+    def _open(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._header: NDArray[np.int64] = np.ndarray(_DESCR_OFFSET // 8, dtype=np.int64, buffer=shm.buf)
+        capacity = int(self._header[_CAPACITY])
+        descr_length = int(self._header[_DESCR_LENGTH])
+        descr = bytes(shm.buf[_DESCR_OFFSET:_DESCR_OFFSET + descr_length]).decode('ascii')
+        dtype = np.lib.format.descr_to_dtype(ast.literal_eval(descr))
+        self._items: NDArray = np.ndarray(capacity, dtype=dtype, buffer=shm.buf, offset=_HEADER_SIZE)
+        self._capacity = capacity
+
+    @property
+    def name(self) -> str:
+        ''' Returns the name of the shared memory block, for SharedCircularQueue.attach '''
+        return self._shm.name
+
+    @property
+    def dtype(self) -> np.dtype:
+        ''' Returns the dtype of the items in the queue '''
+        return self._items.dtype
+
+    def enqueue(self, item: Any) -> None:
+        ''' Adds an item to the rear of the queue. Only the producer process may call this. '''
+        rear = int(self._header[_REAR])
+        next_rear = (rear + 1) % self._capacity
+        if next_rear == self._header[_FRONT]:
+            raise IndexError("Queue is full")
+        self._items[rear] = item
+        self._header[_REAR] = next_rear
+
+    def dequeue(self) -> Any:
+        ''' Removes and returns the item at the front of the queue. Only the consumer process may call this. '''
+        front = int(self._header[_FRONT])
+        if front == self._header[_REAR]:
+            raise IndexError("Queue is empty")
+        item = self._items[front].copy()
+        self._header[_FRONT] = (front + 1) % self._capacity
+        return item
+
+    def enqueue_many(self, items: NDArray | Any) -> int:
+        ''' Copies as many items as fit to the rear of the queue with at most two slice copies and
+            returns how many were enqueued. Only the producer process may call this. '''
+        block = np.asarray(items, dtype=self._items.dtype)
+        rear = int(self._header[_REAR])
+        free = (int(self._header[_FRONT]) - rear - 1) % self._capacity
+        count = min(len(block), free)
+        first_run = min(count, self._capacity - rear)
+        self._items[rear:rear + first_run] = block[:first_run]
+        self._items[:count - first_run] = block[first_run:count]
+        self._header[_REAR] = (rear + count) % self._capacity
+        return count
+
+    def dequeue_many(self, count: int) -> NDArray:
+        ''' Removes and returns up to count items from the front of the queue as a new NumPy array.
+            Only the consumer process may call this. '''
+        _check_count(count)
+        front = int(self._header[_FRONT])
+        count = min(count, (int(self._header[_REAR]) - front) % self._capacity)
+        first_run = min(count, self._capacity - front)
+        block = np.concatenate((self._items[front:front + first_run], self._items[:count - first_run]))
+        self._header[_FRONT] = (front + count) % self._capacity
+        return block
+
+    def peek_many(self, count: int) -> tuple[NDArray, NDArray]:
+        ''' Returns zero-copy views of up to count items at the front of the queue as two runs
+            (the second is empty unless the items wrap around). The views stay valid until the
+            consumer calls advance. Only the consumer process may call this. '''
+        _check_count(count)
+        front = int(self._header[_FRONT])
+        count = min(count, (int(self._header[_REAR]) - front) % self._capacity)
+        first_run = min(count, self._capacity - front)
+        return self._items[front:front + first_run], self._items[:count - first_run]
+
+    def advance(self, count: int) -> None:
+        ''' Drops count items from the front of the queue after they were read through peek_many. '''
+        _check_count(count)
+        front = int(self._header[_FRONT])
+        if count > (int(self._header[_REAR]) - front) % self._capacity:
+            raise IndexError(f'Cannot advance past the {len(self)} items in the queue.')
+        self._header[_FRONT] = (front + count) % self._capacity
+
+    @property
+    def front(self) -> Any:
+        ''' Returns the item at the front of the queue without removing it '''
+        front = int(self._header[_FRONT])
+        if front == self._header[_REAR]:
+            raise IndexError("Queue is empty")
+        return self._items[front].copy()
+
+    @property
+    def full(self) -> bool:
+        ''' Returns True if the queue is full, False otherwise '''
+        return (int(self._header[_REAR]) + 1) % self._capacity == int(self._header[_FRONT])
+
+    @property
+    def empty(self) -> bool:
+        ''' Returns True if the queue is empty, False otherwise '''
+        return int(self._header[_FRONT]) == int(self._header[_REAR])
+
+    @property
+    def maxsize(self) -> int:
+        ''' Returns the maximum size of the queue '''
+        return self._capacity - 1
+
+    def __len__(self) -> int:
+        ''' Returns the number of items in the queue '''
+        return (int(self._header[_REAR]) - int(self._header[_FRONT])) % self._capacity
+
+    def close(self) -> None:
+        ''' Releases this process's mapping of the queue. The queue cannot be used afterwards. '''
+        # the NumPy views export the shared buffer, which has to be released before closing it
+        del self._header, self._items
+        self._shm.close()
+
+    def unlink(self) -> None:
+        ''' Destroys the shared memory block. Call once, from the creating process, after close. '''
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedCircularQueue':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple:
+        return SharedCircularQueue.attach, (self.name,)
+
+    def __repr__(self) -> str:
+        ''' Returns a developer string representation of the SharedCircularQueue object '''
+        return f"SharedCircularQueue(maxsize={self.maxsize}, dtype={self.dtype}, name={self.name!r})"
@@ -0,0 +1,174 @@
+'''Generations/sec and board memory of the Game of Life engines.
+
+Run from projects/project2:
+    python bench_engines.py
+'''
+import time
+import tracemalloc
+
+import numpy as np
+
+from bitpackedengine import BitPackedEngine
+from gamecontroller import GameController
+from grid import Grid
+from hashlifeengine import HashlifeEngine
+from sparseengine import SparseEngine
+from vectorizedengine import VectorizedEngine
+
+
+def generations_per_second(step, generations):
+    start = time.perf_counter()
+    for _ in range(generations):
+        step()
+    return generations / (time.perf_counter() - start)
+
+
+def traced_bytes(build):
+    '''Returns (the object built, the bytes allocated while building it).'''
+    tracemalloc.start()
+    built = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, size
+
+
+def report(name, size, rate, board_bytes):
+    print(f"{name:>16} {size:>6} x {size:<6} {rate:>12,.2f} gen/s {rate * size * size:>16,.0f} cells/s"
+          f" {board_bytes / (size * size):>10.3f} bytes/cell")
+
+
+def bench_cells(size=100, generations=3):
+    '''The original object-per-cell boards, for reference.'''
+    controller, board_bytes = traced_bytes(lambda: GameController(size, size))
+    report('cells', size, generations_per_second(controller.update_grid, generations), board_bytes)
+    grid, board_bytes = traced_bytes(lambda: Grid(size, size))
+    report('Grid', size, generations_per_second(grid.update, generations), board_bytes)
+
+
+def bench_engine(name, engine_type, sizes=(1_000, 4_000), seconds=2.0, wrap=False):
+    for size in sizes:
+        engine = engine_type.random(size, size, density=0.3, wrap=wrap, seed=0)
+        engine.step()
+        start = time.perf_counter()
+        generations = 0
+        while time.perf_counter() - start < seconds:
+            engine.step()
+            generations += 1
+        rate = generations / (time.perf_counter() - start)
+        report(name, size, rate, engine.snapshot().nbytes)
+
+
+GOSPER_GLIDER_GUN = [
+    '........................O...........',
+    '......................O.O...........',
+    '............OO......OO............OO',
+    '...........O...O....OO............OO',
+    'OO........O.....O...OO..............',
+    'OO........O...O.OO....O.O...........',
+    '..........O.....O.......O...........',
+    '...........O...O....................',
+    '............OO......................',
+]
+
+R_PENTOMINO = [
+    '.OO',
+    'OO.',
+    '.O.',
+]
+
+
+def pattern(rows):
+    return np.array([[c == 'O' for c in row] for row in rows])
+
+
+def bench_hashlife(name, rows, exponents=(10, 20, 40, 60)):
+    '''Time to jump a pattern 2**k generations, each from a fresh engine and an empty cache.'''
+    for k in exponents:
+        engine = HashlifeEngine(pattern(rows))
+        start = time.perf_counter()
+        engine.step(2 ** k)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>16} 2**{k:<3} gens {elapsed:>10.4f} s {engine.population:>22,} cells"
+              f" {len(engine.cache):>10,} nodes")
+
+
+def bench_r_pentomino_settling(generations=1103):
+    '''Hashlife against the vectorized engine over the R-pentomino's 1103 unstable generations (the
+    bounded vectorized board loses a glider at its edge, so its final population differs).'''
+    board = np.zeros((512, 512), dtype=bool)
+    board[255:258, 255:258] = pattern(R_PENTOMINO)
+    for name, engine in (('hashlife', HashlifeEngine(board)), ('vectorized', VectorizedEngine(board))):
+        start = time.perf_counter()
+        engine.step(generations)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>16} R-pentomino {generations} gens {elapsed:>10.4f} s population {engine.population}")
+
+
+GLIDER = [
+    '.O.',
+    '..O',
+    'OOO',
+]
+
+
+def glider_field(size, gliders, seed=0):
+    '''Returns the live cells of gliders scattered over a size x size board, all heading the same
+    way (south-east) on a coarse lattice so that they do not collide for a long time.'''
+    rng = np.random.default_rng(seed)
+    spacing = 16
+    slots = rng.choice((size // spacing - 1) ** 2, size=gliders, replace=False)
+    glider = np.argwhere(pattern(GLIDER))
+    cells = []
+    for slot in slots:
+        x, y = divmod(int(slot), size // spacing - 1)
+        cells.extend((x * spacing + dx, y * spacing + dy) for dx, dy in glider)
+    return cells
+
+
+def bench_glider_field(sizes=(1_000, 4_000, 16_000), gliders=100, generations=100):
+    '''Sparse boards: the dense engines pay for the whole area, the sparse engine for the gliders.'''
+    for size in sizes:
+        cells = glider_field(size, gliders)
+        sparse = SparseEngine.from_live_cells(size, size, cells)
+        engines = [('sparse', sparse)]
+        if size <= 4_000:
+            board = sparse.to_numpy()
+            engines += [('vectorized', VectorizedEngine(board)), ('bitpacked', BitPackedEngine(board))]
+        for name, engine in engines:
+            rate = generations_per_second(engine.step, generations)
+            print(f"{name:>16} {size:>6} x {size:<6} {gliders} gliders {rate:>12,.2f} gen/s"
+                  f" population {engine.population}")
+        print(f"{'':>16} {sparse.active_tiles} of {sparse.tile_rows * sparse.tile_cols:,} tiles active")
+
+
+def bench_stagnation(size=1_000, generations=200, history=64):
+    '''GameController keeps 64-bit fingerprints of a bounded window of generations, so its
+    history memory stays flat however long a game runs.'''
+    for engine in ('vectorized', 'bitpacked', 'sparse'):
+        controller = GameController(size, size, engine=engine, history=history)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(generations):
+            controller.update_grid()
+            controller.check_stagnation()
+        elapsed = time.perf_counter() - start
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{engine:>16} {size:>6} x {size:<6} {generations / elapsed:>12,.2f} gen/s with stagnation checks"
+              f" {retained:>12,} bytes retained after {generations} generations")
+
+
+def main():
+    bench_cells()
+    bench_engine('vectorized', VectorizedEngine)
+    bench_engine('vectorized, wrap', VectorizedEngine, wrap=True, sizes=(1_000,))
+    bench_engine('bitpacked', BitPackedEngine, sizes=(1_000, 4_000, 16_000))
+    bench_hashlife('Gosper gun', GOSPER_GLIDER_GUN)
+    bench_hashlife('R-pentomino', R_PENTOMINO)
+    bench_r_pentomino_settling()
+    bench_glider_field()
+    bench_stagnation()
+
+
+if __name__ == '__main__':
+    main()
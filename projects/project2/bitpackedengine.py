@@ -0,0 +1,124 @@
+import numpy as np
+
+from cell import Cell
+
+# 64 cells per word; bit i of word w holds column 64 * w + i
+WORD_BITS = 64
+WORD = np.dtype('<u8')
+
+
+def pack(board):
+    '''Packs a 2-D bool board into a rows x words array of little-endian uint64 words.'''
+    board = np.asarray(board, dtype=bool)
+    rows, cols = board.shape
+    words = -(-cols // WORD_BITS)
+    bits = np.zeros((rows, words * WORD_BITS), dtype=bool)
+    bits[:, :cols] = board
+    return np.packbits(bits, axis=1, bitorder='little').view(WORD)
+
+
+def unpack(words, cols):
+    '''Unpacks rows x words uint64 words back into a rows x cols bool board.'''
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :cols].view(bool)
+
+
+def full_add(a, b, c):
+    '''Adds three one-bit numbers in every bit position of the words: returns (sum, carry).'''
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+class BitPackedEngine:
+    '''Runs the Game of Life on a board packed 64 cells to a uint64 word (1 bit per cell).
+    A generation is computed a whole word at a time: the eight neighbor bits of all 64 cells
+    are added with bitwise full adders (SWAR), vectorized over the board with NumPy.'''
+
+    def __init__(self, board, wrap=False):
+        board = np.asarray(board, dtype=bool)
+        if board.ndim != 2:
+            raise ValueError("The board must be two-dimensional.")
+        self.rows, self.cols = board.shape
+        self.words = pack(board)
+        self.wrap = wrap
+        self.generation = 0
+        # the unused high bits of each row's last word must stay dead
+        used = self.cols - (self.words.shape[1] - 1) * WORD_BITS
+        self.last_word_mask = WORD.type(0xFFFFFFFFFFFFFFFF >> (WORD_BITS - used))
+
+    @classmethod
+    def random(cls, rows, cols, density=0.5, wrap=False, seed=None):
+        '''Creates an engine with each cell alive with probability density.'''
+        rng = np.random.default_rng(seed)
+        return cls(rng.random((rows, cols)) < density, wrap)
+
+    @classmethod
+    def from_cells(cls, grid, wrap=False):
+        '''Creates an engine from a list of lists of Cell objects.'''
+        return cls([[cell.get_state() for cell in row] for row in grid], wrap)
+
+    @property
+    def population(self):
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(self.words).sum())
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def _west_and_east(self, words):
+        '''Returns, for every cell, the state of its left (west) and right (east) neighbor.'''
+        west = words << np.uint64(1)
+        west[:, 1:] |= words[:, :-1] >> np.uint64(WORD_BITS - 1)
+        east = words >> np.uint64(1)
+        east[:, :-1] |= words[:, 1:] << np.uint64(WORD_BITS - 1)
+        if self.wrap:
+            last_bit = np.uint64((self.cols - 1) % WORD_BITS)
+            west[:, 0] |= (words[:, -1] >> last_bit) & np.uint64(1)
+            east[:, -1] |= (words[:, 0] & np.uint64(1)) << last_bit
+        return west, east
+
+    def _shift_rows(self, words, offset):
+        '''Returns the words of the row offset rows away (above for -1, below for +1).'''
+        if self.wrap:
+            return np.roll(words, -offset, axis=0)
+        shifted = np.zeros_like(words)
+        if offset < 0:
+            shifted[1:] = words[:-1]
+        else:
+            shifted[:-1] = words[1:]
+        return shifted
+
+    def step(self, generations=1):
+        '''Advances the board by the given number of generations.'''
+        for _ in range(generations):
+            alive = self.words
+            west, east = self._west_and_east(alive)
+            # each row's three cells (west, self, east) summed into a 2-bit number
+            across0, across1 = full_add(west, alive, east)
+            above0, above1 = self._shift_rows(across0, -1), self._shift_rows(across1, -1)
+            below0, below1 = self._shift_rows(across0, 1), self._shift_rows(across1, 1)
+            # the cell's own row contributes only west and east
+            middle0, middle1 = west ^ east, west & east
+            # neighbors = (above0 + below0 + middle0) + 2 * (above1 + below1 + middle1)
+            sum0, carry0 = full_add(above0, below0, middle0)
+            twos, carry1 = full_add(above1, below1, middle1)
+            sum1, carry2 = twos ^ carry0, twos & carry0
+            sum2 = carry1 ^ carry2
+            # alive next with 2 neighbors if alive now, or with 3; counts of 8 wrap to 0
+            self.words = sum1 & ~sum2 & (sum0 | alive)
+            self.words[:, -1] &= self.last_word_mask
+        self.generation += generations
+
+    def to_numpy(self):
+        '''Returns the board as a 2-D bool array (row x, column y).'''
+        return unpack(self.words, self.cols)
+
+    def snapshot(self):
+        '''Returns a compact copy of the board for comparing generations.'''
+        return self.words.copy()
+
+    def to_cells(self):
+        '''Returns the board as a list of lists of Cell objects, for code that works with Cells.'''
+        return [[Cell(x, y, bool(alive)) for y, alive in enumerate(row)] for x, row in enumerate(self.to_numpy())]
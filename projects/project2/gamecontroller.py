@@ -1,17 +1,87 @@
+from bitpackedengine import BitPackedEngine
+from collections import deque
 from cell import Cell
+from hashlifeengine import HashlifeEngine
+from sparseengine import SparseEngine
+from vectorizedengine import VectorizedEngine
+import hashlib
+import numpy as np
 import random
 import time
 
+# engines that keep the board as arrays instead of Cell objects; each has random(), step(),
+# to_numpy(), to_cells(), snapshot() and population
+ENGINES = {
+    'vectorized': VectorizedEngine,
+    'bitpacked': BitPackedEngine,
+    'hashlife': HashlifeEngine,
+    'sparse': SparseEngine,
+}
+
+
+def fingerprint(board):
+    '''Returns a 64-bit hash of a board: bool boards are packed to one bit per cell first,
+    other arrays (such as packed words or live cell coordinates) are hashed as they are.'''
+    board = np.asarray(board)
+    if board.dtype == bool:
+        board = np.packbits(board)
+    return int.from_bytes(hashlib.blake2b(np.ascontiguousarray(board).data, digest_size=8).digest(), 'little')
+
+
 class GameController:
-    def __init__(self, rows, cols):
+    def __init__(self, rows, cols, engine='cells', wrap=False, history=64, board=None):
+        # board: optional rows x cols starting states (bools); random when omitted
         self.rows = rows
         self.cols = cols
-        self.grid = [[Cell(x, y, random.choice([True, False])) for y in range(cols)] for x in range(rows)]
-        self.grid_history = []
+        self.engine = None
+        if engine == 'cells':
+            if wrap:
+                raise ValueError("The 'cells' engine does not support wrapping boards.")
+            if board is None:
+                self.grid = [[Cell(x, y, random.choice([True, False])) for y in range(cols)] for x in range(rows)]
+            else:
+                self.grid = [[Cell(x, y, bool(board[x][y])) for y in range(cols)] for x in range(rows)]
+        elif engine in ENGINES:
+            if board is None:
+                self.engine = ENGINES[engine].random(rows, cols, wrap=wrap)
+            else:
+                self.engine = ENGINES[engine](board, wrap)
+            self.grid = None
+        else:
+            raise ValueError(f"Unknown engine {engine!r}; choose 'cells' or one of {', '.join(ENGINES)}.")
+        if history < 1:
+            raise ValueError("The history window must hold at least one generation.")
+        # fingerprints of the last `history` generations: the index maps each fingerprint to the
+        # latest generation that had it and the deque remembers the order to forget them in
+        self.history = history
+        self.generation = 0
+        self.fingerprints = {}
+        self.fingerprint_window = deque()
+        self.period = None
+        self.record_fingerprint()
+
+    def cell_states(self):
+        if self.engine is not None:
+            return self.engine.to_numpy()
+        return [[cell.get_state() for cell in row] for row in self.grid]
+
+    def record_fingerprint(self):
+        '''Fingerprints the current generation and sets period to the number of generations since
+        the same board was last seen within the history window, or None if it was not.'''
+        board = self.engine.snapshot() if self.engine is not None else np.array(self.cell_states(), dtype=bool)
+        key = fingerprint(board)
+        seen = self.fingerprints.get(key)
+        self.period = None if seen is None else self.generation - seen
+        if len(self.fingerprint_window) == self.history:
+            old_key, old_generation = self.fingerprint_window.popleft()
+            if self.fingerprints[old_key] == old_generation:
+                del self.fingerprints[old_key]
+        self.fingerprints[key] = self.generation
+        self.fingerprint_window.append((key, self.generation))
 
     def display_grid(self):
-        for row in self.grid:
-            print(" ".join(["🦠" if cell.get_state() else " " for cell in row]))
+        for row in self.cell_states():
+            print(" ".join(["🦠" if alive else " " for alive in row]))
         print()
 
     def count_neighbors(self, x, y):
@@ -24,22 +94,31 @@ class GameController:
         return neighbors
 
     def update_grid(self):
+        if self.engine is not None:
+            self.engine.step()
+        else:
+            self.update_cells()
+        self.generation += 1
+        self.record_fingerprint()
+
+    def update_cells(self):
         new_grid = [[Cell(x, y, self.grid[x][y].get_state()) for y in range(self.cols)] for x in range(self.rows)]
         for x in range(self.rows):
             for y in range(self.cols):
                 neighbors = self.count_neighbors(x, y)
                 new_grid[x][y].update_state(neighbors)
         self.grid = new_grid
-        self.grid_history.append([row[:] for row in self.grid])
 
     def check_stagnation(self):
-        return self.grid in self.grid_history[-3:]
+        '''Returns True if the current board repeats one from the history window: a still life
+        (period 1) or an oscillator or cycle of any period up to the window size.'''
+        return self.period is not None
 
     def run(self):
         while True:
             self.display_grid()
             if self.check_stagnation():
-                print("The grid has stabilized or is repeating!")
+                print(f"The grid has stabilized or is repeating! (period {self.period})")
                 break
             mode = input("Enter 'A' for Automatic, 'M' for Manual, 'Q' to quit: ").strip().upper()
             if mode == 'A':
@@ -0,0 +1,231 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from cell import Cell
+
+
+class Node:
+    '''A square of 2**level cells: a single cell at level 0, otherwise four quadrants of level - 1
+    (nw, ne, sw, se). Nodes are interned, so equal squares are usually the same object, and each
+    node remembers its results: results[j] is its centre advanced 2**j generations.'''
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population', 'results')
+
+    def __init__(self, level, nw=None, ne=None, sw=None, se=None, population=0):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+        self.results = None
+
+
+DEAD = Node(0, population=0)
+ALIVE = Node(0, population=1)
+
+
+class InternCache:
+    '''Hash-consing table mapping four quadrants to the one node made of them. Once it holds
+    max_size nodes the least recently used entry is evicted: its node stays valid, but an equal
+    square built later becomes a new node with its own (recomputed) results.'''
+
+    def __init__(self, max_size=1 << 21):
+        self.max_size = max_size
+        self.nodes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is not None:
+            self.hits += 1
+            self.nodes.move_to_end(key)
+            return node
+        self.misses += 1
+        node = Node(nw.level + 1, nw, ne, sw, se, nw.population + ne.population + sw.population + se.population)
+        self.nodes[key] = node
+        if len(self.nodes) > self.max_size:
+            self.nodes.popitem(last=False)
+        return node
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+class HashlifeEngine:
+    '''Runs the Game of Life on an unbounded plane with Hashlife: the board is a quadtree of
+    interned nodes and the future of every node is memoized, so repetitive patterns can be
+    advanced millions of generations at once with step(2**k). The rows x cols board given at
+    construction is the window that to_numpy() shows; cells may live outside it.'''
+
+    def __init__(self, board, wrap=False, max_cache_size=1 << 21):
+        if wrap:
+            raise ValueError("The hashlife engine simulates an unbounded plane and cannot wrap.")
+        board = np.asarray(board, dtype=bool)
+        if board.ndim != 2:
+            raise ValueError("The board must be two-dimensional.")
+        self.rows, self.cols = board.shape
+        self.cache = InternCache(max_cache_size)
+        self.zeros = [DEAD]
+        level = 3
+        while 2 ** level < max(self.rows, self.cols):
+            level += 1
+        square = np.zeros((2 ** level, 2 ** level), dtype=bool)
+        square[:self.rows, :self.cols] = board
+        self.root = self._build(square, level)
+        # board coordinates (row, column) of the root's top-left cell
+        self.origin = (0, 0)
+        self.generation = 0
+
+    @classmethod
+    def random(cls, rows, cols, density=0.5, wrap=False, seed=None):
+        '''Creates an engine with each cell alive with probability density.'''
+        rng = np.random.default_rng(seed)
+        return cls(rng.random((rows, cols)) < density, wrap)
+
+    @classmethod
+    def from_cells(cls, grid, wrap=False):
+        '''Creates an engine from a list of lists of Cell objects.'''
+        return cls([[cell.get_state() for cell in row] for row in grid], wrap)
+
+    def _build(self, square, level):
+        if not square.any():
+            return self.zero(level)
+        if level == 0:
+            return ALIVE
+        half = 2 ** (level - 1)
+        return self.cache.join(self._build(square[:half, :half], level - 1), self._build(square[:half, half:], level - 1),
+                               self._build(square[half:, :half], level - 1), self._build(square[half:, half:], level - 1))
+
+    def zero(self, level):
+        '''Returns the empty node of the given level.'''
+        while len(self.zeros) <= level:
+            smaller = self.zeros[-1]
+            self.zeros.append(self.cache.join(smaller, smaller, smaller, smaller))
+        return self.zeros[level]
+
+    def centre(self, node):
+        '''Returns the node one level up with node in its middle and dead cells around it.'''
+        z = self.zero(node.level - 1)
+        join = self.cache.join
+        return join(join(z, z, z, node.nw), join(z, z, node.ne, z), join(z, node.sw, z, z), join(node.se, z, z, z))
+
+    def _life_4x4(self, node):
+        '''Returns the centre 2x2 of a level 2 node after one generation.'''
+        cells = [[node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+                 [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+                 [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+                 [node.sw.sw, node.sw.se, node.se.sw, node.se.se]]
+        alive = [[cell.population for cell in row] for row in cells]
+        centre = []
+        for x in (1, 2):
+            for y in (1, 2):
+                neighbors = sum(alive[i][j] for i in (x - 1, x, x + 1) for j in (y - 1, y, y + 1)) - alive[x][y]
+                centre.append(ALIVE if neighbors == 3 or (neighbors == 2 and alive[x][y]) else DEAD)
+        return self.cache.join(*centre)
+
+    def successor(self, node, j):
+        '''Returns the centre of node (one level down) advanced 2**j generations, j <= level - 2.'''
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        if node.results is not None and j in node.results:
+            return node.results[j]
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            join = self.cache.join
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # nine overlapping sub-squares of half the size, each advanced 2**j generations
+            # (or 2**(level - 3) when this call advances the full 2**(level - 2))
+            step = min(j, node.level - 3)
+            c1 = self.successor(nw, step)
+            c2 = self.successor(join(nw.ne, ne.nw, nw.se, ne.sw), step)
+            c3 = self.successor(ne, step)
+            c4 = self.successor(join(nw.sw, nw.se, sw.nw, sw.ne), step)
+            c5 = self.successor(join(nw.se, ne.sw, sw.ne, se.nw), step)
+            c6 = self.successor(join(ne.sw, ne.se, se.nw, se.ne), step)
+            c7 = self.successor(sw, step)
+            c8 = self.successor(join(sw.ne, se.nw, sw.se, se.sw), step)
+            c9 = self.successor(se, step)
+            if j < node.level - 2:
+                # already advanced far enough: just reassemble the middle
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = join(self.successor(join(c1, c2, c4, c5), step), self.successor(join(c2, c3, c5, c6), step),
+                              self.successor(join(c4, c5, c7, c8), step), self.successor(join(c5, c6, c8, c9), step))
+        if node.results is None:
+            node.results = {}
+        node.results[j] = result
+        return result
+
+    def _is_padded(self, node):
+        '''Returns True if every live cell of node is inside its central 1/16: the square a quarter
+        of its width across made of the innermost eighths nw.se.se, ne.sw.sw, sw.ne.ne and se.nw.nw.'''
+        return (node.nw.population == node.nw.se.se.population and node.ne.population == node.ne.sw.sw.population
+                and node.sw.population == node.sw.ne.ne.population and node.se.population == node.se.nw.nw.population)
+
+    def _advance(self, j):
+        '''Advances the board 2**j generations.'''
+        node, (x, y) = self.root, self.origin
+        # pad until the pattern cannot grow past the centre that successor returns
+        while node.level < j + 3 or not self._is_padded(node):
+            offset = 2 ** (node.level - 1)
+            node, x, y = self.centre(node), x - offset, y - offset
+        offset = 2 ** (node.level - 2)
+        self.root, self.origin = self.successor(node, j), (x + offset, y + offset)
+
+    def step(self, generations=1):
+        '''Advances the board by the given number of generations, in power-of-two jumps.'''
+        j = 0
+        remaining = generations
+        while remaining:
+            if remaining & 1:
+                self._advance(j)
+            remaining >>= 1
+            j += 1
+        self.generation += generations
+
+    @property
+    def population(self):
+        return self.root.population
+
+    def _live_cells(self, clip):
+        '''Yields the (row, column) of every live cell, or only of those in the window if clip is True.'''
+        stack = [(self.root, self.origin[0], self.origin[1])]
+        while stack:
+            node, x, y = stack.pop()
+            size = 2 ** node.level
+            if node.population == 0:
+                continue
+            if clip and (x >= self.rows or y >= self.cols or x + size <= 0 or y + size <= 0):
+                continue
+            if node.level == 0:
+                yield x, y
+                continue
+            half = size // 2
+            stack.extend(((node.nw, x, y), (node.ne, x, y + half), (node.sw, x + half, y), (node.se, x + half, y + half)))
+
+    def live_cells(self):
+        '''Returns the (row, column) of every live cell on the plane as a sorted n x 2 int64 array.'''
+        cells = np.array(list(self._live_cells(clip=False)), dtype=np.int64).reshape(-1, 2)
+        return cells[np.lexsort((cells[:, 1], cells[:, 0]))]
+
+    def to_numpy(self):
+        '''Returns the rows x cols window of the plane as a 2-D bool array (row x, column y).'''
+        board = np.zeros((self.rows, self.cols), dtype=bool)
+        for x, y in self._live_cells(clip=True):
+            board[x, y] = True
+        return board
+
+    def snapshot(self):
+        '''Returns the live cells of the whole plane, not just the window, so that two generations
+        compare equal only if the patterns match everywhere (a glider that left the window still counts).'''
+        return self.live_cells()
+
+    def to_cells(self):
+        '''Returns the board as a list of lists of Cell objects, for code that works with Cells.'''
+        return [[Cell(x, y, bool(alive)) for y, alive in enumerate(row)] for x, row in enumerate(self.to_numpy())]
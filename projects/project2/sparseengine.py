@@ -0,0 +1,199 @@
+import numpy as np
+
+from cell import Cell
+from vectorizedengine import next_generation
+
+TILE_SIZE = 64
+# (row, column) offsets of a tile and its eight neighbors, in row-major order
+OFFSETS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)]
+
+
+def halo_counts(halos):
+    '''Returns the live-neighbor counts of the inner cells of a stack of bool tiles that each
+    carry a one-cell border (n x (size + 2) x (size + 2)), as uint8 (n x size x size).'''
+    cells = halos.view(np.uint8)
+    across = cells[:, :, :-2] + cells[:, :, 1:-1] + cells[:, :, 2:]
+    return across[:, :-2] + across[:, 1:-1] + across[:, 2:] - cells[:, 1:-1, 1:-1]
+
+
+class SparseEngine:
+    '''Runs the Game of Life on a board split into square tiles, keeping only the tiles that
+    have live cells in a dict keyed by (tile row, tile column). Each generation recomputes just
+    the tiles that changed in the last one, and those of their neighbors that border a changed
+    cell, so the cost of a step follows the activity on the board rather than its area.'''
+
+    def __init__(self, board, wrap=False, tile_size=TILE_SIZE):
+        board = np.asarray(board, dtype=bool)
+        if board.ndim != 2:
+            raise ValueError("The board must be two-dimensional.")
+        self._setup(board.shape[0], board.shape[1], wrap, tile_size)
+        size = self.tile_size
+        for ti in range(self.tile_rows):
+            for tj in range(self.tile_cols):
+                block = board[ti * size:(ti + 1) * size, tj * size:(tj + 1) * size]
+                if block.any():
+                    tile = np.zeros((size, size), dtype=bool)
+                    tile[:block.shape[0], :block.shape[1]] = block
+                    self.tiles[ti, tj] = tile
+        self._wake_all()
+
+    @classmethod
+    def from_live_cells(cls, rows, cols, live_cells, wrap=False, tile_size=TILE_SIZE):
+        '''Creates an engine from (x, y) coordinates of the live cells, without building the
+        whole board first.'''
+        engine = cls.__new__(cls)
+        engine._setup(rows, cols, wrap, tile_size)
+        size = engine.tile_size
+        for x, y in live_cells:
+            if not (0 <= x < rows and 0 <= y < cols):
+                raise IndexError(f"Cell ({x}, {y}) is outside the {rows} x {cols} board.")
+            key = (x // size, y // size)
+            if key not in engine.tiles:
+                engine.tiles[key] = np.zeros((size, size), dtype=bool)
+            engine.tiles[key][x % size, y % size] = True
+        engine._wake_all()
+        return engine
+
+    @classmethod
+    def random(cls, rows, cols, density=0.5, wrap=False, seed=None):
+        '''Creates an engine with each cell alive with probability density.'''
+        rng = np.random.default_rng(seed)
+        return cls(rng.random((rows, cols)) < density, wrap)
+
+    @classmethod
+    def from_cells(cls, grid, wrap=False):
+        '''Creates an engine from a list of lists of Cell objects.'''
+        return cls([[cell.get_state() for cell in row] for row in grid], wrap)
+
+    def _setup(self, rows, cols, wrap, tile_size):
+        if wrap and (rows % tile_size or cols % tile_size):
+            raise ValueError(f"A wrapping board needs rows and cols that are multiples of the tile size ({tile_size}).")
+        self.rows = rows
+        self.cols = cols
+        self.wrap = wrap
+        self.tile_size = tile_size
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+        self.tiles = {}
+        self.awake = set()
+        self.changed = 0
+        self.generation = 0
+
+    def _neighbor(self, ti, tj):
+        '''Returns the key of the tile at (ti, tj), wrapping if the board does, or None past an edge.'''
+        if self.wrap:
+            return ti % self.tile_rows, tj % self.tile_cols
+        if 0 <= ti < self.tile_rows and 0 <= tj < self.tile_cols:
+            return ti, tj
+        return None
+
+    def _wake_all(self):
+        '''Marks every live tile and its neighbors for recomputing in the next generation.'''
+        for ti, tj in self.tiles:
+            for di, dj in OFFSETS:
+                key = self._neighbor(ti + di, tj + dj)
+                if key is not None:
+                    self.awake.add(key)
+        self.changed = len(self.tiles)
+
+    def _halos(self, keys):
+        '''Returns the given tiles stacked with a one-cell border copied from their neighbors.'''
+        size = self.tile_size
+        # every tile involved goes into one stack (slot 0 is the dead tile), so the borders can
+        # be copied with a few fancy-indexed assignments instead of one per tile
+        pool = [np.zeros((size, size), dtype=bool)]
+        slots = {}
+        index = np.zeros((len(keys), len(OFFSETS)), dtype=np.intp)
+        for n, (ti, tj) in enumerate(keys):
+            for k, (di, dj) in enumerate(OFFSETS):
+                key = self._neighbor(ti + di, tj + dj)
+                tile = self.tiles.get(key)
+                if tile is None:
+                    continue
+                if key not in slots:
+                    slots[key] = len(pool)
+                    pool.append(tile)
+                index[n, k] = slots[key]
+        pool = np.stack(pool)
+        halos = np.empty((len(keys), size + 2, size + 2), dtype=bool)
+        halos[:, 1:-1, 1:-1] = pool[index[:, 4]]
+        halos[:, 0, 1:-1] = pool[index[:, 1], -1, :]
+        halos[:, -1, 1:-1] = pool[index[:, 7], 0, :]
+        halos[:, 1:-1, 0] = pool[index[:, 3], :, -1]
+        halos[:, 1:-1, -1] = pool[index[:, 5], :, 0]
+        halos[:, 0, 0] = pool[index[:, 0], -1, -1]
+        halos[:, 0, -1] = pool[index[:, 2], -1, 0]
+        halos[:, -1, 0] = pool[index[:, 6], 0, -1]
+        halos[:, -1, -1] = pool[index[:, 8], 0, 0]
+        return halos
+
+    def step(self, generations=1):
+        '''Advances the board by the given number of generations.'''
+        for _ in range(generations):
+            if not self.awake:
+                self.changed = 0
+                break
+            keys = list(self.awake)
+            halos = self._halos(keys)
+            boards = next_generation(halos[:, 1:-1, 1:-1], halo_counts(halos))
+            if not self.wrap:
+                self._clip_edges(keys, boards)
+            diff = boards != halos[:, 1:-1, 1:-1]
+            changed = np.flatnonzero(diff.any(axis=(1, 2)))
+            diff = diff[changed]
+            # a neighbor only needs recomputing if the cells it borders changed (in OFFSETS order)
+            wakes = np.stack([diff[:, 0, 0], diff[:, 0, :].any(axis=1), diff[:, 0, -1],
+                              diff[:, :, 0].any(axis=1), np.ones(len(changed), dtype=bool), diff[:, :, -1].any(axis=1),
+                              diff[:, -1, 0], diff[:, -1, :].any(axis=1), diff[:, -1, -1]], axis=1)
+            alive = boards[changed].any(axis=(1, 2))
+            self.awake = set()
+            for n, wake, live in zip(changed, wakes.tolist(), alive.tolist()):
+                ti, tj = keys[n]
+                for (di, dj), woken in zip(OFFSETS, wake):
+                    if woken:
+                        key = self._neighbor(ti + di, tj + dj)
+                        if key is not None:
+                            self.awake.add(key)
+                if live:
+                    # copy, so the stored tile does not keep the whole batch alive
+                    self.tiles[ti, tj] = boards[n].copy()
+                else:
+                    del self.tiles[ti, tj]
+            self.changed = len(changed)
+        self.generation += generations
+
+    def _clip_edges(self, keys, boards):
+        '''Kills the cells of the partial tiles along the bottom and right edges that lie past the board.'''
+        size = self.tile_size
+        last_rows = self.rows - (self.tile_rows - 1) * size
+        last_cols = self.cols - (self.tile_cols - 1) * size
+        for n, (ti, tj) in enumerate(keys):
+            if ti == self.tile_rows - 1:
+                boards[n, last_rows:, :] = False
+            if tj == self.tile_cols - 1:
+                boards[n, :, last_cols:] = False
+
+    @property
+    def population(self):
+        return sum(int(np.count_nonzero(tile)) for tile in self.tiles.values())
+
+    @property
+    def active_tiles(self):
+        '''Returns the number of tiles that changed in the last generation.'''
+        return self.changed
+
+    def to_numpy(self):
+        '''Returns the board as a 2-D bool array (row x, column y).'''
+        size = self.tile_size
+        board = np.zeros((self.tile_rows * size, self.tile_cols * size), dtype=bool)
+        for (ti, tj), tile in self.tiles.items():
+            board[ti * size:(ti + 1) * size, tj * size:(tj + 1) * size] = tile
+        return board[:self.rows, :self.cols]
+
+    def snapshot(self):
+        '''Returns a copy of the board for comparing generations.'''
+        return self.to_numpy()
+
+    def to_cells(self):
+        '''Returns the board as a list of lists of Cell objects, for code that works with Cells.'''
+        return [[Cell(x, y, bool(alive)) for y, alive in enumerate(row)] for x, row in enumerate(self.to_numpy())]
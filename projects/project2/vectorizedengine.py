@@ -0,0 +1,79 @@
+import numpy as np
+
+from cell import Cell
+
+
+def neighbor_counts(board, wrap=False):
+    '''Returns the number of live neighbors of every cell of a 2-D bool board, as uint8.
+    Cells past the edge count as dead unless wrap is True (a toroidal board).'''
+    cells = board.view(np.uint8)
+    # sum each cell with its left and right neighbors, then sum those rows with the rows
+    # above and below: 4 whole-board additions instead of 8, minus the cell itself
+    if wrap:
+        across = cells + np.roll(cells, 1, axis=1) + np.roll(cells, -1, axis=1)
+        return across + np.roll(across, 1, axis=0) + np.roll(across, -1, axis=0) - cells
+    across = cells.copy()
+    across[:, 1:] += cells[:, :-1]
+    across[:, :-1] += cells[:, 1:]
+    counts = across - cells
+    counts[1:, :] += across[:-1, :]
+    counts[:-1, :] += across[1:, :]
+    return counts
+
+
+def next_generation(board, counts):
+    '''Applies the rules: a cell is alive next if it has 3 live neighbors, or 2 and is alive now.'''
+    return (counts == 3) | (board & (counts == 2))
+
+
+class VectorizedEngine:
+    '''Runs the Game of Life on a NumPy bool array (one byte per cell), computing each
+    generation with whole-board array operations instead of one Cell object per cell.'''
+
+    def __init__(self, board, wrap=False):
+        self.board = np.array(board, dtype=bool)
+        if self.board.ndim != 2:
+            raise ValueError("The board must be two-dimensional.")
+        self.wrap = wrap
+        self.generation = 0
+
+    @classmethod
+    def random(cls, rows, cols, density=0.5, wrap=False, seed=None):
+        '''Creates an engine with each cell alive with probability density.'''
+        rng = np.random.default_rng(seed)
+        return cls(rng.random((rows, cols)) < density, wrap)
+
+    @classmethod
+    def from_cells(cls, grid, wrap=False):
+        '''Creates an engine from a list of lists of Cell objects.'''
+        return cls([[cell.get_state() for cell in row] for row in grid], wrap)
+
+    @property
+    def rows(self):
+        return self.board.shape[0]
+
+    @property
+    def cols(self):
+        return self.board.shape[1]
+
+    @property
+    def population(self):
+        return int(np.count_nonzero(self.board))
+
+    def step(self, generations=1):
+        '''Advances the board by the given number of generations.'''
+        for _ in range(generations):
+            self.board = next_generation(self.board, neighbor_counts(self.board, self.wrap))
+        self.generation += generations
+
+    def to_numpy(self):
+        '''Returns the board as a 2-D bool array (row x, column y).'''
+        return self.board
+
+    def snapshot(self):
+        '''Returns a copy of the board for comparing generations.'''
+        return self.board.copy()
+
+    def to_cells(self):
+        '''Returns the board as a list of lists of Cell objects, for code that works with Cells.'''
+        return [[Cell(x, y, bool(alive)) for y, alive in enumerate(row)] for x, row in enumerate(self.board)]
@@ -1,10 +1,10 @@
-from datastructures.deque import Deque
+from datastructures.arraydeque import ArrayDeque
 from datastructures.liststack import ListStack
 from Customer_Order import Customer_Order
 
 class Order_Queue:
     def __init__(self):
-        self.queue = Deque(data_type=Customer_Order)
+        self.queue = ArrayDeque(data_type=Customer_Order)
         self._complete_queue = ListStack(data_type=Customer_Order)
 
     def add_order(self, customer_order: Customer_Order) -> None:  
@@ -26,7 +26,7 @@ class Order_Queue:
             return
 
         print("\nOpen Orders:")
-        temp_queue = Deque(data_type=Customer_Order)
+        temp_queue = ArrayDeque(data_type=Customer_Order)
 
         while not self.queue.empty():
             order = self.queue.dequeue()
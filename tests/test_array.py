@@ -1,6 +1,8 @@
+import array as pyarray
 import copy
+import numpy as np
 import pytest
-from datastructures.array import Array
+from datastructures.array import Array, ArrayView, ResizePolicy
 
 from tests.car import Car, Color, Make, Model
 
@@ -130,3 +132,221 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_from_buffer_should_build_an_array_from_a_numpy_array(self):
+        array = Array.from_buffer(np.arange(5))
+        assert array == Array([0, 1, 2, 3, 4])
+        assert array._data_type is int
+
+    def test_from_buffer_should_copy_the_buffer_by_default(self):
+        buffer = np.arange(5)
+        array = Array.from_buffer(buffer)
+        buffer[0] = 99
+        assert array[0] == 0
+
+    def test_from_buffer_should_share_memory_when_copy_is_false(self):
+        buffer = np.arange(5)
+        array = Array.from_buffer(buffer, copy=False)
+        buffer[0] = 99
+        assert array[0] == 99
+
+    def test_from_buffer_should_read_bytes_like_objects_through_the_buffer_protocol(self):
+        assert list(Array.from_buffer(b'abc')) == [97, 98, 99]
+        assert list(Array.from_buffer(pyarray.array('d', [1.5, 2.5]))) == [1.5, 2.5]
+        buffer = bytearray(b'abc')
+        array = Array.from_buffer(buffer, copy=False)
+        buffer[0] = 0
+        assert array[0] == 0
+
+    def test_from_buffer_should_still_accept_array_likes(self):
+        assert list(Array.from_buffer([1, 2, 3])) == [1, 2, 3]
+
+    def test_from_buffer_should_raise_a_value_error_if_the_buffer_is_not_one_dimensional(self):
+        with pytest.raises(ValueError):
+            Array.from_buffer(np.zeros((2, 2)))
+
+    def test_from_iterable_should_build_a_numeric_array_without_a_list(self):
+        array = Array.from_iterable((i * i for i in range(1000)), data_type=int, count=1000)
+        assert len(array) == 1000
+        assert array[999] == 999 * 999
+
+    def test_from_iterable_should_type_check_non_numeric_items(self):
+        assert Array.from_iterable(iter([self.car1, self.car2]), data_type=Car) == Array([self.car1, self.car2], Car)
+        with pytest.raises(TypeError):
+            Array.from_iterable(iter([self.car1, 'string']), data_type=Car)
+
+    def test_from_iterable_should_raise_a_value_error_if_the_iterable_is_shorter_than_count(self):
+        with pytest.raises(ValueError):
+            Array.from_iterable(iter([self.car1]), data_type=Car, count=2)
+
+    def test_append_should_keep_all_items_when_the_array_grows(self, setup_numerical_array: Array):
+        for i in range(10, 100):
+            setup_numerical_array.append(i)
+        assert list(setup_numerical_array) == list(range(100))
+
+    def test_append_front_should_insert_items_in_front_of_the_existing_items(self, setup_numerical_array: Array):
+        for i in range(-1, -50, -1):
+            setup_numerical_array.append_front(i)
+        assert list(setup_numerical_array) == list(range(-49, 10))
+
+    def test_pop_front_should_remove_the_first_item(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        setup_numerical_array.pop_front()
+        assert list(setup_numerical_array) == list(range(2, 10))
+        assert setup_numerical_array[0] == 2
+
+    def test_mixed_front_and_back_operations_should_keep_indexing_slicing_and_deletion_consistent(self):
+        array = Array[int]([], data_type=int)
+        expected: list[int] = []
+        for i in range(200):
+            if i % 3 == 0:
+                array.append_front(i)
+                expected.insert(0, i)
+            else:
+                array.append(i)
+                expected.append(i)
+            if i % 7 == 0:
+                array.pop_front()
+                expected.pop(0)
+        del array[5]
+        del expected[5]
+        assert list(array) == expected
+        assert list(reversed(array)) == expected[::-1]
+        assert array[-1] == expected[-1]
+        assert list(array[3:20:2]) == expected[3:20:2]
+
+    def test_deleting_items_from_either_half_should_keep_the_remaining_items_in_order(self, setup_numerical_array: Array):
+        del setup_numerical_array[1]
+        del setup_numerical_array[-2]
+        assert list(setup_numerical_array) == [0, 2, 3, 4, 5, 6, 7, 9]
+        assert setup_numerical_array[0] == 0
+
+    def test_delete_range_should_remove_the_items_between_start_and_stop(self, setup_numerical_array: Array):
+        setup_numerical_array.delete_range(2, 5)
+        assert list(setup_numerical_array) == [0, 1, 5, 6, 7, 8, 9]
+        setup_numerical_array.delete_range(-3, 100)
+        assert list(setup_numerical_array) == [0, 1, 5, 6]
+        setup_numerical_array.delete_range(3, 1)
+        assert list(setup_numerical_array) == [0, 1, 5, 6]
+
+    def test_delete_range_should_work_on_complex_objects(self, setup_complex_object_array: Array[Car]):
+        setup_complex_object_array.delete_range(0, 2)
+        assert list(setup_complex_object_array) == [self.car3]
+
+    def test_compact_should_release_the_spare_capacity(self):
+        array = Array[int](list(range(100)), data_type=int, policy=ResizePolicy(shrink_threshold=0))
+        array.delete_range(0, 90)
+        assert len(array._items) == 100
+        array.compact()
+        assert len(array._items) == 10
+        assert list(array) == list(range(90, 100))
+
+    def test_resize_policy_should_control_growth_and_shrinking(self):
+        array = Array[int]([], data_type=int, policy=ResizePolicy(growth_factor=1.5, shrink_threshold=0, min_capacity=16))
+        assert len(array._items) == 16
+        for i in range(17):
+            array.append(i)
+        assert len(array._items) == 24
+        array.delete_range(0, 16)
+        assert len(array._items) == 24
+        assert array[0] == 16
+
+    def test_a_zero_shrink_threshold_should_keep_the_buffer_when_the_array_empties(self):
+        array = Array[int](list(range(100)), data_type=int, policy=ResizePolicy(shrink_threshold=0))
+        array._resize(1000)
+        array.delete_range(0, 100)
+        assert len(array) == 0
+        assert len(array._items) == 1000
+
+    def test_default_policy_should_shrink_a_sparse_buffer_without_thrashing(self):
+        array = Array[int](list(range(64)), data_type=int)
+        array.delete_range(0, 48)
+        assert len(array._items) == 32
+        array.append(64)
+        assert len(array._items) == 32
+
+    def test_resize_policy_should_reject_settings_that_would_thrash(self):
+        with pytest.raises(ValueError):
+            ResizePolicy(growth_factor=2, shrink_threshold=0.5)
+        with pytest.raises(ValueError):
+            ResizePolicy(growth_factor=1)
+        with pytest.raises(ValueError):
+            ResizePolicy(min_capacity=0)
+
+    def test_slicing_should_return_a_view_sharing_the_buffer(self, setup_numerical_array: Array):
+        view = setup_numerical_array[2:8:2]
+        assert isinstance(view, ArrayView)
+        assert view.shares_memory is True
+        assert list(view) == [2, 4, 6]
+        assert view[-1] == 6
+        assert list(view[1:]) == [4, 6]
+        assert 4 in view and 5 not in view
+        assert view == Array([2, 4, 6])
+
+    def test_views_should_keep_their_items_when_the_array_changes(self, setup_numerical_array: Array):
+        view = setup_numerical_array[0:3]
+        nested = view[1:]
+        setup_numerical_array[1] = 100
+        assert list(view) == [0, 1, 2]
+        assert list(nested) == [1, 2]
+        assert view.shares_memory is False
+        assert setup_numerical_array[1] == 100
+
+    def test_views_should_keep_their_items_when_the_array_reuses_popped_slots(self, setup_numerical_array: Array):
+        view = setup_numerical_array[7:]
+        setup_numerical_array.pop()
+        setup_numerical_array.append(-1)
+        del setup_numerical_array[0]
+        assert list(view) == [7, 8, 9]
+
+    def test_view_copy_should_return_an_independent_array(self, setup_complex_object_array: Array[Car]):
+        copied = setup_complex_object_array[1:].copy()
+        assert isinstance(copied, Array)
+        copied.append(self.car1)
+        assert list(copied) == [self.car2, self.car3, self.car1]
+        assert len(setup_complex_object_array) == 3
+
+    def test_copying_an_array_with_live_views_should_not_copy_the_views(self, setup_numerical_array: Array):
+        view = setup_numerical_array[:2]
+        copied = copy.deepcopy(setup_numerical_array)
+        copied[0] = 50
+        assert list(view) == [0, 1]
+        assert view.shares_memory is True
+
+    def test_numpy_should_read_a_view_without_copying_it(self, setup_numerical_array: Array):
+        items = np.asarray(setup_numerical_array[3:6])
+        assert items.tolist() == [3, 4, 5]
+        assert items.flags.writeable is False
+        assert np.shares_memory(items, setup_numerical_array._items)
+
+    def test_index_count_and_find_all_should_search_numeric_arrays(self):
+        array = Array[int]([3, 1, 3, 2, 3], data_type=int)
+        assert array.index(3) == 0
+        assert array.index(3, 1) == 2
+        assert array.index(3, -2) == 4
+        assert array.count(3) == 3
+        assert list(array.find_all(3)) == [0, 2, 4]
+        assert list(array.find_all(7)) == []
+        assert 2 in array and 2.0 in array and 7 not in array and '2' not in array
+        with pytest.raises(ValueError):
+            array.index(3, 1, 2)
+
+    def test_index_count_and_find_all_should_search_complex_objects(self, setup_complex_object_array: Array[Car]):
+        setup_complex_object_array.append(self.car2)
+        assert setup_complex_object_array.index(self.car2) == 1
+        assert setup_complex_object_array.count(self.car2) == 2
+        assert list(setup_complex_object_array.find_all(self.car2)) == [1, 3]
+        with pytest.raises(ValueError):
+            setup_complex_object_array.index(Car('000', Color.RED, Make.FORD, Model.FUSION))
+
+    def test_views_should_support_the_same_searches(self, setup_numerical_array: Array):
+        view = setup_numerical_array[2:8]
+        assert view.index(5) == 3
+        assert view.count(9) == 0
+        assert list(view.find_all(7)) == [5]
+
+    def test_equality_should_compare_numeric_arrays_and_views_by_value(self, setup_numerical_array: Array):
+        assert setup_numerical_array == Array.from_buffer(np.arange(10))
+        assert setup_numerical_array[:3] == Array([0.0, 1.0, 2.0])
+        assert setup_numerical_array != Array.from_buffer(np.arange(11))
+        assert setup_numerical_array[:2] != Array([0, 2])
@@ -108,4 +108,65 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError, match="must be a sequence of sequences with the same length"):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+    # ✅ Test Tuple Indexing
+    def test_tuple_indexing(self, filled3x3: Array2D[int]) -> None:
+        """Checks that grid[r, c] reads and writes the same cells as grid[r][c]."""
+        assert filled3x3[1, 2] == 6
+        assert filled3x3[-1, -1] == 9
+        filled3x3[0, 1] = 20
+        assert filled3x3[0][1] == 20
+        with pytest.raises(IndexError):
+            _ = filled3x3[3, 0]
+        with pytest.raises(TypeError):
+            filled3x3[0, 0] = "one"
+
+    # ✅ Test Row and Column Views
+    def test_row_and_column_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks that row() and column() are NumPy views sharing the grid's storage."""
+        assert filled3x3.row(1).tolist() == [4, 5, 6]
+        assert filled3x3.column(2).tolist() == [3, 6, 9]
+        filled3x3.column(0)[:] = 0
+        assert [filled3x3[row][0] for row in range(3)] == [0, 0, 0]
+        assert filled3x3.to_numpy().shape == (3, 3)
+
+    # ✅ Test Row Proxies
+    def test_rows_are_cached_and_support_negative_indexes(self, filled3x3: Array2D[int]) -> None:
+        """Checks that the same Row proxy is returned for each row and that rows index like lists."""
+        assert filled3x3[0] is filled3x3[0]
+        assert filled3x3[-1][-1] == 9
+        assert list(reversed(filled3x3[0])) == [3, 2, 1]
+        with pytest.raises(TypeError):
+            filled3x3[0][0] = "one"
+
+    # ✅ Test Fast Constructors
+    def test_zeros_and_full(self) -> None:
+        """Checks that zeros() and full() fill every cell."""
+        zeros = Array2D.zeros(2, 3, data_type=int)
+        assert [list(row) for row in zeros] == [[0, 0, 0], [0, 0, 0]]
+        assert [list(row) for row in Array2D.full(2, 2, 1.5)] == [[1.5, 1.5], [1.5, 1.5]]
+        with pytest.raises(TypeError):
+            Array2D.zeros(2, 2, data_type=str)
+        with pytest.raises(TypeError):
+            Array2D.full(2, 2, "x", data_type=int)
+
+    def test_empty_gives_every_object_cell_its_own_instance(self) -> None:
+        """Checks that empty() calls data_type() once per cell for object types."""
+        grid = Array2D.empty(2, 2, data_type=list)
+        grid[0][0].append(1)
+        assert grid[0][1] == []
+        assert len(grid) == 2 and len(grid[0]) == 2
+
+    def test_from_numpy(self) -> None:
+        """Checks that from_numpy() keeps the shape and optionally shares memory."""
+        import numpy as np
+        items = np.arange(6).reshape(2, 3)
+        grid = Array2D.from_numpy(items)
+        assert [list(row) for row in grid] == [[0, 1, 2], [3, 4, 5]]
+        grid[0, 0] = 9
+        assert items[0, 0] == 0
+        shared = Array2D.from_numpy(items, copy=False)
+        shared[0, 0] = 9
+        assert items[0, 0] == 9
+        with pytest.raises(ValueError):
+            Array2D.from_numpy(np.arange(3))
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from datastructures.asynccircularqueue import AsyncCircularQueue
+
+class TestAsyncCircularQueue:
+
+    def test_put_and_get_in_order(self):
+        async def run() -> list[int]:
+            q = AsyncCircularQueue(maxsize=3, data_type=int)
+            for i in range(3):
+                await q.put(i)
+            return [await q.get() for _ in range(3)]
+
+        assert asyncio.run(run()) == [0, 1, 2]
+
+    def test_put_times_out_when_full(self):
+        async def run() -> None:
+            q = AsyncCircularQueue(maxsize=1, data_type=int)
+            await q.put(1)
+            await q.put(2, timeout=0.01)
+
+        with pytest.raises(IndexError):
+            asyncio.run(run())
+
+    def test_get_times_out_when_empty(self):
+        async def run() -> None:
+            await AsyncCircularQueue(maxsize=1, data_type=int).get(timeout=0.01)
+
+        with pytest.raises(IndexError):
+            asyncio.run(run())
+
+    def test_full_queue_applies_backpressure_to_producers(self):
+        async def run() -> list[int]:
+            q = AsyncCircularQueue(maxsize=2, data_type=int)
+            produced: list[int] = []
+
+            async def produce() -> None:
+                for i in range(5):
+                    await q.put(i)
+                    produced.append(i)
+
+            producer = asyncio.create_task(produce())
+            await asyncio.sleep(0.01)
+            assert produced == [0, 1]
+            received = [await q.get() for _ in range(5)]
+            await producer
+            return received
+
+        assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+
+    def test_many_producers_and_consumers_see_every_item_once(self):
+        async def run() -> list[int]:
+            q = AsyncCircularQueue(maxsize=8, data_type=int)
+            received: list[int] = []
+
+            async def produce(start: int) -> None:
+                for i in range(start, start + 250):
+                    await q.put(i)
+
+            async def consume() -> None:
+                for _ in range(250):
+                    received.append(await q.get())
+
+            await asyncio.gather(*(produce(n * 250) for n in range(4)), *(consume() for _ in range(4)))
+            return received
+
+        assert sorted(asyncio.run(run())) == list(range(1000))
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+from datastructures.blockingcircularqueue import BlockingCircularQueue
+
+class TestBlockingCircularQueue:
+
+    def test_put_and_get_in_order(self):
+        q = BlockingCircularQueue(maxsize=3, data_type=int)
+        for i in range(3):
+            q.put(i)
+        assert [q.get() for _ in range(3)] == [0, 1, 2]
+
+    def test_put_times_out_when_full(self):
+        q = BlockingCircularQueue(maxsize=1, data_type=int)
+        q.put(1)
+        with pytest.raises(IndexError):
+            q.put(2, timeout=0.01)
+        with pytest.raises(IndexError):
+            q.enqueue(2)
+
+    def test_get_times_out_when_empty(self):
+        q = BlockingCircularQueue(maxsize=1, data_type=int)
+        with pytest.raises(IndexError):
+            q.get(timeout=0.01)
+        with pytest.raises(IndexError):
+            q.dequeue()
+
+    def test_put_waits_for_a_consumer(self):
+        q = BlockingCircularQueue(maxsize=1, data_type=int)
+        q.put(1)
+        consumer = threading.Timer(0.05, q.get)
+        consumer.start()
+        q.put(2, timeout=5)
+        consumer.join()
+        assert q.get() == 2
+
+    def test_enqueue_many_wakes_a_waiting_consumer(self):
+        q = BlockingCircularQueue(maxsize=4, data_type=int)
+        producer = threading.Timer(0.05, q.enqueue_many, args=([1, 2],))
+        producer.start()
+        assert q.get(timeout=5) == 1
+        producer.join()
+        assert q.get(timeout=0) == 2
+
+    def test_dequeue_many_wakes_a_waiting_producer(self):
+        q = BlockingCircularQueue(maxsize=2, data_type=int)
+        q.enqueue_many([1, 2])
+        consumer = threading.Timer(0.05, q.dequeue_many, args=(2,))
+        consumer.start()
+        q.put(3, timeout=5)
+        consumer.join()
+        assert q.get(timeout=0) == 3
+
+    def test_many_producers_and_consumers_see_every_item_once(self):
+        q = BlockingCircularQueue(maxsize=8, data_type=int)
+        producers, consumers, per_producer = 4, 4, 500
+        received: list[int] = []
+        received_lock = threading.Lock()
+
+        def produce(start: int) -> None:
+            for i in range(start, start + per_producer):
+                q.put(i, timeout=5)
+
+        def consume() -> None:
+            for _ in range(producers * per_producer // consumers):
+                item = q.get(timeout=5)
+                with received_lock:
+                    received.append(item)
+
+        threads = [threading.Thread(target=produce, args=(n * per_producer,)) for n in range(producers)]
+        threads += [threading.Thread(target=consume) for _ in range(consumers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(received) == list(range(producers * per_producer))
+        assert q.empty is True
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from datastructures.circularqueue import CircularQueue
 
@@ -97,4 +98,76 @@ class TestCircularQueue:
             q2.enqueue(i)
         q1.dequeue()
         q1.enqueue(5)
-        assert q1 != q2
\ No newline at end of file
+        assert q1 != q2
+
+    def test_clear_keeps_data_type(self, small_queue: CircularQueue):
+        small_queue.clear()
+        assert small_queue.empty is True
+        small_queue.enqueue(7)
+        assert small_queue.front == 7
+        with pytest.raises(TypeError):
+            small_queue.enqueue("seven")
+
+    def test_growable_queue_doubles_instead_of_raising(self):
+        q = CircularQueue(maxsize=3, data_type=int, growable=True)
+        assert q.maxsize == 3
+        for i in range(10):
+            q.enqueue(i)
+        assert len(q) == 10
+        assert q.maxsize == 15
+        assert [q.dequeue() for _ in range(10)] == list(range(10))
+
+    def test_growable_queue_keeps_order_when_growing_wrapped(self):
+        q = CircularQueue(maxsize=3, data_type=int, growable=True)
+        for i in range(3):
+            q.enqueue(i)
+        q.dequeue()
+        q.dequeue()
+        for i in range(3, 8):
+            q.enqueue(i)
+        assert [q.dequeue() for _ in range(len(q))] == list(range(2, 8))
+
+    def test_enqueue_many_and_dequeue_many_wrap_around(self, empty_queue: CircularQueue):
+        empty_queue.enqueue_many([1, 2, 3, 4])
+        assert list(empty_queue.dequeue_many(3)) == [1, 2, 3]
+        empty_queue.enqueue_many(range(5, 9))
+        assert empty_queue.full is True
+        assert list(empty_queue.dequeue_many(10)) == [4, 5, 6, 7, 8]
+        assert empty_queue.empty is True
+
+    def test_enqueue_many_on_fixed_queue_is_all_or_nothing(self, small_queue: CircularQueue):
+        with pytest.raises(IndexError):
+            small_queue.enqueue_many([4, 5, 6])
+        assert len(small_queue) == 3
+
+    def test_enqueue_many_grows_growable_queue(self):
+        q = CircularQueue(maxsize=1, data_type=int, growable=True)
+        q.enqueue_many(range(100))
+        assert len(q) == 100
+        assert list(q.dequeue_many(100)) == list(range(100))
+
+    def test_enqueue_many_with_objects_checks_types(self):
+        q = CircularQueue(maxsize=4, data_type=str)
+        with pytest.raises(TypeError):
+            q.enqueue_many(["a", 1])
+        assert q.empty is True
+
+    def test_enqueue_many_with_numbers_checks_types(self):
+        q = CircularQueue(maxsize=4, data_type=int)
+        with pytest.raises(TypeError):
+            q.enqueue_many([1.7, 2.9])
+        with pytest.raises(TypeError):
+            q.enqueue_many(['x'])
+        with pytest.raises(TypeError):
+            q.enqueue_many(x / 2 for x in range(3))
+        assert q.empty is True
+        q.enqueue_many([])
+        q.enqueue_many(np.array([1, 2], dtype=np.int32))
+        assert list(q.dequeue_many(2)) == [1, 2]
+
+    def test_dequeue_many_rejects_a_negative_count(self):
+        q = CircularQueue(maxsize=4, data_type=int)
+        q.enqueue_many([1, 2])
+        with pytest.raises(ValueError):
+            q.dequeue_many(-1)
+        assert len(q) == 2
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+
+import gc
+import weakref
+
+import pytest
+
+from datastructures.hashengine import HashStrategy, auto_hash, cached_hash, digest_hash, hash_function_for, make_cached_hash
+from datastructures.hashmap import HashMap
+from tests.car import Car, Color, Make, Model
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+    y: int
+
+
+class Label:
+    ''' An unhashable key: it defines __eq__ without __hash__. '''
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Label) and self.text == other.text
+
+
+class TestHashEngine:
+
+    def test_auto_hash_should_use_the_builtin_hash_for_hashable_keys(self):
+        assert auto_hash('key') == hash('key')
+        assert auto_hash((1, 2)) == hash((1, 2))
+
+    def test_auto_hash_should_fall_back_to_the_digest_for_unhashable_keys(self):
+        assert auto_hash([1, 2]) == digest_hash([1, 2])
+
+    def test_digest_hash_should_be_consistent_for_equal_keys(self):
+        assert digest_hash({'a': 1}) == digest_hash({'a': 1})
+
+    def test_cached_hash_should_remember_the_hash_on_the_key(self):
+        point = Point(1, 2)
+        assert cached_hash(point) == hash(point)
+        object.__setattr__(point, 'x', 5)
+        assert cached_hash(point) == hash(Point(1, 2))
+
+    def test_keys_used_with_cached_should_still_be_found_with_digest_and_auto(self):
+        cars = [Car(str(i), Color.RED, Make.FORD, Model.FOCUS) for i in range(50)]
+        labels = [Label(str(i)) for i in range(50)]
+        digest_map = HashMap[Car, int](hash_strategy=HashStrategy.DIGEST)
+        auto_map = HashMap[Label, int](hash_strategy=HashStrategy.AUTO)
+        for i, (car, label) in enumerate(zip(cars, labels)):
+            digest_map[car] = i
+            auto_map[label] = i
+        states = [(dict(car.__dict__), dict(label.__dict__)) for car, label in zip(cars, labels)]
+        cached_map = HashMap[object, int](hash_strategy=HashStrategy.CACHED)
+        for i, (car, label) in enumerate(zip(cars, labels)):
+            cached_map[car] = i
+            cached_map[label] = i
+        for i, (car, label) in enumerate(zip(cars, labels)):
+            assert cached_map[car] == i and cached_map[label] == i
+            assert digest_map[car] == i
+            assert label in auto_map
+        assert [(car.__dict__, label.__dict__) for car, label in zip(cars, labels)] == states
+
+    def test_cached_hash_should_not_keep_keys_alive(self):
+        hash_function = make_cached_hash()
+        point = Point(1, 2)
+        reference = weakref.ref(point)
+        hash_function(point)
+        del point
+        gc.collect()
+        assert reference() is None
+
+    def test_each_cached_map_should_get_its_own_table(self):
+        assert hash_function_for(HashStrategy.CACHED) is not hash_function_for(HashStrategy.CACHED)
+
+    def test_cached_hash_should_hash_keys_without_an_instance_dictionary(self):
+        assert cached_hash(42) == hash(42)
+
+    def test_hash_function_for_should_accept_strategy_names(self):
+        assert hash_function_for('digest') is digest_hash
+        assert hash_function_for(HashStrategy.AUTO) is auto_hash
+        with pytest.raises(ValueError):
+            hash_function_for('unknown')
+
+    @pytest.mark.parametrize('strategy', list(HashStrategy))
+    def test_hashmap_should_work_with_every_strategy(self, strategy: HashStrategy):
+        hashmap = HashMap[Car, int](hash_strategy=strategy)
+        cars = [Car(str(i), Color.RED, Make.FORD, Model.FOCUS) for i in range(20)]
+        for i, car in enumerate(cars):
+            hashmap[car] = i
+        for i, car in enumerate(cars):
+            assert hashmap[car] == i
+        assert Car('19', Color.RED, Make.FORD, Model.FOCUS) in hashmap
+
+    def test_hashmap_should_use_a_custom_hash_function(self):
+        calls: list[int] = []
+        def custom_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = HashMap[int, str](custom_hash_function=custom_hash)
+        hashmap[3] = 'three'
+        assert hashmap[3] == 'three'
+        assert calls == [3, 3]
@@ -1,15 +1,20 @@
 from datastructures.hashmap import HashMap
+from datastructures.openhashmap import OpenHashMap
 import pytest
 
 class TestHashMap:
 
+    @pytest.fixture(params=[HashMap, OpenHashMap])
+    def hashmap_type(self, request: pytest.FixtureRequest) -> type:
+        return request.param
+
     @pytest.fixture
-    def empty_hashmap(self) -> HashMap[int, str]:
-        return HashMap[int, str]()
+    def empty_hashmap(self, hashmap_type: type) -> HashMap[int, str]:
+        return hashmap_type()
 
     @pytest.fixture
-    def populated_hashmap(self) -> HashMap[int, str]:
-        hashmap = HashMap[int, str]()
+    def populated_hashmap(self, hashmap_type: type) -> HashMap[int, str]:
+        hashmap = hashmap_type()
         for i in range(10):
             hashmap[i] = str(i)
         return hashmap
@@ -52,3 +57,136 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_inserting_past_the_load_factor_should_grow_the_bucket_array(self, empty_hashmap: HashMap[int, str]):
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+        assert empty_hashmap.capacity > 7
+        assert empty_hashmap.rehash_count > 0
+        assert empty_hashmap.load_factor <= 0.75
+
+    def test_items_should_stay_reachable_while_a_rehash_is_in_progress(self):
+        empty_hashmap = HashMap[int, str]()
+        for i in range(6):
+            empty_hashmap[i] = str(i)
+        assert empty_hashmap._old_buckets is not None
+        assert sorted(empty_hashmap.keys()) == list(range(6))
+        for i in range(6):
+            assert empty_hashmap[i] == str(i)
+
+    def test_looking_up_keys_while_iterating_mid_rehash_should_visit_each_key_once(self):
+        hashmap = HashMap[int, str]()
+        for i in range(6):
+            hashmap[i] = str(i)
+        assert hashmap._old_buckets is not None
+        visited = []
+        for key in hashmap:
+            assert hashmap[key] == str(key)
+            visited.append(key)
+        assert sorted(visited) == list(range(6))
+
+    def test_a_map_mid_rehash_should_equal_itself(self):
+        hashmap = HashMap[int, str]()
+        for i in range(6):
+            hashmap[i] = str(i)
+        assert hashmap._old_buckets is not None
+        assert hashmap == hashmap
+
+    def test_deleting_items_should_shrink_the_bucket_array_when_enabled(self):
+        hashmap = HashMap[int, str](shrink=True)
+        for i in range(1000):
+            hashmap[i] = str(i)
+        grown_capacity = hashmap.capacity
+        for i in range(990):
+            del hashmap[i]
+        assert hashmap.capacity < grown_capacity
+        assert sorted(hashmap) == list(range(990, 1000))
+
+    def test_maps_with_the_same_items_should_be_equal_regardless_of_capacity(self, populated_hashmap: HashMap[int, str]):
+        other = type(populated_hashmap)(101)
+        for i in reversed(range(10)):
+            other[i] = str(i)
+        assert populated_hashmap == other
+        other[0] = 'zero'
+        assert populated_hashmap != other
+
+    def test_deleted_slots_should_not_hide_keys_further_along_the_probe_path(self):
+        hashmap = OpenHashMap[int, str](custom_hash_function=lambda key: 0)
+        for i in range(5):
+            hashmap[i] = str(i)
+        del hashmap[1]
+        del hashmap[2]
+        assert hashmap[4] == '4'
+        hashmap[2] = 'two'
+        assert sorted(hashmap.items()) == [(0, '0'), (2, 'two'), (3, '3'), (4, '4')]
+
+    def test_churn_should_clear_tombstones_without_growing(self):
+        hashmap = OpenHashMap[int, int]()
+        for i in range(10_000):
+            hashmap[i] = i
+            del hashmap[i]
+        assert len(hashmap) == 0
+        assert hashmap.capacity == 8
+
+    def test_get_many_should_return_values_in_the_order_of_the_keys(self):
+        hashmap = HashMap[int, str]()
+        hashmap.set_many((i, str(i)) for i in range(100))
+        assert hashmap.get_many([5, 99, 0, 5]) == ['5', '99', '0', '5']
+
+    def test_get_many_should_raise_a_key_error_or_use_the_default_for_missing_keys(self):
+        hashmap = HashMap[int, str]()
+        hashmap[1] = 'one'
+        with pytest.raises(KeyError):
+            hashmap.get_many([1, 2])
+        assert hashmap.get_many([1, 2], default=None) == ['one', None]
+
+    def test_set_many_should_update_existing_keys_and_keep_the_last_duplicate(self):
+        hashmap = HashMap[int, str]()
+        hashmap.set_many([(1, 'one'), (2, 'two')])
+        hashmap.set_many([(2, 'TWO'), (3, 'three'), (3, 'THREE')])
+        assert len(hashmap) == 3
+        assert sorted(hashmap.items()) == [(1, 'one'), (2, 'TWO'), (3, 'THREE')]
+
+    def test_set_many_should_grow_the_bucket_array_past_the_load_factor(self):
+        hashmap = HashMap[int, int]()
+        hashmap.set_many((i, i) for i in range(1000))
+        assert hashmap.capacity >= 1000 / 0.75
+        assert hashmap.get_many(range(1000)) == list(range(1000))
+
+    def test_update_should_accept_another_map(self, populated_hashmap: HashMap[int, str]):
+        hashmap = HashMap[int, str]()
+        hashmap.update(populated_hashmap)
+        assert sorted(hashmap.items()) == sorted(populated_hashmap.items())
+
+    def test_delete_many_should_remove_present_keys_and_ignore_missing_ones(self):
+        hashmap = HashMap[int, str]()
+        hashmap.set_many((i, str(i)) for i in range(20))
+        assert hashmap.delete_many([1, 3, 3, 50]) == 2
+        assert len(hashmap) == 18
+        assert 1 not in hashmap and 3 not in hashmap
+
+    def test_updating_an_existing_key_should_not_change_the_length(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap[5] = 'five'
+        populated_hashmap[5] = 'FIVE'
+        assert len(populated_hashmap) == 10
+        assert populated_hashmap[5] == 'FIVE'
+
+    def test_get_should_return_the_value_or_the_default(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.get(5) == '5'
+        assert populated_hashmap.get(99) is None
+        assert populated_hashmap.get(99, 'missing') == 'missing'
+
+    def test_setdefault_should_insert_only_missing_keys(self):
+        hashmap = HashMap[int, str]()
+        assert hashmap.setdefault(1, 'one') == 'one'
+        assert hashmap.setdefault(1, 'uno') == 'one'
+        assert len(hashmap) == 1
+
+    def test_pop_should_remove_the_key_and_return_its_value(self):
+        hashmap = HashMap[int, str]()
+        hashmap[1] = 'one'
+        assert hashmap.pop(1) == 'one'
+        assert 1 not in hashmap and len(hashmap) == 0
+        assert hashmap.pop(1, 'missing') == 'missing'
+        with pytest.raises(KeyError):
+            hashmap.pop(1)
@@ -144,4 +144,59 @@ class TestLinkedList:
         with pytest.raises(ValueError):
             linked_list.insert_after(10, 99)  # Target not in list
         with pytest.raises(ValueError):
-            linked_list.remove(10)  # Item not in list
\ No newline at end of file
+            linked_list.remove(10)  # Item not in list
+    def test_nodes_should_allow_in_place_updates(self, linked_list: LinkedList[int]) -> None:
+        for node in linked_list.nodes():
+            if node.value == 2:
+                linked_list.replace_node_value(node, 20)
+        assert list(linked_list) == [0, 1, 20, 3, 4]
+        with pytest.raises(TypeError):
+            linked_list.replace_node_value(next(linked_list.nodes()), "string")
+
+    def test_remove_node_should_unlink_nodes_while_iterating(self, linked_list: LinkedList[int]) -> None:
+        for node in linked_list.nodes():
+            if node.value % 2 == 0:
+                linked_list.remove_node(node)
+        assert list(linked_list) == [1, 3]
+        assert len(linked_list) == 2
+
+    def test_nodes_should_not_carry_an_instance_dictionary(self, linked_list: LinkedList[int]) -> None:
+        node = next(linked_list.nodes())
+        assert not hasattr(node, '__dict__')
+
+    def test_node_pool_should_reuse_removed_nodes(self) -> None:
+        pooled = LinkedList[int](data_type=int, node_pool_size=1)
+        pooled.append(1)
+        first_node = next(pooled.nodes())
+        pooled.pop()
+        pooled.append(2)
+        assert next(pooled.nodes()) is first_node
+        assert list(pooled) == [2]
+
+    def test_node_pool_should_not_grow_past_its_size(self) -> None:
+        pooled = LinkedList[int](data_type=int, node_pool_size=2)
+        for i in range(5):
+            pooled.append(i)
+        while not pooled.empty:
+            pooled.pop_front()
+        assert pooled._free_node_count == 2
+        for i in range(5):
+            pooled.append(i)
+        assert list(pooled) == [0, 1, 2, 3, 4]
+
+    def test_nested_iteration_should_not_interfere(self, linked_list: LinkedList[int]) -> None:
+        pairs = [(outer, inner) for outer in linked_list for inner in linked_list]
+        assert len(pairs) == 25
+        assert pairs[-1] == (4, 4)
+
+    def test_reversed_should_walk_the_list_lazily(self, linked_list: LinkedList[int]) -> None:
+        backwards = reversed(linked_list)
+        assert next(backwards) == 4
+        assert next(backwards) == 3
+        assert not isinstance(backwards, LinkedList)
+
+    def test_next_on_the_list_should_step_through_the_items(self, linked_list: LinkedList[int]) -> None:
+        assert [next(linked_list) for _ in range(5)] == [0, 1, 2, 3, 4]
+        with pytest.raises(StopIteration):
+            next(linked_list)
+        assert next(linked_list) == 0
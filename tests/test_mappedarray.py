@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pytest
+from datastructures.array import Array
+from datastructures.mappedarray import MappedArray
+
+class TestMappedArray:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / 'array.bin')
+
+    def test_save_and_open_mmap_should_round_trip_the_items(self, path: str):
+        array = Array.from_buffer(np.arange(10, dtype=np.int64))
+        array.pop_front()
+        array.save(path)
+        mapped = Array.open_mmap(path)
+        assert isinstance(mapped, MappedArray)
+        assert list(mapped) == list(range(1, 10))
+        assert mapped == array
+        mapped.close()
+
+    def test_appends_should_grow_the_file_in_chunks_and_survive_reopening(self, path: str):
+        with Array.open_mmap(path, np.float64, 'w+') as mapped:
+            chunk = len(mapped._items)
+            assert os.path.getsize(path) == 256 + chunk * 8
+            for i in range(chunk + 1):
+                mapped.append(float(i))
+            assert len(mapped._items) == 2 * chunk
+            mapped.append_front(-1.0)
+        reopened = Array.open_mmap(path, np.float64)
+        assert len(reopened) == chunk + 2
+        assert reopened[0] == -1.0
+        assert reopened[-1] == float(chunk)
+        reopened.close()
+
+    def test_changes_should_be_written_through_to_the_file(self, path: str):
+        Array.from_buffer(np.zeros(5)).save(path)
+        with Array.open_mmap(path) as mapped:
+            mapped[2] = 7.5
+            del mapped[0]
+        with Array.open_mmap(path, mode='r') as mapped:
+            assert list(mapped) == [0.0, 7.5, 0.0, 0.0]
+
+    def test_read_only_arrays_should_refuse_writes(self, path: str):
+        Array.from_buffer(np.arange(3)).save(path)
+        with Array.open_mmap(path, mode='r') as mapped:
+            with pytest.raises(ValueError):
+                mapped[0] = 5
+            with pytest.raises(ValueError):
+                for i in range(10):
+                    mapped.append(i)
+
+    def test_compact_should_shrink_the_file(self, path: str):
+        with Array.open_mmap(path, np.int32, 'w+') as mapped:
+            for i in range(100):
+                mapped.append(i)
+            view = mapped[:3]
+            mapped.delete_range(0, 90)
+            mapped.compact()
+            assert list(view) == [0, 1, 2]
+        assert os.path.getsize(path) == 256 + 10 * 4
+        with Array.open_mmap(path) as mapped:
+            assert list(mapped) == list(range(90, 100))
+
+    def test_emptying_the_array_should_not_truncate_the_file(self, path: str):
+        with Array.open_mmap(path, np.int32, 'w+') as mapped:
+            for i in range(100):
+                mapped.append(i)
+            size = os.path.getsize(path)
+            mapped.delete_range(0, 100)
+            assert len(mapped) == 0
+        assert os.path.getsize(path) == size
+
+    def test_copies_should_be_in_memory_arrays(self, path: str):
+        Array.from_buffer(np.arange(3)).save(path)
+        with Array.open_mmap(path) as mapped:
+            copied = mapped.copy()
+            assert type(copied) is Array
+            copied.append(3)
+            assert len(mapped) == 3
+
+    def test_opening_with_the_wrong_type_or_file_should_raise(self, path: str):
+        Array.from_buffer(np.arange(3)).save(path)
+        with pytest.raises(TypeError):
+            Array.open_mmap(path, np.float32)
+        with open(path, 'wb') as file:
+            file.write(b'not an array')
+        with pytest.raises(ValueError):
+            Array.open_mmap(path)
+        with pytest.raises(TypeError):
+            Array([object()]).save(path)
+
+    def test_numpy_types_should_map_to_python_item_types(self, path: str):
+        with Array.open_mmap(path, np.float32, 'w+') as mapped:
+            mapped.append(1.5)
+            mapped[0] = 2.5
+            assert mapped[0] == 2.5
+            assert mapped._items.dtype == np.float32
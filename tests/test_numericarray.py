@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from datastructures.array import Array
+from datastructures.numericarray import FloatArray, IntArray, NumericArray
+
+class TestNumericArray:
+
+    @pytest.fixture
+    def int_array(self) -> IntArray:
+        return IntArray([5, 3, 8, 1, 3])
+
+    @pytest.fixture
+    def float_array(self) -> FloatArray:
+        return FloatArray([0.5, 1.5, 2.0])
+
+    def test_constructing_with_the_wrong_kind_of_number_should_raise_a_type_error(self):
+        with pytest.raises(TypeError):
+            IntArray([1, 2.5])
+        with pytest.raises(TypeError):
+            IntArray(np.array([1.5]))
+        with pytest.raises(TypeError):
+            NumericArray(['a'], data_type=str)
+        with pytest.raises(TypeError):
+            FloatArray([1.0], data_type=int)
+
+    def test_float_arrays_should_accept_ints_and_numpy_scalars(self, float_array: FloatArray, int_array: IntArray):
+        float_array[0] = 3
+        float_array[1] = np.float32(4)
+        int_array[0] = int_array[1]
+        assert list(float_array) == [3.0, 4.0, 2.0]
+        assert int_array[0] == 3
+        with pytest.raises(TypeError):
+            int_array[0] = 1.5
+
+    def test_reductions_should_return_python_numbers(self, int_array: IntArray):
+        assert int_array.sum() == 20 and type(int_array.sum()) is int
+        assert int_array.min() == 1
+        assert int_array.max() == 8
+        assert int_array.mean() == 4.0
+
+    def test_reductions_should_only_see_the_live_items(self, int_array: IntArray):
+        int_array.pop()
+        int_array.pop_front()
+        assert int_array.sum() == 12
+        assert int_array.max() == 8
+
+    def test_reductions_of_an_empty_array(self):
+        array = IntArray([])
+        assert array.sum() == 0
+        with pytest.raises(ValueError):
+            array.min()
+        with pytest.raises(ValueError):
+            array.mean()
+
+    def test_sorting(self, int_array: IntArray):
+        order = int_array.argsort()
+        assert isinstance(order, IntArray)
+        assert list(order) == [3, 1, 4, 0, 2]
+        assert list(int_array[order]) == [1, 3, 3, 5, 8]
+        int_array.sort(reverse=True)
+        assert list(int_array) == [8, 5, 3, 3, 1]
+
+    def test_sorting_should_not_change_earlier_slices(self, int_array: IntArray):
+        view = int_array[:2]
+        int_array.sort()
+        assert list(view) == [5, 3]
+
+    def test_cumsum(self, int_array: IntArray):
+        assert list(int_array.cumsum()) == [5, 8, 16, 17, 20]
+
+    def test_elementwise_arithmetic_should_return_arrays_of_the_resulting_type(self, int_array: IntArray, float_array: FloatArray):
+        assert list(int_array + 1) == [6, 4, 9, 2, 4]
+        assert list(10 - int_array) == [5, 7, 2, 9, 7]
+        halves = int_array / 2
+        assert isinstance(halves, FloatArray)
+        assert list(halves) == [2.5, 1.5, 4.0, 0.5, 1.5]
+        assert list(float_array * float_array) == [0.25, 2.25, 4.0]
+        assert list(-int_array[Array([True, False, False, False, False])]) == [-5]
+        assert list(int_array ** 2 % 10) == [5, 9, 4, 1, 9]
+
+    def test_operands_of_different_lengths_should_raise_a_value_error(self, int_array: IntArray, float_array: FloatArray):
+        with pytest.raises(ValueError):
+            int_array + float_array
+        with pytest.raises(TypeError):
+            int_array + 'a'
+
+    def test_comparisons_should_return_masks_for_selection(self, int_array: IntArray):
+        mask = int_array > 3
+        assert isinstance(mask, NumericArray)
+        assert list(mask) == [True, False, True, False, False]
+        assert list(int_array[mask]) == [5, 8]
+        assert list(int_array[(int_array >= 3) & (int_array < 8)]) == [5, 3, 3]
+        assert list(int_array[int_array.equal(3)]) == [3, 3]
+        assert int_array.not_equal(3).sum() == 3
+        assert list(int_array[~(int_array < 4)]) == [5, 8]
+
+    def test_equality_still_compares_whole_arrays(self, int_array: IntArray):
+        assert int_array == IntArray([5, 3, 8, 1, 3])
+        assert int_array == Array([5, 3, 8, 1, 3])
+        assert int_array != IntArray([5, 3])
+
+    def test_appending_and_slicing_keep_working(self, int_array: IntArray):
+        int_array.append(13)
+        int_array.append_front(0)
+        assert int_array.sum() == 33
+        assert list(int_array[1:3]) == [5, 3]
+        copied = int_array.copy()
+        assert isinstance(copied, IntArray)
+        assert copied.max() == 13
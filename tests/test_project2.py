@@ -0,0 +1,368 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# the Game of Life project imports its modules by file name, like its scripts do
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'projects', 'project2'))
+
+from bitpackedengine import WORD_BITS, BitPackedEngine, pack, unpack
+from gamecontroller import ENGINES, GameController
+from hashlifeengine import ALIVE, DEAD, HashlifeEngine
+from sparseengine import SparseEngine
+from vectorizedengine import VectorizedEngine, neighbor_counts, next_generation
+
+
+def reference_counts(board: np.ndarray, wrap: bool = False) -> np.ndarray:
+    ''' Counts the live neighbors of every cell one cell at a time. '''
+    rows, cols = board.shape
+    counts = np.zeros(board.shape, dtype=int)
+    for x in range(rows):
+        for y in range(cols):
+            for i in (x - 1, x, x + 1):
+                for j in (y - 1, y, y + 1):
+                    if (i, j) == (x, y):
+                        continue
+                    if wrap:
+                        counts[x, y] += board[i % rows, j % cols]
+                    elif 0 <= i < rows and 0 <= j < cols:
+                        counts[x, y] += board[i, j]
+    return counts
+
+
+def reference_step(board: np.ndarray, wrap: bool = False) -> np.ndarray:
+    ''' Advances a board one generation one cell at a time. '''
+    counts = reference_counts(board, wrap)
+    return (counts == 3) | (board & (counts == 2))
+
+
+def random_board(rows: int, cols: int, density: float = 0.35, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).random((rows, cols)) < density
+
+
+def padded(pattern: list[str], rows: int, cols: int, x: int, y: int) -> np.ndarray:
+    ''' Returns a rows x cols board with the pattern ('O' for live cells) at row x, column y. '''
+    board = np.zeros((rows, cols), dtype=bool)
+    cells = np.array([[c == 'O' for c in line] for line in pattern])
+    board[x:x + cells.shape[0], y:y + cells.shape[1]] = cells
+    return board
+
+
+GLIDER = ['.O.', '..O', 'OOO']
+BLINKER = ['OOO']
+
+
+class TestNeighborCounts:
+
+    @pytest.mark.parametrize('wrap', [False, True])
+    def test_neighbor_counts_should_match_counting_one_cell_at_a_time(self, wrap: bool):
+        board = random_board(13, 17)
+        assert np.array_equal(neighbor_counts(board, wrap), reference_counts(board, wrap))
+
+    def test_cells_past_the_edge_should_count_as_dead_on_a_bounded_board(self):
+        board = np.ones((3, 3), dtype=bool)
+        assert neighbor_counts(board).tolist() == [[3, 5, 3], [5, 8, 5], [3, 5, 3]]
+
+    def test_a_toroidal_board_should_count_neighbors_across_the_edges(self):
+        board = np.zeros((4, 4), dtype=bool)
+        board[0, 0] = True
+        counts = neighbor_counts(board, wrap=True)
+        for x, y in [(3, 3), (3, 0), (0, 3), (1, 1), (3, 1), (1, 3)]:
+            assert counts[x, y] == 1
+        assert counts[0, 0] == 0
+        assert counts[2, 2] == 0
+
+    def test_next_generation_should_flip_a_blinker(self):
+        board = padded(BLINKER, 5, 5, 2, 1)
+        flipped = next_generation(board, neighbor_counts(board))
+        assert np.array_equal(flipped, padded(BLINKER, 5, 5, 2, 1).T)
+
+
+class TestVectorizedEngine:
+
+    @pytest.mark.parametrize('wrap', [False, True])
+    def test_steps_should_match_the_reference_step(self, wrap: bool):
+        board = random_board(20, 23, seed=1)
+        engine = VectorizedEngine(board, wrap)
+        for _ in range(10):
+            board = reference_step(board, wrap)
+            engine.step()
+            assert np.array_equal(engine.to_numpy(), board)
+        assert engine.generation == 10
+        assert engine.population == np.count_nonzero(board)
+
+    def test_a_glider_should_wrap_back_to_its_start_on_a_toroidal_board(self):
+        board = padded(GLIDER, 8, 8, 0, 0)
+        engine = VectorizedEngine(board, wrap=True)
+        engine.step(4 * 8)
+        assert np.array_equal(engine.to_numpy(), board)
+
+    def test_boards_must_be_two_dimensional(self):
+        with pytest.raises(ValueError):
+            VectorizedEngine(np.zeros(5, dtype=bool))
+
+    def test_cells_should_round_trip_through_from_cells(self):
+        engine = VectorizedEngine.random(6, 7, seed=2)
+        copied = VectorizedEngine.from_cells(engine.to_cells())
+        assert np.array_equal(copied.to_numpy(), engine.to_numpy())
+
+
+class TestGameController:
+
+    @pytest.mark.parametrize('engine', list(ENGINES))
+    def test_named_engines_should_replace_the_cell_grid(self, engine: str):
+        controller = GameController(16, 16, engine=engine)
+        assert isinstance(controller.engine, ENGINES[engine])
+        assert controller.grid is None
+        assert np.asarray(controller.cell_states()).shape == (16, 16)
+        controller.update_grid()
+        assert controller.engine.generation == 1
+
+    def test_the_default_engine_should_keep_a_grid_of_cells(self):
+        controller = GameController(4, 5)
+        assert controller.engine is None
+        assert len(controller.grid) == 4
+        assert all(len(row) == 5 for row in controller.grid)
+
+    def test_wrapping_should_be_passed_to_the_engine(self):
+        controller = GameController(8, 8, engine='vectorized', wrap=True)
+        assert controller.engine.wrap is True
+
+    def test_an_unknown_engine_should_raise_a_value_error(self):
+        with pytest.raises(ValueError):
+            GameController(4, 4, engine='quantum')
+
+    def test_the_cells_engine_should_refuse_to_wrap(self):
+        with pytest.raises(ValueError):
+            GameController(4, 4, wrap=True)
+
+
+class TestBitPackedEngine:
+
+    @pytest.mark.parametrize('cols', [1, 63, 64, 65, 130])
+    def test_pack_and_unpack_should_round_trip(self, cols: int):
+        board = random_board(5, cols, density=0.5)
+        words = pack(board)
+        assert words.shape == (5, -(-cols // WORD_BITS))
+        assert np.array_equal(unpack(words, cols), board)
+
+    def test_column_64w_plus_i_should_be_bit_i_of_word_w(self):
+        board = np.zeros((1, 130), dtype=bool)
+        board[0, [0, 63, 64, 129]] = True
+        assert pack(board)[0].tolist() == [1 | 1 << 63, 1, 2]
+
+    def test_the_unused_bits_of_the_last_word_should_stay_dead(self):
+        engine = BitPackedEngine(np.ones((6, 70), dtype=bool), wrap=True)
+        assert int(engine.last_word_mask) == (1 << 6) - 1
+        for _ in range(3):
+            engine.step()
+            assert not (engine.words[:, -1] & ~engine.last_word_mask).any()
+
+    @pytest.mark.parametrize('wrap', [False, True])
+    @pytest.mark.parametrize('cols', [64, 70, 130])
+    def test_steps_should_match_the_vectorized_engine(self, wrap: bool, cols: int):
+        board = random_board(9, cols, seed=cols)
+        packed, vectorized = BitPackedEngine(board, wrap), VectorizedEngine(board, wrap)
+        for _ in range(10):
+            packed.step()
+            vectorized.step()
+            assert np.array_equal(packed.to_numpy(), vectorized.to_numpy())
+        assert packed.population == vectorized.population
+
+    @pytest.mark.parametrize('cols', [128, 70])
+    def test_a_glider_should_carry_across_word_boundaries_and_the_wrapped_edge(self, cols: int):
+        board = padded(GLIDER, 8, cols, 2, 60)
+        packed, vectorized = BitPackedEngine(board, wrap=True), VectorizedEngine(board, wrap=True)
+        # a glider moves one row and one column every 4 generations
+        for _ in range(4 * math.lcm(8, cols)):
+            packed.step()
+            vectorized.step()
+            assert np.array_equal(packed.to_numpy(), vectorized.to_numpy())
+        assert np.array_equal(packed.to_numpy(), board)
+
+
+class TestHashlifeEngine:
+
+    @pytest.fixture
+    def soup(self) -> np.ndarray:
+        # a random patch in the middle of a board wide enough that it never reaches the edges
+        board = np.zeros((96, 96), dtype=bool)
+        board[40:56, 40:56] = random_board(16, 16, density=0.4, seed=3)
+        return board
+
+    def test_single_steps_should_match_the_vectorized_engine(self, soup: np.ndarray):
+        hashlife, vectorized = HashlifeEngine(soup), VectorizedEngine(soup)
+        for _ in range(20):
+            hashlife.step()
+            vectorized.step()
+            assert np.array_equal(hashlife.to_numpy(), vectorized.to_numpy())
+
+    @pytest.mark.parametrize('generations', [2, 7, 16, 29])
+    def test_step_n_should_match_n_single_steps(self, soup: np.ndarray, generations: int):
+        jumped, stepped = HashlifeEngine(soup), HashlifeEngine(soup)
+        jumped.step(generations)
+        for _ in range(generations):
+            stepped.step()
+        expected = VectorizedEngine(soup)
+        expected.step(generations)
+        assert np.array_equal(jumped.to_numpy(), stepped.to_numpy())
+        assert np.array_equal(jumped.to_numpy(), expected.to_numpy())
+        assert jumped.generation == generations
+        assert jumped.population == expected.population
+
+    @pytest.mark.parametrize('k', [2, 6, 10])
+    def test_a_glider_should_move_2_to_the_k_over_4_cells_after_step_2_to_the_k(self, k: int):
+        shift = 2 ** k // 4
+        engine = HashlifeEngine(padded(GLIDER, shift + 3, shift + 3, 0, 0))
+        engine.step(2 ** k)
+        assert np.array_equal(engine.to_numpy(), padded(GLIDER, shift + 3, shift + 3, shift, shift))
+        assert engine.population == 5
+
+    def test_the_r_pentomino_should_settle_at_116_cells(self):
+        engine = HashlifeEngine(padded(['.OO', 'OO.', '.O.'], 3, 3, 0, 0))
+        engine.step(1103)
+        assert engine.population == 116
+        engine.step(2 ** 30)
+        assert engine.population == 116
+
+    def test_evicting_from_a_small_cache_should_not_change_the_result(self, soup: np.ndarray):
+        small, large = HashlifeEngine(soup, max_cache_size=200), HashlifeEngine(soup)
+        small.step(25)
+        large.step(25)
+        assert len(small.cache) <= 200
+        assert np.array_equal(small.to_numpy(), large.to_numpy())
+
+    def test_equal_squares_should_be_the_same_node(self):
+        engine = HashlifeEngine(np.zeros((8, 8), dtype=bool))
+        square = engine.cache.join(ALIVE, DEAD, DEAD, ALIVE)
+        assert engine.cache.join(ALIVE, DEAD, DEAD, ALIVE) is square
+        assert square.level == 1
+        assert square.population == 2
+        assert engine.zero(3).population == 0
+
+    def test_wrapping_should_be_refused(self):
+        with pytest.raises(ValueError):
+            HashlifeEngine(np.zeros((8, 8), dtype=bool), wrap=True)
+
+
+class TestSparseEngine:
+
+    @pytest.mark.parametrize('rows, cols, tile_size', [(37, 50, 16), (64, 100, 32), (20, 20, 64), (33, 65, 8)])
+    def test_boards_that_are_not_whole_tiles_should_match_the_vectorized_engine(self, rows: int, cols: int, tile_size: int):
+        board = random_board(rows, cols, seed=rows)
+        sparse, vectorized = SparseEngine(board, tile_size=tile_size), VectorizedEngine(board)
+        for _ in range(30):
+            sparse.step()
+            vectorized.step()
+            assert np.array_equal(sparse.to_numpy(), vectorized.to_numpy())
+        assert sparse.population == vectorized.population
+
+    @pytest.mark.parametrize('rows, cols, tile_size', [(32, 48, 16), (16, 16, 16), (24, 16, 8)])
+    def test_wrapping_boards_should_match_the_vectorized_engine(self, rows: int, cols: int, tile_size: int):
+        board = random_board(rows, cols, seed=cols)
+        sparse, vectorized = SparseEngine(board, wrap=True, tile_size=tile_size), VectorizedEngine(board, wrap=True)
+        for _ in range(30):
+            sparse.step()
+            vectorized.step()
+            assert np.array_equal(sparse.to_numpy(), vectorized.to_numpy())
+
+    def test_a_glider_should_cross_tile_corners_and_the_wrapped_edges(self):
+        board = padded(GLIDER, 32, 32, 5, 5)
+        engine = SparseEngine(board, wrap=True, tile_size=8)
+        engine.step(4 * 32)
+        assert np.array_equal(engine.to_numpy(), board)
+
+    def test_cells_should_die_at_the_edge_of_a_partial_tile(self):
+        # a glider heading for the bottom-right corner of a board 10 cells into its last tiles
+        board = padded(GLIDER, 26, 26, 18, 18)
+        sparse, vectorized = SparseEngine(board, tile_size=16), VectorizedEngine(board)
+        for _ in range(40):
+            sparse.step()
+            vectorized.step()
+            assert np.array_equal(sparse.to_numpy(), vectorized.to_numpy())
+        for tile in sparse.tiles.values():
+            assert not tile[10:, :].any() and not tile[:, 10:].any()
+
+    def test_only_changed_tiles_should_stay_active(self):
+        engine = SparseEngine.from_live_cells(256, 256, [(100, 100), (100, 101), (101, 100), (101, 101)], tile_size=16)
+        engine.step()
+        assert engine.active_tiles == 0
+        engine.step(10)
+        assert engine.population == 4
+        assert len(engine.tiles) == 1
+
+    def test_a_wrapping_board_must_be_whole_tiles(self):
+        with pytest.raises(ValueError):
+            SparseEngine(np.zeros((30, 30), dtype=bool), wrap=True, tile_size=16)
+
+    def test_from_live_cells_should_match_the_board(self):
+        cells = [(0, 0), (5, 70), (99, 99)]
+        engine = SparseEngine.from_live_cells(100, 100, cells)
+        assert sorted(map(tuple, np.argwhere(engine.to_numpy()).tolist())) == cells
+        assert engine.population == 3
+
+    @pytest.mark.parametrize('cell', [(100, 0), (0, 100), (-1, 5)])
+    def test_from_live_cells_should_reject_cells_outside_the_board(self, cell: tuple[int, int]):
+        with pytest.raises(IndexError):
+            SparseEngine.from_live_cells(100, 100, [cell])
+
+
+class TestStagnationDetection:
+
+    def test_a_fresh_controller_should_not_report_stagnation(self):
+        controller = GameController(6, 6, engine='vectorized', board=padded(['OO', 'OO'], 6, 6, 2, 2))
+        assert controller.check_stagnation() is False
+        assert controller.period is None
+
+    @pytest.mark.parametrize('engine', ['cells', 'vectorized', 'bitpacked', 'sparse', 'hashlife'])
+    def test_a_still_life_should_report_period_1(self, engine: str):
+        controller = GameController(6, 6, engine=engine, board=padded(['OO', 'OO'], 6, 6, 2, 2))
+        controller.update_grid()
+        assert controller.check_stagnation() is True
+        assert controller.period == 1
+
+    @pytest.mark.parametrize('engine', ['cells', 'vectorized', 'bitpacked', 'sparse', 'hashlife'])
+    def test_a_blinker_should_report_period_2(self, engine: str):
+        controller = GameController(5, 5, engine=engine, board=padded(BLINKER, 5, 5, 2, 1))
+        controller.update_grid()
+        assert controller.check_stagnation() is False
+        controller.update_grid()
+        assert controller.check_stagnation() is True
+        assert controller.period == 2
+
+    def test_cycles_longer_than_3_should_be_detected_within_the_window(self):
+        # a glider on an 8 x 8 torus comes back to its start after 32 generations
+        board = padded(GLIDER, 8, 8, 0, 0)
+        controller = GameController(8, 8, engine='vectorized', wrap=True, board=board)
+        for _ in range(31):
+            controller.update_grid()
+            assert controller.check_stagnation() is False
+        controller.update_grid()
+        assert controller.period == 32
+
+    def test_cycles_longer_than_the_window_should_not_be_detected(self):
+        controller = GameController(8, 8, engine='vectorized', wrap=True, history=16, board=padded(GLIDER, 8, 8, 0, 0))
+        for _ in range(64):
+            controller.update_grid()
+            assert controller.check_stagnation() is False
+
+    def test_the_window_should_never_hold_more_than_history_fingerprints(self):
+        controller = GameController(30, 30, engine='vectorized', history=5, board=random_board(30, 30, seed=4))
+        for _ in range(50):
+            controller.update_grid()
+            assert len(controller.fingerprint_window) <= 5
+            assert len(controller.fingerprints) <= 5
+
+    def test_a_history_below_one_should_raise_a_value_error(self):
+        with pytest.raises(ValueError):
+            GameController(4, 4, engine='vectorized', history=0)
+
+    def test_a_hashlife_glider_leaving_the_window_should_not_be_a_repeat(self):
+        controller = GameController(8, 8, engine='hashlife', board=padded(GLIDER, 8, 8, 0, 0))
+        for _ in range(60):
+            controller.update_grid()
+            assert controller.check_stagnation() is False
+        assert not controller.cell_states().any()
+        assert controller.engine.population == 5
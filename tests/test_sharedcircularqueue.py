@@ -0,0 +1,95 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+from datastructures.sharedcircularqueue import SharedCircularQueue
+
+@pytest.fixture
+def shared_queue():
+    with SharedCircularQueue(maxsize=5, dtype=np.int64) as q:
+        yield q
+
+def _produce(name: str, count: int) -> None:
+    q = SharedCircularQueue.attach(name)
+    for i in range(count):
+        while q.full:
+            pass
+        q.enqueue(i)
+    q.close()
+
+class TestSharedCircularQueue:
+
+    def test_enqueue_and_dequeue_in_order(self, shared_queue: SharedCircularQueue):
+        for i in range(5):
+            shared_queue.enqueue(i)
+        assert shared_queue.full is True
+        assert len(shared_queue) == 5
+        assert [int(shared_queue.dequeue()) for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert shared_queue.empty is True
+
+    def test_full_and_empty_raise(self, shared_queue: SharedCircularQueue):
+        with pytest.raises(IndexError):
+            shared_queue.dequeue()
+        with pytest.raises(IndexError):
+            shared_queue.front
+        for i in range(5):
+            shared_queue.enqueue(i)
+        with pytest.raises(IndexError):
+            shared_queue.enqueue(5)
+
+    def test_batches_wrap_around(self, shared_queue: SharedCircularQueue):
+        assert shared_queue.enqueue_many(np.arange(4)) == 4
+        assert shared_queue.dequeue_many(3).tolist() == [0, 1, 2]
+        assert shared_queue.enqueue_many(np.arange(4, 10)) == 4
+        first, second = shared_queue.peek_many(10)
+        assert first.tolist() + second.tolist() == [3, 4, 5, 6, 7]
+        shared_queue.advance(2)
+        assert shared_queue.dequeue_many(10).tolist() == [5, 6, 7]
+        with pytest.raises(IndexError):
+            shared_queue.advance(1)
+
+    def test_negative_counts_are_rejected(self, shared_queue: SharedCircularQueue):
+        shared_queue.enqueue_many(np.arange(2))
+        for take in (shared_queue.advance, shared_queue.dequeue_many, shared_queue.peek_many):
+            with pytest.raises(ValueError):
+                take(-1)
+        assert len(shared_queue) == 2
+
+    def test_attach_sees_the_same_ring(self, shared_queue: SharedCircularQueue):
+        other = SharedCircularQueue.attach(shared_queue.name)
+        shared_queue.enqueue(42)
+        assert other.maxsize == 5
+        assert other.dtype == np.int64
+        assert int(other.dequeue()) == 42
+        assert shared_queue.empty is True
+        other.close()
+
+    def test_pickling_attaches(self, shared_queue: SharedCircularQueue):
+        other = pickle.loads(pickle.dumps(shared_queue))
+        other.enqueue(7)
+        assert int(shared_queue.front) == 7
+        other.close()
+
+    def test_structured_dtype(self):
+        dtype = np.dtype([('x', np.float64), ('id', np.int32)])
+        with SharedCircularQueue(maxsize=2, dtype=dtype) as q:
+            q.enqueue((1.5, 3))
+            other = SharedCircularQueue.attach(q.name)
+            item = other.dequeue()
+            assert item['x'] == 1.5 and item['id'] == 3
+            other.close()
+
+    def test_object_dtype_is_rejected(self):
+        with pytest.raises(TypeError):
+            SharedCircularQueue(maxsize=2, dtype=object)
+
+    def test_items_cross_processes(self, shared_queue: SharedCircularQueue):
+        producer = multiprocessing.Process(target=_produce, args=(shared_queue.name, 1_000))
+        producer.start()
+        received = []
+        while len(received) < 1_000:
+            if not shared_queue.empty:
+                received.append(int(shared_queue.dequeue()))
+        producer.join()
+        assert received == list(range(1_000))